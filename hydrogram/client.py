@@ -184,6 +184,12 @@ class Client(Methods):
             Set the maximum amount of concurrent transmissions (uploads & downloads).
             A value that is too high may result in network related issues.
             Defaults to 1.
+
+        max_concurrent_invokes (``int``, *optional*):
+            Set the maximum amount of concurrent raw API calls dispatched by bulk methods
+            (e.g. :meth:`~hydrogram.Client.forward_messages` with many message ids).
+            A value that is too high may exhaust the session and degrade latency.
+            Defaults to 8.
     """
 
     APP_VERSION = f"Hydrogram {__version__}"
@@ -205,6 +211,8 @@ class Client(Methods):
 
     MAX_CONCURRENT_TRANSMISSIONS = 1
 
+    MAX_CONCURRENT_INVOKES = 8
+
     mimetypes = MimeTypes()
     mimetypes.readfp(StringIO(mime_types))
 
@@ -236,6 +244,7 @@ class Client(Methods):
         sleep_threshold: int = Session.SLEEP_THRESHOLD,
         hide_password: bool = False,
         max_concurrent_transmissions: int = MAX_CONCURRENT_TRANSMISSIONS,
+        max_concurrent_invokes: int = MAX_CONCURRENT_INVOKES,
     ):
         super().__init__()
 
@@ -264,6 +273,7 @@ class Client(Methods):
         self.sleep_threshold = sleep_threshold
         self.hide_password = hide_password
         self.max_concurrent_transmissions = max_concurrent_transmissions
+        self.max_concurrent_invokes = max_concurrent_invokes
 
         self.executor = ThreadPoolExecutor(self.workers, thread_name_prefix="Handler")
 
@@ -291,6 +301,7 @@ class Client(Methods):
 
         self.save_file_semaphore = asyncio.Semaphore(self.max_concurrent_transmissions)
         self.get_file_semaphore = asyncio.Semaphore(self.max_concurrent_transmissions)
+        self.bulk_invoke_semaphore = asyncio.Semaphore(self.max_concurrent_invokes)
 
         self.is_connected = None
         self.is_initialized = None
@@ -302,6 +313,7 @@ class Client(Methods):
         self.me: Optional[User] = None
 
         self.message_cache = Cache(10000)
+        self.peer_cache = Cache(1024)
 
         # Sometimes, for some reason, the server will stop sending updates and will only respond to pings.
         # This watchdog will invoke updates.GetState in order to wake up the server and enable it sending updates again
@@ -1091,3 +1103,6 @@ class Cache:
         if len(self.store) > self.capacity:
             for _ in range(self.capacity // 2 + 1):
                 del self.store[next(iter(self.store))]
+
+    def __delitem__(self, key):
+        self.store.pop(key, None)
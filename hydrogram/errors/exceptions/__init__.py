@@ -0,0 +1,26 @@
+# Hydrogram - Telegram MTProto API Client Library for Python
+# Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+# This file is part of Hydrogram.
+#
+# Hydrogram is free software: you can redistribute it and/or modify
+# it under the terms of the GNU Lesser General Public License as published
+# by the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+#
+# Hydrogram is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU Lesser General Public License for more details.
+#
+# You should have received a copy of the GNU Lesser General Public License
+# along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from .see_other_303 import *
+from .service_unavailable_503 import *
+from .not_acceptable_406 import *
+from .forbidden_403 import *
+from .internal_server_error_500 import *
+from .unauthorized_401 import *
+from .flood_420 import *
+from .bad_request_400 import *
@@ -19,6 +19,7 @@
 
 import logging
 import re
+from time import monotonic
 from typing import Union
 
 import hydrogram
@@ -27,6 +28,10 @@ from hydrogram.errors import PeerIdInvalid
 
 log = logging.getLogger(__name__)
 
+# Lifetime (in seconds) of peer_cache entries, so stale access hashes (e.g. a
+# username reassigned mid-session) are refreshed even without a server error.
+PEER_CACHE_TTL = 10 * 60
+
 
 class ResolvePeer:
     async def resolve_peer(
@@ -108,3 +113,28 @@ class ResolvePeer:
                 return await self.storage.get_peer_by_id(peer_id)
             except KeyError:
                 raise PeerIdInvalid
+
+    async def _resolve_peer_cached(
+        self: "hydrogram.Client", peer_id: Union[int, str]
+    ) -> Union[raw.base.InputPeer, raw.base.InputUser, raw.base.InputChannel]:
+        """Resolve a peer id through the in-memory peer cache.
+
+        Repeated resolutions of the same peer (e.g. in bulk forwards) skip the
+        storage/network round-trip entirely. Entries expire after
+        ``PEER_CACHE_TTL`` seconds, so a reassigned username is picked up
+        again even without errors; callers must still invalidate with
+        ``del self.peer_cache[peer_id]`` when the server reports an entry
+        invalid.
+        """
+        entry = self.peer_cache[peer_id]
+
+        if entry is not None:
+            peer, expires_at = entry
+
+            if monotonic() < expires_at:
+                return peer
+
+        peer = await self.resolve_peer(peer_id)
+        self.peer_cache[peer_id] = (peer, monotonic() + PEER_CACHE_TTL)
+
+        return peer
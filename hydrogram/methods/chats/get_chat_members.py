@@ -34,6 +34,7 @@ async def get_chunk(
     filter: "enums.ChatMembersFilter",
     limit: int,
     query: str,
+    user_cache: Optional[dict] = None,
 ):
     is_queryable = filter in {
         enums.ChatMembersFilter.SEARCH,
@@ -55,10 +56,14 @@ async def get_chunk(
     )
 
     members = r.participants
-    users = {u.id: u for u in r.users}
+    # Parse the users once at the response boundary, so each member parse is
+    # a plain dict lookup instead of a nested object reconstruction.
+    users = {u.id: types.User._parse(client, u) for u in r.users}
     chats = {c.id: c for c in r.chats}
 
-    return [types.ChatMember._parse(client, member, users, chats) for member in members]
+    return [
+        types.ChatMember._parse(client, member, users, chats, user_cache) for member in members
+    ]
 
 
 class GetChatMembers:
@@ -124,10 +129,11 @@ class GetChatMembers:
             r = await self.invoke(raw.functions.messages.GetFullChat(chat_id=peer.chat_id))
 
             members = getattr(r.full_chat.participants, "participants", [])
-            users = {i.id: i for i in r.users}
+            users = {i.id: types.User._parse(self, i) for i in r.users}
+            user_cache = {}
 
             for member in members:
-                yield types.ChatMember._parse(self, member, users, {})
+                yield types.ChatMember._parse(self, member, users, {}, user_cache)
 
             return
 
@@ -135,6 +141,7 @@ class GetChatMembers:
         offset = 0
         total = abs(limit) or (1 << 31) - 1
         limit = min(200, total)
+        user_cache = {}
 
         while True:
             members = await get_chunk(
@@ -144,6 +151,7 @@ class GetChatMembers:
                 filter=filter,
                 limit=limit,
                 query=query,
+                user_cache=user_cache,
             )
 
             if not members:
@@ -17,12 +17,25 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
+import os
+import struct
 from collections.abc import Iterable
 from datetime import datetime
 from typing import Optional, Union
 
 import hydrogram
 from hydrogram import raw, types, utils
+from hydrogram.errors import PeerIdInvalid
+
+# The raw update types carrying a newly forwarded message. Checked with
+# `type(i) in ...` (the raw types have no subclasses), which is cheaper than
+# an isinstance call against a tuple for every update.
+_FORWARD_UPDATE_TYPES = frozenset((
+    raw.types.UpdateNewMessage,
+    raw.types.UpdateNewChannelMessage,
+    raw.types.UpdateNewScheduledMessage,
+))
 
 
 class ForwardMessages:
@@ -86,35 +99,56 @@ class ForwardMessages:
         is_iterable = not isinstance(message_ids, int)
         message_ids = list(message_ids) if is_iterable else [message_ids]
 
-        r = await self.invoke(
+        to_peer, from_peer = await asyncio.gather(
+            self._resolve_peer_cached(chat_id), self._resolve_peer_cached(from_chat_id)
+        )
+
+        # A single urandom read gives one random id per message, instead of
+        # one RNG call per id.
+        random_ids = list(struct.unpack(f"<{len(message_ids)}q", os.urandom(8 * len(message_ids))))
+
+        # The server caps the amount of ids accepted by a single
+        # messages.ForwardMessages call, so larger iterables are split into
+        # chunks dispatched concurrently.
+        requests = [
             raw.functions.messages.ForwardMessages(
-                to_peer=await self.resolve_peer(chat_id),
-                from_peer=await self.resolve_peer(from_chat_id),
-                id=message_ids,
+                to_peer=to_peer,
+                from_peer=from_peer,
+                id=message_ids[i : i + 100],
                 top_msg_id=message_thread_id,
                 silent=disable_notification or None,
-                random_id=[self.rnd_id() for _ in message_ids],
+                random_id=random_ids[i : i + 100],
                 schedule_date=utils.datetime_to_timestamp(schedule_date),
                 noforwards=protect_content,
             )
-        )
+            for i in range(0, len(message_ids), 100)
+        ]
 
-        forwarded_messages = []
-
-        users = {i.id: i for i in r.users}
-        chats = {i.id: i for i in r.chats}
-
-        forwarded_messages: list = [
-            await types.Message._parse(client=self, message=i.message, users=users, chats=chats)
-            for i in r.updates
-            if isinstance(
-                i,
-                (
-                    raw.types.UpdateNewMessage,
-                    raw.types.UpdateNewChannelMessage,
-                    raw.types.UpdateNewScheduledMessage,
-                ),
+        async def invoke_chunk(request):
+            # Bound the concurrency so large batches can't exhaust the session.
+            async with self.bulk_invoke_semaphore:
+                return await self.invoke(request)
+
+        try:
+            results = await asyncio.gather(*(invoke_chunk(request) for request in requests))
+        except PeerIdInvalid:
+            del self.peer_cache[chat_id]
+            del self.peer_cache[from_chat_id]
+            raise
+
+        updates = [i for r in results for i in r.updates if type(i) in _FORWARD_UPDATE_TYPES]
+
+        # Only build the lookup dicts when there is something to parse.
+        users = {i.id: i for r in results for i in r.users} if updates else {}
+        chats = {i.id: i for r in results for i in r.chats} if updates else {}
+
+        # Message parsing can hit the network (media, replied messages), so
+        # overlap the per-update coroutines. gather preserves order.
+        forwarded_messages = await asyncio.gather(
+            *(
+                types.Message._parse(client=self, message=i.message, users=users, chats=chats)
+                for i in updates
             )
-        ]
+        )
 
         return types.List(forwarded_messages) if is_iterable else forwarded_messages[0]
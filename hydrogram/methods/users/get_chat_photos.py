@@ -17,11 +17,13 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+import asyncio
 from collections.abc import AsyncGenerator
 from typing import Optional, Union
 
 import hydrogram
 from hydrogram import raw, types, utils
+from hydrogram.errors import PeerIdInvalid
 
 
 class GetChatPhotos:
@@ -53,69 +55,137 @@ class GetChatPhotos:
                 async for photo in app.get_chat_photos("me"):
                     print(photo)
         """
-        peer_id = await self.resolve_peer(chat_id)
+        peer_id = await self._resolve_peer_cached(chat_id)
 
         if isinstance(peer_id, raw.types.InputPeerChannel):
-            r = await self.invoke(raw.functions.channels.GetFullChannel(channel=peer_id))
+            try:
+                r = await self.invoke(raw.functions.channels.GetFullChannel(channel=peer_id))
+            except PeerIdInvalid:
+                del self.peer_cache[chat_id]
+                raise
 
             current = types.Photo._parse(self, r.full_chat.chat_photo) or []
 
-            r = await utils.parse_messages(
-                self,
-                await self.invoke(
-                    raw.functions.messages.Search(
-                        peer=peer_id,
-                        q="",
-                        filter=raw.types.InputMessagesFilterChatPhotos(),
-                        min_date=0,
-                        max_date=0,
-                        offset_id=0,
-                        add_offset=0,
-                        limit=limit,
-                        max_id=0,
-                        min_id=0,
-                        hash=0,
+            fetched = 0
+            offset = 0
+            search_limit = min(limit, 100) if limit else 100
+
+            while True:
+                try:
+                    r = await utils.parse_messages(
+                        self,
+                        await self.invoke(
+                            raw.functions.messages.Search(
+                                peer=peer_id,
+                                q="",
+                                filter=raw.types.InputMessagesFilterChatPhotos(),
+                                min_date=0,
+                                max_date=0,
+                                offset_id=0,
+                                add_offset=offset,
+                                limit=search_limit,
+                                max_id=0,
+                                min_id=0,
+                                hash=0,
+                            )
+                        ),
                     )
-                ),
-            )
+                except PeerIdInvalid:
+                    del self.peer_cache[chat_id]
+                    raise
 
-            if extra := [message.new_chat_photo for message in r]:
-                if current:
-                    photos = ([current, *extra]) if current.file_id != extra[0].file_id else extra
-                else:
+                extra = [message.new_chat_photo for message in r]
+
+                # The generator may stay suspended at a yield for a long time;
+                # don't keep the raw page alive in the frame meanwhile.
+                r = None
+
+                if offset:
                     photos = extra
-            else:
-                photos = [current] if current else []
+                elif extra:
+                    photos = (
+                        ([current, *extra])
+                        if current and current.file_id != extra[0].file_id
+                        else extra
+                    )
+                else:
+                    photos = [current] if current else []
+
+                offset += len(extra)
+
+                for photo in photos:
+                    yield photo
 
-            for current, photo in enumerate(photos, start=1):
-                yield photo
+                    fetched += 1
 
-                if current >= limit:
+                    if limit and fetched >= limit:
+                        return
+
+                if len(extra) < search_limit:
                     return
         else:
             current = 0
-            total = limit or (1 << 31)
-            limit = min(100, total)
             offset = 0
-
-            while True:
-                r = await self.invoke(
-                    raw.functions.photos.GetUserPhotos(
-                        user_id=peer_id, offset=offset, max_id=0, limit=limit
+            page_limit = min(limit, 100) if limit else 100
+
+            async def invoke_page(offset: int):
+                # Bound the concurrency so many concurrent iterations can't
+                # exhaust the session.
+                async with self.bulk_invoke_semaphore:
+                    return await self.invoke(
+                        raw.functions.photos.GetUserPhotos(
+                            user_id=peer_id, offset=offset, max_id=0, limit=page_limit
+                        )
                     )
-                )
-
-                photos = [types.Photo._parse(self, photo) for photo in r.photos]
 
-                if not photos:
-                    return
+            next_task = asyncio.create_task(invoke_page(offset))
 
-                offset += len(photos)
+            try:
+                while True:
+                    try:
+                        r = await next_task
+                    except PeerIdInvalid:
+                        del self.peer_cache[chat_id]
+                        raise
 
-                for photo in photos:
-                    yield photo
+                    photos = [types.Photo._parse(self, photo) for photo in r.photos]
 
-                    current += 1
+                    # See the channel branch: don't hold the raw response
+                    # while suspended at a yield.
+                    r = None
 
-                    if current >= total:
+                    if not photos:
                         return
+
+                    offset += len(photos)
+
+                    # Prefetch the next page while the consumer is busy with
+                    # the current one, hiding the round-trip latency.
+                    next_task = (
+                        asyncio.create_task(invoke_page(offset))
+                        if not limit or current + len(photos) < limit
+                        else None
+                    )
+
+                    # Separate loops so the unbounded case doesn't pay for a
+                    # limit comparison on every yielded photo.
+                    if limit:
+                        for photo in photos:
+                            yield photo
+
+                            current += 1
+
+                            if current >= limit:
+                                return
+                    else:
+                        for photo in photos:
+                            yield photo
+            finally:
+                if next_task is not None:
+                    next_task.cancel()
+
+                    # If the prefetch already failed, retrieve its exception
+                    # so an early break doesn't make asyncio log
+                    # "Task exception was never retrieved" at GC.
+                    if next_task.done() and not next_task.cancelled():
+                        next_task.exception()
@@ -0,0 +1,1857 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+layer = 170
+
+objects = {
+    0x05162463: "hydrogram.raw.types.ResPQ",
+    0x83c95aec: "hydrogram.raw.types.PQInnerData",
+    0xa9f55f95: "hydrogram.raw.types.PQInnerDataDc",
+    0x3c6a84d4: "hydrogram.raw.types.PQInnerDataTemp",
+    0x56fddf88: "hydrogram.raw.types.PQInnerDataTempDc",
+    0x75a3f765: "hydrogram.raw.types.BindAuthKeyInner",
+    0x79cb045d: "hydrogram.raw.types.ServerDHParamsFail",
+    0xd0e8075c: "hydrogram.raw.types.ServerDHParamsOk",
+    0xb5890dba: "hydrogram.raw.types.ServerDHInnerData",
+    0x6643b654: "hydrogram.raw.types.ClientDHInnerData",
+    0x3bcbf734: "hydrogram.raw.types.DhGenOk",
+    0x46dc1fb9: "hydrogram.raw.types.DhGenRetry",
+    0xa69dae02: "hydrogram.raw.types.DhGenFail",
+    0xf660e1d4: "hydrogram.raw.types.DestroyAuthKeyOk",
+    0x0a9f2259: "hydrogram.raw.types.DestroyAuthKeyNone",
+    0xea109b13: "hydrogram.raw.types.DestroyAuthKeyFail",
+    0x60469778: "hydrogram.raw.functions.ReqPq",
+    0xbe7e8ef1: "hydrogram.raw.functions.ReqPqMulti",
+    0xd712e4be: "hydrogram.raw.functions.ReqDHParams",
+    0xf5045f1f: "hydrogram.raw.functions.SetClientDHParams",
+    0xd1435160: "hydrogram.raw.functions.DestroyAuthKey",
+    0x62d6b459: "hydrogram.raw.types.MsgsAck",
+    0xa7eff811: "hydrogram.raw.types.BadMsgNotification",
+    0xedab447b: "hydrogram.raw.types.BadServerSalt",
+    0xda69fb52: "hydrogram.raw.types.MsgsStateReq",
+    0x04deb57d: "hydrogram.raw.types.MsgsStateInfo",
+    0x8cc0d131: "hydrogram.raw.types.MsgsAllInfo",
+    0x276d3ec6: "hydrogram.raw.types.MsgDetailedInfo",
+    0x809db6df: "hydrogram.raw.types.MsgNewDetailedInfo",
+    0x7d861a08: "hydrogram.raw.types.MsgResendReq",
+    0x8610baeb: "hydrogram.raw.types.MsgResendAnsReq",
+    0xf35c6d01: "hydrogram.raw.types.RpcResult",
+    0x2144ca19: "hydrogram.raw.types.RpcError",
+    0x5e2ad36e: "hydrogram.raw.types.RpcAnswerUnknown",
+    0xcd78e586: "hydrogram.raw.types.RpcAnswerDroppedRunning",
+    0xa43ad8b7: "hydrogram.raw.types.RpcAnswerDropped",
+    0x347773c5: "hydrogram.raw.types.Pong",
+    0xe22045fc: "hydrogram.raw.types.DestroySessionOk",
+    0x62d350c9: "hydrogram.raw.types.DestroySessionNone",
+    0x9ec20908: "hydrogram.raw.types.NewSessionCreated",
+    0x9299359f: "hydrogram.raw.types.HttpWait",
+    0xd433ad73: "hydrogram.raw.types.IpPort",
+    0x37982646: "hydrogram.raw.types.IpPortSecret",
+    0x4679b65f: "hydrogram.raw.types.AccessPointRule",
+    0x5a592a6c: "hydrogram.raw.types.help.ConfigSimple",
+    0x58e4a740: "hydrogram.raw.functions.RpcDropAnswer",
+    0xb921bd04: "hydrogram.raw.functions.GetFutureSalts",
+    0x7abe77ec: "hydrogram.raw.functions.Ping",
+    0xf3427b8c: "hydrogram.raw.functions.PingDelayDisconnect",
+    0xe7512126: "hydrogram.raw.functions.DestroySession",
+    0x9a5f6e95: "hydrogram.raw.functions.contest.SaveDeveloperInfo",
+    0x7f3b18ea: "hydrogram.raw.types.InputPeerEmpty",
+    0x7da07ec9: "hydrogram.raw.types.InputPeerSelf",
+    0x35a95cb9: "hydrogram.raw.types.InputPeerChat",
+    0xdde8a54c: "hydrogram.raw.types.InputPeerUser",
+    0x27bcbbfc: "hydrogram.raw.types.InputPeerChannel",
+    0xa87b0a1c: "hydrogram.raw.types.InputPeerUserFromMessage",
+    0xbd2a0840: "hydrogram.raw.types.InputPeerChannelFromMessage",
+    0xb98886cf: "hydrogram.raw.types.InputUserEmpty",
+    0xf7c1b13f: "hydrogram.raw.types.InputUserSelf",
+    0xf21158c6: "hydrogram.raw.types.InputUser",
+    0x1da448e2: "hydrogram.raw.types.InputUserFromMessage",
+    0xf392b7f4: "hydrogram.raw.types.InputPhoneContact",
+    0xf52ff27f: "hydrogram.raw.types.InputFile",
+    0xfa4f0bb5: "hydrogram.raw.types.InputFileBig",
+    0x9664f57f: "hydrogram.raw.types.InputMediaEmpty",
+    0x1e287d04: "hydrogram.raw.types.InputMediaUploadedPhoto",
+    0xb3ba0635: "hydrogram.raw.types.InputMediaPhoto",
+    0xf9c44144: "hydrogram.raw.types.InputMediaGeoPoint",
+    0xf8ab7dfb: "hydrogram.raw.types.InputMediaContact",
+    0x5b38c6c1: "hydrogram.raw.types.InputMediaUploadedDocument",
+    0x33473058: "hydrogram.raw.types.InputMediaDocument",
+    0xc13d1c11: "hydrogram.raw.types.InputMediaVenue",
+    0xe5bbfe1a: "hydrogram.raw.types.InputMediaPhotoExternal",
+    0xfb52dc99: "hydrogram.raw.types.InputMediaDocumentExternal",
+    0xd33f43f3: "hydrogram.raw.types.InputMediaGame",
+    0x8eb5a6d5: "hydrogram.raw.types.InputMediaInvoice",
+    0x971fa843: "hydrogram.raw.types.InputMediaGeoLive",
+    0xf94e5f1: "hydrogram.raw.types.InputMediaPoll",
+    0xe66fbf7b: "hydrogram.raw.types.InputMediaDice",
+    0x89fdd778: "hydrogram.raw.types.InputMediaStory",
+    0xc21b8849: "hydrogram.raw.types.InputMediaWebPage",
+    0x1ca48f57: "hydrogram.raw.types.InputChatPhotoEmpty",
+    0xbdcdaec0: "hydrogram.raw.types.InputChatUploadedPhoto",
+    0x8953ad37: "hydrogram.raw.types.InputChatPhoto",
+    0xe4c123d6: "hydrogram.raw.types.InputGeoPointEmpty",
+    0x48222faf: "hydrogram.raw.types.InputGeoPoint",
+    0x1cd7bf0d: "hydrogram.raw.types.InputPhotoEmpty",
+    0x3bb3b94a: "hydrogram.raw.types.InputPhoto",
+    0xdfdaabe1: "hydrogram.raw.types.InputFileLocation",
+    0xf5235d55: "hydrogram.raw.types.InputEncryptedFileLocation",
+    0xbad07584: "hydrogram.raw.types.InputDocumentFileLocation",
+    0xcbc7ee28: "hydrogram.raw.types.InputSecureFileLocation",
+    0x29be5899: "hydrogram.raw.types.InputTakeoutFileLocation",
+    0x40181ffe: "hydrogram.raw.types.InputPhotoFileLocation",
+    0xd83466f3: "hydrogram.raw.types.InputPhotoLegacyFileLocation",
+    0x37257e99: "hydrogram.raw.types.InputPeerPhotoFileLocation",
+    0x9d84f3db: "hydrogram.raw.types.InputStickerSetThumb",
+    0x598a92a: "hydrogram.raw.types.InputGroupCallStream",
+    0x59511722: "hydrogram.raw.types.PeerUser",
+    0x36c6019a: "hydrogram.raw.types.PeerChat",
+    0xa2a5371e: "hydrogram.raw.types.PeerChannel",
+    0xaa963b05: "hydrogram.raw.types.storage.FileUnknown",
+    0x40bc6f52: "hydrogram.raw.types.storage.FilePartial",
+    0x7efe0e: "hydrogram.raw.types.storage.FileJpeg",
+    0xcae1aadf: "hydrogram.raw.types.storage.FileGif",
+    0xa4f63c0: "hydrogram.raw.types.storage.FilePng",
+    0xae1e508d: "hydrogram.raw.types.storage.FilePdf",
+    0x528a0677: "hydrogram.raw.types.storage.FileMp3",
+    0x4b09ebbc: "hydrogram.raw.types.storage.FileMov",
+    0xb3cea0e4: "hydrogram.raw.types.storage.FileMp4",
+    0x1081464c: "hydrogram.raw.types.storage.FileWebp",
+    0xd3bc4b7a: "hydrogram.raw.types.UserEmpty",
+    0x215c4438: "hydrogram.raw.types.User",
+    0x4f11bae1: "hydrogram.raw.types.UserProfilePhotoEmpty",
+    0x82d1f706: "hydrogram.raw.types.UserProfilePhoto",
+    0x9d05049: "hydrogram.raw.types.UserStatusEmpty",
+    0xedb93949: "hydrogram.raw.types.UserStatusOnline",
+    0x8c703f: "hydrogram.raw.types.UserStatusOffline",
+    0xe26f42f1: "hydrogram.raw.types.UserStatusRecently",
+    0x7bf09fc: "hydrogram.raw.types.UserStatusLastWeek",
+    0x77ebc742: "hydrogram.raw.types.UserStatusLastMonth",
+    0x29562865: "hydrogram.raw.types.ChatEmpty",
+    0x41cbf256: "hydrogram.raw.types.Chat",
+    0x6592a1a7: "hydrogram.raw.types.ChatForbidden",
+    0xaadfc8f: "hydrogram.raw.types.Channel",
+    0x17d493d5: "hydrogram.raw.types.ChannelForbidden",
+    0xc9d31138: "hydrogram.raw.types.ChatFull",
+    0xf2bcb6f: "hydrogram.raw.types.ChannelFull",
+    0xc02d4007: "hydrogram.raw.types.ChatParticipant",
+    0xe46bcee4: "hydrogram.raw.types.ChatParticipantCreator",
+    0xa0933f5b: "hydrogram.raw.types.ChatParticipantAdmin",
+    0x8763d3e1: "hydrogram.raw.types.ChatParticipantsForbidden",
+    0x3cbc93f8: "hydrogram.raw.types.ChatParticipants",
+    0x37c1011c: "hydrogram.raw.types.ChatPhotoEmpty",
+    0x1c6e1c11: "hydrogram.raw.types.ChatPhoto",
+    0x90a6ca84: "hydrogram.raw.types.MessageEmpty",
+    0x76bec211: "hydrogram.raw.types.Message",
+    0x2b085862: "hydrogram.raw.types.MessageService",
+    0x3ded6320: "hydrogram.raw.types.MessageMediaEmpty",
+    0x695150d7: "hydrogram.raw.types.MessageMediaPhoto",
+    0x56e0d474: "hydrogram.raw.types.MessageMediaGeo",
+    0x70322949: "hydrogram.raw.types.MessageMediaContact",
+    0x9f84f49e: "hydrogram.raw.types.MessageMediaUnsupported",
+    0x4cf4d72d: "hydrogram.raw.types.MessageMediaDocument",
+    0xddf10c3b: "hydrogram.raw.types.MessageMediaWebPage",
+    0x2ec0533f: "hydrogram.raw.types.MessageMediaVenue",
+    0xfdb19008: "hydrogram.raw.types.MessageMediaGame",
+    0xf6a548d3: "hydrogram.raw.types.MessageMediaInvoice",
+    0xb940c666: "hydrogram.raw.types.MessageMediaGeoLive",
+    0x4bd6e798: "hydrogram.raw.types.MessageMediaPoll",
+    0x3f7ee58b: "hydrogram.raw.types.MessageMediaDice",
+    0x68cb6283: "hydrogram.raw.types.MessageMediaStory",
+    0xdaad85b0: "hydrogram.raw.types.MessageMediaGiveaway",
+    0xc6991068: "hydrogram.raw.types.MessageMediaGiveawayResults",
+    0xb6aef7b0: "hydrogram.raw.types.MessageActionEmpty",
+    0xbd47cbad: "hydrogram.raw.types.MessageActionChatCreate",
+    0xb5a1ce5a: "hydrogram.raw.types.MessageActionChatEditTitle",
+    0x7fcb13a8: "hydrogram.raw.types.MessageActionChatEditPhoto",
+    0x95e3fbef: "hydrogram.raw.types.MessageActionChatDeletePhoto",
+    0x15cefd00: "hydrogram.raw.types.MessageActionChatAddUser",
+    0xa43f30cc: "hydrogram.raw.types.MessageActionChatDeleteUser",
+    0x31224c3: "hydrogram.raw.types.MessageActionChatJoinedByLink",
+    0x95d2ac92: "hydrogram.raw.types.MessageActionChannelCreate",
+    0xe1037f92: "hydrogram.raw.types.MessageActionChatMigrateTo",
+    0xea3948e9: "hydrogram.raw.types.MessageActionChannelMigrateFrom",
+    0x94bd38ed: "hydrogram.raw.types.MessageActionPinMessage",
+    0x9fbab604: "hydrogram.raw.types.MessageActionHistoryClear",
+    0x92a72876: "hydrogram.raw.types.MessageActionGameScore",
+    0x8f31b327: "hydrogram.raw.types.MessageActionPaymentSentMe",
+    0x96163f56: "hydrogram.raw.types.MessageActionPaymentSent",
+    0x80e11a7f: "hydrogram.raw.types.MessageActionPhoneCall",
+    0x4792929b: "hydrogram.raw.types.MessageActionScreenshotTaken",
+    0xfae69f56: "hydrogram.raw.types.MessageActionCustomAction",
+    0xc516d679: "hydrogram.raw.types.MessageActionBotAllowed",
+    0x1b287353: "hydrogram.raw.types.MessageActionSecureValuesSentMe",
+    0xd95c6154: "hydrogram.raw.types.MessageActionSecureValuesSent",
+    0xf3f25f76: "hydrogram.raw.types.MessageActionContactSignUp",
+    0x98e0d697: "hydrogram.raw.types.MessageActionGeoProximityReached",
+    0x7a0d7f42: "hydrogram.raw.types.MessageActionGroupCall",
+    0x502f92f7: "hydrogram.raw.types.MessageActionInviteToGroupCall",
+    0x3c134d7b: "hydrogram.raw.types.MessageActionSetMessagesTTL",
+    0xb3a07661: "hydrogram.raw.types.MessageActionGroupCallScheduled",
+    0xaa786345: "hydrogram.raw.types.MessageActionSetChatTheme",
+    0xebbca3cb: "hydrogram.raw.types.MessageActionChatJoinedByRequest",
+    0x47dd8079: "hydrogram.raw.types.MessageActionWebViewDataSentMe",
+    0xb4c38cb5: "hydrogram.raw.types.MessageActionWebViewDataSent",
+    0xc83d6aec: "hydrogram.raw.types.MessageActionGiftPremium",
+    0xd999256: "hydrogram.raw.types.MessageActionTopicCreate",
+    0xc0944820: "hydrogram.raw.types.MessageActionTopicEdit",
+    0x57de635e: "hydrogram.raw.types.MessageActionSuggestProfilePhoto",
+    0x31518e9b: "hydrogram.raw.types.MessageActionRequestedPeer",
+    0x5060a3f4: "hydrogram.raw.types.MessageActionSetChatWallPaper",
+    0x678c2e09: "hydrogram.raw.types.MessageActionGiftCode",
+    0x332ba9ed: "hydrogram.raw.types.MessageActionGiveawayLaunch",
+    0x2a9fadc5: "hydrogram.raw.types.MessageActionGiveawayResults",
+    0xd58a08c6: "hydrogram.raw.types.Dialog",
+    0x71bd134c: "hydrogram.raw.types.DialogFolder",
+    0x2331b22d: "hydrogram.raw.types.PhotoEmpty",
+    0xfb197a65: "hydrogram.raw.types.Photo",
+    0xe17e23c: "hydrogram.raw.types.PhotoSizeEmpty",
+    0x75c78e60: "hydrogram.raw.types.PhotoSize",
+    0x21e1ad6: "hydrogram.raw.types.PhotoCachedSize",
+    0xe0b0bc2e: "hydrogram.raw.types.PhotoStrippedSize",
+    0xfa3efb95: "hydrogram.raw.types.PhotoSizeProgressive",
+    0xd8214d41: "hydrogram.raw.types.PhotoPathSize",
+    0x1117dd5f: "hydrogram.raw.types.GeoPointEmpty",
+    0xb2a2f663: "hydrogram.raw.types.GeoPoint",
+    0x5e002502: "hydrogram.raw.types.auth.SentCode",
+    0x2390fe44: "hydrogram.raw.types.auth.SentCodeSuccess",
+    0x2ea2c0d4: "hydrogram.raw.types.auth.Authorization",
+    0x44747e9a: "hydrogram.raw.types.auth.AuthorizationSignUpRequired",
+    0xb434e2b8: "hydrogram.raw.types.auth.ExportedAuthorization",
+    0xb8bc5b0c: "hydrogram.raw.types.InputNotifyPeer",
+    0x193b4417: "hydrogram.raw.types.InputNotifyUsers",
+    0x4a95e84e: "hydrogram.raw.types.InputNotifyChats",
+    0xb1db7c7e: "hydrogram.raw.types.InputNotifyBroadcasts",
+    0x5c467992: "hydrogram.raw.types.InputNotifyForumTopic",
+    0xcacb6ae2: "hydrogram.raw.types.InputPeerNotifySettings",
+    0x99622c0c: "hydrogram.raw.types.PeerNotifySettings",
+    0xa518110d: "hydrogram.raw.types.PeerSettings",
+    0xa437c3ed: "hydrogram.raw.types.WallPaper",
+    0xe0804116: "hydrogram.raw.types.WallPaperNoFile",
+    0x58dbcab8: "hydrogram.raw.types.InputReportReasonSpam",
+    0x1e22c78d: "hydrogram.raw.types.InputReportReasonViolence",
+    0x2e59d922: "hydrogram.raw.types.InputReportReasonPornography",
+    0xadf44ee3: "hydrogram.raw.types.InputReportReasonChildAbuse",
+    0xc1e4a2b1: "hydrogram.raw.types.InputReportReasonOther",
+    0x9b89f93a: "hydrogram.raw.types.InputReportReasonCopyright",
+    0xdbd4feed: "hydrogram.raw.types.InputReportReasonGeoIrrelevant",
+    0xf5ddd6e7: "hydrogram.raw.types.InputReportReasonFake",
+    0xa8eb2be: "hydrogram.raw.types.InputReportReasonIllegalDrugs",
+    0x9ec7863d: "hydrogram.raw.types.InputReportReasonPersonalDetails",
+    0xb9b12c6c: "hydrogram.raw.types.UserFull",
+    0x145ade0b: "hydrogram.raw.types.Contact",
+    0xc13e3c50: "hydrogram.raw.types.ImportedContact",
+    0x16d9703b: "hydrogram.raw.types.ContactStatus",
+    0xb74ba9d2: "hydrogram.raw.types.contacts.ContactsNotModified",
+    0xeae87e42: "hydrogram.raw.types.contacts.Contacts",
+    0x77d01c3b: "hydrogram.raw.types.contacts.ImportedContacts",
+    0xade1591: "hydrogram.raw.types.contacts.Blocked",
+    0xe1664194: "hydrogram.raw.types.contacts.BlockedSlice",
+    0x15ba6c40: "hydrogram.raw.types.messages.Dialogs",
+    0x71e094f3: "hydrogram.raw.types.messages.DialogsSlice",
+    0xf0e3e596: "hydrogram.raw.types.messages.DialogsNotModified",
+    0x8c718e87: "hydrogram.raw.types.messages.Messages",
+    0x3a54685e: "hydrogram.raw.types.messages.MessagesSlice",
+    0xc776ba4e: "hydrogram.raw.types.messages.ChannelMessages",
+    0x74535f21: "hydrogram.raw.types.messages.MessagesNotModified",
+    0x64ff9fd5: "hydrogram.raw.types.messages.Chats",
+    0x9cd81144: "hydrogram.raw.types.messages.ChatsSlice",
+    0xe5d7d19c: "hydrogram.raw.types.messages.ChatFull",
+    0xb45c69d1: "hydrogram.raw.types.messages.AffectedHistory",
+    0x57e2f66c: "hydrogram.raw.types.InputMessagesFilterEmpty",
+    0x9609a51c: "hydrogram.raw.types.InputMessagesFilterPhotos",
+    0x9fc00e65: "hydrogram.raw.types.InputMessagesFilterVideo",
+    0x56e9f0e4: "hydrogram.raw.types.InputMessagesFilterPhotoVideo",
+    0x9eddf188: "hydrogram.raw.types.InputMessagesFilterDocument",
+    0x7ef0dd87: "hydrogram.raw.types.InputMessagesFilterUrl",
+    0xffc86587: "hydrogram.raw.types.InputMessagesFilterGif",
+    0x50f5c392: "hydrogram.raw.types.InputMessagesFilterVoice",
+    0x3751b49e: "hydrogram.raw.types.InputMessagesFilterMusic",
+    0x3a20ecb8: "hydrogram.raw.types.InputMessagesFilterChatPhotos",
+    0x80c99768: "hydrogram.raw.types.InputMessagesFilterPhoneCalls",
+    0x7a7c17a4: "hydrogram.raw.types.InputMessagesFilterRoundVoice",
+    0xb549da53: "hydrogram.raw.types.InputMessagesFilterRoundVideo",
+    0xc1f8e69a: "hydrogram.raw.types.InputMessagesFilterMyMentions",
+    0xe7026d0d: "hydrogram.raw.types.InputMessagesFilterGeo",
+    0xe062db83: "hydrogram.raw.types.InputMessagesFilterContacts",
+    0x1bb00451: "hydrogram.raw.types.InputMessagesFilterPinned",
+    0x1f2b0afd: "hydrogram.raw.types.UpdateNewMessage",
+    0x4e90bfd6: "hydrogram.raw.types.UpdateMessageID",
+    0xa20db0e5: "hydrogram.raw.types.UpdateDeleteMessages",
+    0xc01e857f: "hydrogram.raw.types.UpdateUserTyping",
+    0x83487af0: "hydrogram.raw.types.UpdateChatUserTyping",
+    0x7761198: "hydrogram.raw.types.UpdateChatParticipants",
+    0xe5bdf8de: "hydrogram.raw.types.UpdateUserStatus",
+    0xa7848924: "hydrogram.raw.types.UpdateUserName",
+    0x8951abef: "hydrogram.raw.types.UpdateNewAuthorization",
+    0x12bcbd9a: "hydrogram.raw.types.UpdateNewEncryptedMessage",
+    0x1710f156: "hydrogram.raw.types.UpdateEncryptedChatTyping",
+    0xb4a2e88d: "hydrogram.raw.types.UpdateEncryption",
+    0x38fe25b7: "hydrogram.raw.types.UpdateEncryptedMessagesRead",
+    0x3dda5451: "hydrogram.raw.types.UpdateChatParticipantAdd",
+    0xe32f3d77: "hydrogram.raw.types.UpdateChatParticipantDelete",
+    0x8e5e9873: "hydrogram.raw.types.UpdateDcOptions",
+    0xbec268ef: "hydrogram.raw.types.UpdateNotifySettings",
+    0xebe46819: "hydrogram.raw.types.UpdateServiceNotification",
+    0xee3b272a: "hydrogram.raw.types.UpdatePrivacy",
+    0x5492a13: "hydrogram.raw.types.UpdateUserPhone",
+    0x9c974fdf: "hydrogram.raw.types.UpdateReadHistoryInbox",
+    0x2f2f21bf: "hydrogram.raw.types.UpdateReadHistoryOutbox",
+    0x7f891213: "hydrogram.raw.types.UpdateWebPage",
+    0xf8227181: "hydrogram.raw.types.UpdateReadMessagesContents",
+    0x108d941f: "hydrogram.raw.types.UpdateChannelTooLong",
+    0x635b4c09: "hydrogram.raw.types.UpdateChannel",
+    0x62ba04d9: "hydrogram.raw.types.UpdateNewChannelMessage",
+    0x922e6e10: "hydrogram.raw.types.UpdateReadChannelInbox",
+    0xc32d5b12: "hydrogram.raw.types.UpdateDeleteChannelMessages",
+    0xf226ac08: "hydrogram.raw.types.UpdateChannelMessageViews",
+    0xd7ca61a2: "hydrogram.raw.types.UpdateChatParticipantAdmin",
+    0x688a30aa: "hydrogram.raw.types.UpdateNewStickerSet",
+    0xbb2d201: "hydrogram.raw.types.UpdateStickerSetsOrder",
+    0x31c24808: "hydrogram.raw.types.UpdateStickerSets",
+    0x9375341e: "hydrogram.raw.types.UpdateSavedGifs",
+    0x496f379c: "hydrogram.raw.types.UpdateBotInlineQuery",
+    0x12f12a07: "hydrogram.raw.types.UpdateBotInlineSend",
+    0x1b3f4df7: "hydrogram.raw.types.UpdateEditChannelMessage",
+    0xb9cfc48d: "hydrogram.raw.types.UpdateBotCallbackQuery",
+    0xe40370a3: "hydrogram.raw.types.UpdateEditMessage",
+    0x691e9052: "hydrogram.raw.types.UpdateInlineBotCallbackQuery",
+    0xb75f99a9: "hydrogram.raw.types.UpdateReadChannelOutbox",
+    0x1b49ec6d: "hydrogram.raw.types.UpdateDraftMessage",
+    0x571d2742: "hydrogram.raw.types.UpdateReadFeaturedStickers",
+    0x9a422c20: "hydrogram.raw.types.UpdateRecentStickers",
+    0xa229dd06: "hydrogram.raw.types.UpdateConfig",
+    0x3354678f: "hydrogram.raw.types.UpdatePtsChanged",
+    0x2f2ba99f: "hydrogram.raw.types.UpdateChannelWebPage",
+    0x6e6fe51c: "hydrogram.raw.types.UpdateDialogPinned",
+    0xfa0f3ca2: "hydrogram.raw.types.UpdatePinnedDialogs",
+    0x8317c0c3: "hydrogram.raw.types.UpdateBotWebhookJSON",
+    0x9b9240a6: "hydrogram.raw.types.UpdateBotWebhookJSONQuery",
+    0xb5aefd7d: "hydrogram.raw.types.UpdateBotShippingQuery",
+    0x8caa9a96: "hydrogram.raw.types.UpdateBotPrecheckoutQuery",
+    0xab0f6b1e: "hydrogram.raw.types.UpdatePhoneCall",
+    0x46560264: "hydrogram.raw.types.UpdateLangPackTooLong",
+    0x56022f4d: "hydrogram.raw.types.UpdateLangPack",
+    0xe511996d: "hydrogram.raw.types.UpdateFavedStickers",
+    0xea29055d: "hydrogram.raw.types.UpdateChannelReadMessagesContents",
+    0x7084a7be: "hydrogram.raw.types.UpdateContactsReset",
+    0xb23fc698: "hydrogram.raw.types.UpdateChannelAvailableMessages",
+    0xe16459c3: "hydrogram.raw.types.UpdateDialogUnreadMark",
+    0xaca1657b: "hydrogram.raw.types.UpdateMessagePoll",
+    0x54c01850: "hydrogram.raw.types.UpdateChatDefaultBannedRights",
+    0x19360dc0: "hydrogram.raw.types.UpdateFolderPeers",
+    0x6a7e7366: "hydrogram.raw.types.UpdatePeerSettings",
+    0xb4afcfb0: "hydrogram.raw.types.UpdatePeerLocated",
+    0x39a51dfb: "hydrogram.raw.types.UpdateNewScheduledMessage",
+    0x90866cee: "hydrogram.raw.types.UpdateDeleteScheduledMessages",
+    0x8216fba3: "hydrogram.raw.types.UpdateTheme",
+    0x871fb939: "hydrogram.raw.types.UpdateGeoLiveViewed",
+    0x564fe691: "hydrogram.raw.types.UpdateLoginToken",
+    0x24f40e77: "hydrogram.raw.types.UpdateMessagePollVote",
+    0x26ffde7d: "hydrogram.raw.types.UpdateDialogFilter",
+    0xa5d72105: "hydrogram.raw.types.UpdateDialogFilterOrder",
+    0x3504914f: "hydrogram.raw.types.UpdateDialogFilters",
+    0x2661bf09: "hydrogram.raw.types.UpdatePhoneCallSignalingData",
+    0xd29a27f4: "hydrogram.raw.types.UpdateChannelMessageForwards",
+    0xd6b19546: "hydrogram.raw.types.UpdateReadChannelDiscussionInbox",
+    0x695c9e7c: "hydrogram.raw.types.UpdateReadChannelDiscussionOutbox",
+    0xebe07752: "hydrogram.raw.types.UpdatePeerBlocked",
+    0x8c88c923: "hydrogram.raw.types.UpdateChannelUserTyping",
+    0xed85eab5: "hydrogram.raw.types.UpdatePinnedMessages",
+    0x5bb98608: "hydrogram.raw.types.UpdatePinnedChannelMessages",
+    0xf89a6a4e: "hydrogram.raw.types.UpdateChat",
+    0xf2ebdb4e: "hydrogram.raw.types.UpdateGroupCallParticipants",
+    0x14b24500: "hydrogram.raw.types.UpdateGroupCall",
+    0xbb9bb9a5: "hydrogram.raw.types.UpdatePeerHistoryTTL",
+    0xd087663a: "hydrogram.raw.types.UpdateChatParticipant",
+    0x985d3abb: "hydrogram.raw.types.UpdateChannelParticipant",
+    0xc4870a49: "hydrogram.raw.types.UpdateBotStopped",
+    0xb783982: "hydrogram.raw.types.UpdateGroupCallConnection",
+    0x4d712f2e: "hydrogram.raw.types.UpdateBotCommands",
+    0x7063c3db: "hydrogram.raw.types.UpdatePendingJoinRequests",
+    0x11dfa986: "hydrogram.raw.types.UpdateBotChatInviteRequester",
+    0x5e1b3cb8: "hydrogram.raw.types.UpdateMessageReactions",
+    0x17b7a20b: "hydrogram.raw.types.UpdateAttachMenuBots",
+    0x1592b79d: "hydrogram.raw.types.UpdateWebViewResultSent",
+    0x14b85813: "hydrogram.raw.types.UpdateBotMenuButton",
+    0x74d8be99: "hydrogram.raw.types.UpdateSavedRingtones",
+    0x84cd5a: "hydrogram.raw.types.UpdateTranscribedAudio",
+    0xfb4c496c: "hydrogram.raw.types.UpdateReadFeaturedEmojiStickers",
+    0x28373599: "hydrogram.raw.types.UpdateUserEmojiStatus",
+    0x30f443db: "hydrogram.raw.types.UpdateRecentEmojiStatuses",
+    0x6f7863f4: "hydrogram.raw.types.UpdateRecentReactions",
+    0x86fccf85: "hydrogram.raw.types.UpdateMoveStickerSetToTop",
+    0x5a73a98c: "hydrogram.raw.types.UpdateMessageExtendedMedia",
+    0x192efbe3: "hydrogram.raw.types.UpdateChannelPinnedTopic",
+    0xfe198602: "hydrogram.raw.types.UpdateChannelPinnedTopics",
+    0x20529438: "hydrogram.raw.types.UpdateUser",
+    0xec05b097: "hydrogram.raw.types.UpdateAutoSaveSettings",
+    0xccf08ad6: "hydrogram.raw.types.UpdateGroupInvitePrivacyForbidden",
+    0x75b3b798: "hydrogram.raw.types.UpdateStory",
+    0xf74e932b: "hydrogram.raw.types.UpdateReadStories",
+    0x1bf335b9: "hydrogram.raw.types.UpdateStoryID",
+    0x2c084dc1: "hydrogram.raw.types.UpdateStoriesStealthMode",
+    0x7d627683: "hydrogram.raw.types.UpdateSentStoryReaction",
+    0x904dd49c: "hydrogram.raw.types.UpdateBotChatBoost",
+    0x7b68920: "hydrogram.raw.types.UpdateChannelViewForumAsMessages",
+    0xae3f101d: "hydrogram.raw.types.UpdatePeerWallpaper",
+    0xac21d3ce: "hydrogram.raw.types.UpdateBotMessageReaction",
+    0x9cb7759: "hydrogram.raw.types.UpdateBotMessageReactions",
+    0xaeaf9e74: "hydrogram.raw.types.UpdateSavedDialogPinned",
+    0x686c85a6: "hydrogram.raw.types.UpdatePinnedSavedDialogs",
+    0xa56c2a3e: "hydrogram.raw.types.updates.State",
+    0x5d75a138: "hydrogram.raw.types.updates.DifferenceEmpty",
+    0xf49ca0: "hydrogram.raw.types.updates.Difference",
+    0xa8fb1981: "hydrogram.raw.types.updates.DifferenceSlice",
+    0x4afe8f6d: "hydrogram.raw.types.updates.DifferenceTooLong",
+    0xe317af7e: "hydrogram.raw.types.UpdatesTooLong",
+    0x313bc7f8: "hydrogram.raw.types.UpdateShortMessage",
+    0x4d6deea5: "hydrogram.raw.types.UpdateShortChatMessage",
+    0x78d4dec1: "hydrogram.raw.types.UpdateShort",
+    0x725b04c3: "hydrogram.raw.types.UpdatesCombined",
+    0x74ae4240: "hydrogram.raw.types.Updates",
+    0x9015e101: "hydrogram.raw.types.UpdateShortSentMessage",
+    0x8dca6aa5: "hydrogram.raw.types.photos.Photos",
+    0x15051f54: "hydrogram.raw.types.photos.PhotosSlice",
+    0x20212ca8: "hydrogram.raw.types.photos.Photo",
+    0x96a18d5: "hydrogram.raw.types.upload.File",
+    0xf18cda44: "hydrogram.raw.types.upload.FileCdnRedirect",
+    0x18b7a10d: "hydrogram.raw.types.DcOption",
+    0xcc1a241e: "hydrogram.raw.types.Config",
+    0x8e1a1775: "hydrogram.raw.types.NearestDc",
+    0xccbbce30: "hydrogram.raw.types.help.AppUpdate",
+    0xc45a6536: "hydrogram.raw.types.help.NoAppUpdate",
+    0x18cb9f78: "hydrogram.raw.types.help.InviteText",
+    0xab7ec0a0: "hydrogram.raw.types.EncryptedChatEmpty",
+    0x66b25953: "hydrogram.raw.types.EncryptedChatWaiting",
+    0x48f1d94c: "hydrogram.raw.types.EncryptedChatRequested",
+    0x61f0d4c7: "hydrogram.raw.types.EncryptedChat",
+    0x1e1c7c45: "hydrogram.raw.types.EncryptedChatDiscarded",
+    0xf141b5e1: "hydrogram.raw.types.InputEncryptedChat",
+    0xc21f497e: "hydrogram.raw.types.EncryptedFileEmpty",
+    0xa8008cd8: "hydrogram.raw.types.EncryptedFile",
+    0x1837c364: "hydrogram.raw.types.InputEncryptedFileEmpty",
+    0x64bd0306: "hydrogram.raw.types.InputEncryptedFileUploaded",
+    0x5a17b5e5: "hydrogram.raw.types.InputEncryptedFile",
+    0x2dc173c8: "hydrogram.raw.types.InputEncryptedFileBigUploaded",
+    0xed18c118: "hydrogram.raw.types.EncryptedMessage",
+    0x23734b06: "hydrogram.raw.types.EncryptedMessageService",
+    0xc0e24635: "hydrogram.raw.types.messages.DhConfigNotModified",
+    0x2c221edd: "hydrogram.raw.types.messages.DhConfig",
+    0x560f8935: "hydrogram.raw.types.messages.SentEncryptedMessage",
+    0x9493ff32: "hydrogram.raw.types.messages.SentEncryptedFile",
+    0x72f0eaae: "hydrogram.raw.types.InputDocumentEmpty",
+    0x1abfb575: "hydrogram.raw.types.InputDocument",
+    0x36f8c871: "hydrogram.raw.types.DocumentEmpty",
+    0x8fd4c4d8: "hydrogram.raw.types.Document",
+    0x17c6b5f6: "hydrogram.raw.types.help.Support",
+    0x9fd40bd8: "hydrogram.raw.types.NotifyPeer",
+    0xb4c83b4c: "hydrogram.raw.types.NotifyUsers",
+    0xc007cec3: "hydrogram.raw.types.NotifyChats",
+    0xd612e8ef: "hydrogram.raw.types.NotifyBroadcasts",
+    0x226e6308: "hydrogram.raw.types.NotifyForumTopic",
+    0x16bf744e: "hydrogram.raw.types.SendMessageTypingAction",
+    0xfd5ec8f5: "hydrogram.raw.types.SendMessageCancelAction",
+    0xa187d66f: "hydrogram.raw.types.SendMessageRecordVideoAction",
+    0xe9763aec: "hydrogram.raw.types.SendMessageUploadVideoAction",
+    0xd52f73f7: "hydrogram.raw.types.SendMessageRecordAudioAction",
+    0xf351d7ab: "hydrogram.raw.types.SendMessageUploadAudioAction",
+    0xd1d34a26: "hydrogram.raw.types.SendMessageUploadPhotoAction",
+    0xaa0cd9e4: "hydrogram.raw.types.SendMessageUploadDocumentAction",
+    0x176f8ba1: "hydrogram.raw.types.SendMessageGeoLocationAction",
+    0x628cbc6f: "hydrogram.raw.types.SendMessageChooseContactAction",
+    0xdd6a8f48: "hydrogram.raw.types.SendMessageGamePlayAction",
+    0x88f27fbc: "hydrogram.raw.types.SendMessageRecordRoundAction",
+    0x243e1c66: "hydrogram.raw.types.SendMessageUploadRoundAction",
+    0xd92c2285: "hydrogram.raw.types.SpeakingInGroupCallAction",
+    0xdbda9246: "hydrogram.raw.types.SendMessageHistoryImportAction",
+    0xb05ac6b1: "hydrogram.raw.types.SendMessageChooseStickerAction",
+    0x25972bcb: "hydrogram.raw.types.SendMessageEmojiInteraction",
+    0xb665902e: "hydrogram.raw.types.SendMessageEmojiInteractionSeen",
+    0xb3134d9d: "hydrogram.raw.types.contacts.Found",
+    0x4f96cb18: "hydrogram.raw.types.InputPrivacyKeyStatusTimestamp",
+    0xbdfb0426: "hydrogram.raw.types.InputPrivacyKeyChatInvite",
+    0xfabadc5f: "hydrogram.raw.types.InputPrivacyKeyPhoneCall",
+    0xdb9e70d2: "hydrogram.raw.types.InputPrivacyKeyPhoneP2P",
+    0xa4dd4c08: "hydrogram.raw.types.InputPrivacyKeyForwards",
+    0x5719bacc: "hydrogram.raw.types.InputPrivacyKeyProfilePhoto",
+    0x352dafa: "hydrogram.raw.types.InputPrivacyKeyPhoneNumber",
+    0xd1219bdd: "hydrogram.raw.types.InputPrivacyKeyAddedByPhone",
+    0xaee69d68: "hydrogram.raw.types.InputPrivacyKeyVoiceMessages",
+    0x3823cc40: "hydrogram.raw.types.InputPrivacyKeyAbout",
+    0xbc2eab30: "hydrogram.raw.types.PrivacyKeyStatusTimestamp",
+    0x500e6dfa: "hydrogram.raw.types.PrivacyKeyChatInvite",
+    0x3d662b7b: "hydrogram.raw.types.PrivacyKeyPhoneCall",
+    0x39491cc8: "hydrogram.raw.types.PrivacyKeyPhoneP2P",
+    0x69ec56a3: "hydrogram.raw.types.PrivacyKeyForwards",
+    0x96151fed: "hydrogram.raw.types.PrivacyKeyProfilePhoto",
+    0xd19ae46d: "hydrogram.raw.types.PrivacyKeyPhoneNumber",
+    0x42ffd42b: "hydrogram.raw.types.PrivacyKeyAddedByPhone",
+    0x697f414: "hydrogram.raw.types.PrivacyKeyVoiceMessages",
+    0xa486b761: "hydrogram.raw.types.PrivacyKeyAbout",
+    0xd09e07b: "hydrogram.raw.types.InputPrivacyValueAllowContacts",
+    0x184b35ce: "hydrogram.raw.types.InputPrivacyValueAllowAll",
+    0x131cc67f: "hydrogram.raw.types.InputPrivacyValueAllowUsers",
+    0xba52007: "hydrogram.raw.types.InputPrivacyValueDisallowContacts",
+    0xd66b66c9: "hydrogram.raw.types.InputPrivacyValueDisallowAll",
+    0x90110467: "hydrogram.raw.types.InputPrivacyValueDisallowUsers",
+    0x840649cf: "hydrogram.raw.types.InputPrivacyValueAllowChatParticipants",
+    0xe94f0f86: "hydrogram.raw.types.InputPrivacyValueDisallowChatParticipants",
+    0x2f453e49: "hydrogram.raw.types.InputPrivacyValueAllowCloseFriends",
+    0xfffe1bac: "hydrogram.raw.types.PrivacyValueAllowContacts",
+    0x65427b82: "hydrogram.raw.types.PrivacyValueAllowAll",
+    0xb8905fb2: "hydrogram.raw.types.PrivacyValueAllowUsers",
+    0xf888fa1a: "hydrogram.raw.types.PrivacyValueDisallowContacts",
+    0x8b73e763: "hydrogram.raw.types.PrivacyValueDisallowAll",
+    0xe4621141: "hydrogram.raw.types.PrivacyValueDisallowUsers",
+    0x6b134e8e: "hydrogram.raw.types.PrivacyValueAllowChatParticipants",
+    0x41c87565: "hydrogram.raw.types.PrivacyValueDisallowChatParticipants",
+    0xf7e8d89b: "hydrogram.raw.types.PrivacyValueAllowCloseFriends",
+    0x50a04e45: "hydrogram.raw.types.account.PrivacyRules",
+    0xb8d0afdf: "hydrogram.raw.types.AccountDaysTTL",
+    0x6c37c15c: "hydrogram.raw.types.DocumentAttributeImageSize",
+    0x11b58939: "hydrogram.raw.types.DocumentAttributeAnimated",
+    0x6319d612: "hydrogram.raw.types.DocumentAttributeSticker",
+    0xd38ff1c2: "hydrogram.raw.types.DocumentAttributeVideo",
+    0x9852f9c6: "hydrogram.raw.types.DocumentAttributeAudio",
+    0x15590068: "hydrogram.raw.types.DocumentAttributeFilename",
+    0x9801d2f7: "hydrogram.raw.types.DocumentAttributeHasStickers",
+    0xfd149899: "hydrogram.raw.types.DocumentAttributeCustomEmoji",
+    0xf1749a22: "hydrogram.raw.types.messages.StickersNotModified",
+    0x30a6ec7e: "hydrogram.raw.types.messages.Stickers",
+    0x12b299d4: "hydrogram.raw.types.StickerPack",
+    0xe86602c3: "hydrogram.raw.types.messages.AllStickersNotModified",
+    0xcdbbcebb: "hydrogram.raw.types.messages.AllStickers",
+    0x84d19185: "hydrogram.raw.types.messages.AffectedMessages",
+    0x211a1788: "hydrogram.raw.types.WebPageEmpty",
+    0xb0d13e47: "hydrogram.raw.types.WebPagePending",
+    0xe89c45b2: "hydrogram.raw.types.WebPage",
+    0x7311ca11: "hydrogram.raw.types.WebPageNotModified",
+    0xad01d61d: "hydrogram.raw.types.Authorization",
+    0x4bff8ea0: "hydrogram.raw.types.account.Authorizations",
+    0x957b50fb: "hydrogram.raw.types.account.Password",
+    0x9a5c33e5: "hydrogram.raw.types.account.PasswordSettings",
+    0xc23727c9: "hydrogram.raw.types.account.PasswordInputSettings",
+    0x137948a5: "hydrogram.raw.types.auth.PasswordRecovery",
+    0xa384b779: "hydrogram.raw.types.ReceivedNotifyMessage",
+    0xab4a819: "hydrogram.raw.types.ChatInviteExported",
+    0xed107ab7: "hydrogram.raw.types.ChatInvitePublicJoinRequests",
+    0x5a686d7c: "hydrogram.raw.types.ChatInviteAlready",
+    0xcde0ec40: "hydrogram.raw.types.ChatInvite",
+    0x61695cb0: "hydrogram.raw.types.ChatInvitePeek",
+    0xffb62b95: "hydrogram.raw.types.InputStickerSetEmpty",
+    0x9de7a269: "hydrogram.raw.types.InputStickerSetID",
+    0x861cc8a0: "hydrogram.raw.types.InputStickerSetShortName",
+    0x28703c8: "hydrogram.raw.types.InputStickerSetAnimatedEmoji",
+    0xe67f520e: "hydrogram.raw.types.InputStickerSetDice",
+    0xcde3739: "hydrogram.raw.types.InputStickerSetAnimatedEmojiAnimations",
+    0xc88b3b02: "hydrogram.raw.types.InputStickerSetPremiumGifts",
+    0x4c4d4ce: "hydrogram.raw.types.InputStickerSetEmojiGenericAnimations",
+    0x29d0f5ee: "hydrogram.raw.types.InputStickerSetEmojiDefaultStatuses",
+    0x44c1f8e9: "hydrogram.raw.types.InputStickerSetEmojiDefaultTopicIcons",
+    0x49748553: "hydrogram.raw.types.InputStickerSetEmojiChannelDefaultStatuses",
+    0x2dd14edc: "hydrogram.raw.types.StickerSet",
+    0x6e153f16: "hydrogram.raw.types.messages.StickerSet",
+    0xd3f924eb: "hydrogram.raw.types.messages.StickerSetNotModified",
+    0xc27ac8c7: "hydrogram.raw.types.BotCommand",
+    0x8f300b57: "hydrogram.raw.types.BotInfo",
+    0xa2fa4880: "hydrogram.raw.types.KeyboardButton",
+    0x258aff05: "hydrogram.raw.types.KeyboardButtonUrl",
+    0x35bbdb6b: "hydrogram.raw.types.KeyboardButtonCallback",
+    0xb16a6c29: "hydrogram.raw.types.KeyboardButtonRequestPhone",
+    0xfc796b3f: "hydrogram.raw.types.KeyboardButtonRequestGeoLocation",
+    0x93b9fbb5: "hydrogram.raw.types.KeyboardButtonSwitchInline",
+    0x50f41ccf: "hydrogram.raw.types.KeyboardButtonGame",
+    0xafd93fbb: "hydrogram.raw.types.KeyboardButtonBuy",
+    0x10b78d29: "hydrogram.raw.types.KeyboardButtonUrlAuth",
+    0xd02e7fd4: "hydrogram.raw.types.InputKeyboardButtonUrlAuth",
+    0xbbc7515d: "hydrogram.raw.types.KeyboardButtonRequestPoll",
+    0xe988037b: "hydrogram.raw.types.InputKeyboardButtonUserProfile",
+    0x308660c1: "hydrogram.raw.types.KeyboardButtonUserProfile",
+    0x13767230: "hydrogram.raw.types.KeyboardButtonWebView",
+    0xa0c0505c: "hydrogram.raw.types.KeyboardButtonSimpleWebView",
+    0x53d7bfd8: "hydrogram.raw.types.KeyboardButtonRequestPeer",
+    0x77608b83: "hydrogram.raw.types.KeyboardButtonRow",
+    0xa03e5b85: "hydrogram.raw.types.ReplyKeyboardHide",
+    0x86b40b08: "hydrogram.raw.types.ReplyKeyboardForceReply",
+    0x85dd99d1: "hydrogram.raw.types.ReplyKeyboardMarkup",
+    0x48a30254: "hydrogram.raw.types.ReplyInlineMarkup",
+    0xbb92ba95: "hydrogram.raw.types.MessageEntityUnknown",
+    0xfa04579d: "hydrogram.raw.types.MessageEntityMention",
+    0x6f635b0d: "hydrogram.raw.types.MessageEntityHashtag",
+    0x6cef8ac7: "hydrogram.raw.types.MessageEntityBotCommand",
+    0x6ed02538: "hydrogram.raw.types.MessageEntityUrl",
+    0x64e475c2: "hydrogram.raw.types.MessageEntityEmail",
+    0xbd610bc9: "hydrogram.raw.types.MessageEntityBold",
+    0x826f8b60: "hydrogram.raw.types.MessageEntityItalic",
+    0x28a20571: "hydrogram.raw.types.MessageEntityCode",
+    0x73924be0: "hydrogram.raw.types.MessageEntityPre",
+    0x76a6d327: "hydrogram.raw.types.MessageEntityTextUrl",
+    0xdc7b1140: "hydrogram.raw.types.MessageEntityMentionName",
+    0x208e68c9: "hydrogram.raw.types.InputMessageEntityMentionName",
+    0x9b69e34b: "hydrogram.raw.types.MessageEntityPhone",
+    0x4c4e743f: "hydrogram.raw.types.MessageEntityCashtag",
+    0x9c4e7e8b: "hydrogram.raw.types.MessageEntityUnderline",
+    0xbf0693d4: "hydrogram.raw.types.MessageEntityStrike",
+    0x761e6af4: "hydrogram.raw.types.MessageEntityBankCard",
+    0x32ca960f: "hydrogram.raw.types.MessageEntitySpoiler",
+    0xc8cf05f8: "hydrogram.raw.types.MessageEntityCustomEmoji",
+    0x20df5d0: "hydrogram.raw.types.MessageEntityBlockquote",
+    0xee8c1e86: "hydrogram.raw.types.InputChannelEmpty",
+    0xf35aec28: "hydrogram.raw.types.InputChannel",
+    0x5b934f9d: "hydrogram.raw.types.InputChannelFromMessage",
+    0x7f077ad9: "hydrogram.raw.types.contacts.ResolvedPeer",
+    0xae30253: "hydrogram.raw.types.MessageRange",
+    0x3e11affb: "hydrogram.raw.types.updates.ChannelDifferenceEmpty",
+    0xa4bcc6fe: "hydrogram.raw.types.updates.ChannelDifferenceTooLong",
+    0x2064674e: "hydrogram.raw.types.updates.ChannelDifference",
+    0x94d42ee7: "hydrogram.raw.types.ChannelMessagesFilterEmpty",
+    0xcd77d957: "hydrogram.raw.types.ChannelMessagesFilter",
+    0xc00c07c0: "hydrogram.raw.types.ChannelParticipant",
+    0x35a8bfa7: "hydrogram.raw.types.ChannelParticipantSelf",
+    0x2fe601d3: "hydrogram.raw.types.ChannelParticipantCreator",
+    0x34c3bb53: "hydrogram.raw.types.ChannelParticipantAdmin",
+    0x6df8014e: "hydrogram.raw.types.ChannelParticipantBanned",
+    0x1b03f006: "hydrogram.raw.types.ChannelParticipantLeft",
+    0xde3f3c79: "hydrogram.raw.types.ChannelParticipantsRecent",
+    0xb4608969: "hydrogram.raw.types.ChannelParticipantsAdmins",
+    0xa3b54985: "hydrogram.raw.types.ChannelParticipantsKicked",
+    0xb0d1865b: "hydrogram.raw.types.ChannelParticipantsBots",
+    0x1427a5e1: "hydrogram.raw.types.ChannelParticipantsBanned",
+    0x656ac4b: "hydrogram.raw.types.ChannelParticipantsSearch",
+    0xbb6ae88d: "hydrogram.raw.types.ChannelParticipantsContacts",
+    0xe04b5ceb: "hydrogram.raw.types.ChannelParticipantsMentions",
+    0x9ab0feaf: "hydrogram.raw.types.channels.ChannelParticipants",
+    0xf0173fe9: "hydrogram.raw.types.channels.ChannelParticipantsNotModified",
+    0xdfb80317: "hydrogram.raw.types.channels.ChannelParticipant",
+    0x780a0310: "hydrogram.raw.types.help.TermsOfService",
+    0xe8025ca2: "hydrogram.raw.types.messages.SavedGifsNotModified",
+    0x84a02a0d: "hydrogram.raw.types.messages.SavedGifs",
+    0x3380c786: "hydrogram.raw.types.InputBotInlineMessageMediaAuto",
+    0x3dcd7a87: "hydrogram.raw.types.InputBotInlineMessageText",
+    0x96929a85: "hydrogram.raw.types.InputBotInlineMessageMediaGeo",
+    0x417bbf11: "hydrogram.raw.types.InputBotInlineMessageMediaVenue",
+    0xa6edbffd: "hydrogram.raw.types.InputBotInlineMessageMediaContact",
+    0x4b425864: "hydrogram.raw.types.InputBotInlineMessageGame",
+    0xd7e78225: "hydrogram.raw.types.InputBotInlineMessageMediaInvoice",
+    0xbddcc510: "hydrogram.raw.types.InputBotInlineMessageMediaWebPage",
+    0x88bf9319: "hydrogram.raw.types.InputBotInlineResult",
+    0xa8d864a7: "hydrogram.raw.types.InputBotInlineResultPhoto",
+    0xfff8fdc4: "hydrogram.raw.types.InputBotInlineResultDocument",
+    0x4fa417f2: "hydrogram.raw.types.InputBotInlineResultGame",
+    0x764cf810: "hydrogram.raw.types.BotInlineMessageMediaAuto",
+    0x8c7f65e2: "hydrogram.raw.types.BotInlineMessageText",
+    0x51846fd: "hydrogram.raw.types.BotInlineMessageMediaGeo",
+    0x8a86659c: "hydrogram.raw.types.BotInlineMessageMediaVenue",
+    0x18d1cdc2: "hydrogram.raw.types.BotInlineMessageMediaContact",
+    0x354a9b09: "hydrogram.raw.types.BotInlineMessageMediaInvoice",
+    0x809ad9a6: "hydrogram.raw.types.BotInlineMessageMediaWebPage",
+    0x11965f3a: "hydrogram.raw.types.BotInlineResult",
+    0x17db940b: "hydrogram.raw.types.BotInlineMediaResult",
+    0xe021f2f6: "hydrogram.raw.types.messages.BotResults",
+    0x5dab1af4: "hydrogram.raw.types.ExportedMessageLink",
+    0x4e4df4bb: "hydrogram.raw.types.MessageFwdHeader",
+    0x72a3158c: "hydrogram.raw.types.auth.CodeTypeSms",
+    0x741cd3e3: "hydrogram.raw.types.auth.CodeTypeCall",
+    0x226ccefb: "hydrogram.raw.types.auth.CodeTypeFlashCall",
+    0xd61ad6ee: "hydrogram.raw.types.auth.CodeTypeMissedCall",
+    0x6ed998c: "hydrogram.raw.types.auth.CodeTypeFragmentSms",
+    0x3dbb5986: "hydrogram.raw.types.auth.SentCodeTypeApp",
+    0xc000bba2: "hydrogram.raw.types.auth.SentCodeTypeSms",
+    0x5353e5a7: "hydrogram.raw.types.auth.SentCodeTypeCall",
+    0xab03c6d9: "hydrogram.raw.types.auth.SentCodeTypeFlashCall",
+    0x82006484: "hydrogram.raw.types.auth.SentCodeTypeMissedCall",
+    0xf450f59b: "hydrogram.raw.types.auth.SentCodeTypeEmailCode",
+    0xa5491dea: "hydrogram.raw.types.auth.SentCodeTypeSetUpEmailRequired",
+    0xd9565c39: "hydrogram.raw.types.auth.SentCodeTypeFragmentSms",
+    0xe57b1432: "hydrogram.raw.types.auth.SentCodeTypeFirebaseSms",
+    0x36585ea4: "hydrogram.raw.types.messages.BotCallbackAnswer",
+    0x26b5dde6: "hydrogram.raw.types.messages.MessageEditData",
+    0x890c3d89: "hydrogram.raw.types.InputBotInlineMessageID",
+    0xb6d915d7: "hydrogram.raw.types.InputBotInlineMessageID64",
+    0x3c20629f: "hydrogram.raw.types.InlineBotSwitchPM",
+    0x3371c354: "hydrogram.raw.types.messages.PeerDialogs",
+    0xedcdc05b: "hydrogram.raw.types.TopPeer",
+    0xab661b5b: "hydrogram.raw.types.TopPeerCategoryBotsPM",
+    0x148677e2: "hydrogram.raw.types.TopPeerCategoryBotsInline",
+    0x637b7ed: "hydrogram.raw.types.TopPeerCategoryCorrespondents",
+    0xbd17a14a: "hydrogram.raw.types.TopPeerCategoryGroups",
+    0x161d9628: "hydrogram.raw.types.TopPeerCategoryChannels",
+    0x1e76a78c: "hydrogram.raw.types.TopPeerCategoryPhoneCalls",
+    0xa8406ca9: "hydrogram.raw.types.TopPeerCategoryForwardUsers",
+    0xfbeec0f0: "hydrogram.raw.types.TopPeerCategoryForwardChats",
+    0xfb834291: "hydrogram.raw.types.TopPeerCategoryPeers",
+    0xde266ef5: "hydrogram.raw.types.contacts.TopPeersNotModified",
+    0x70b772a8: "hydrogram.raw.types.contacts.TopPeers",
+    0xb52c939d: "hydrogram.raw.types.contacts.TopPeersDisabled",
+    0x1b0c841a: "hydrogram.raw.types.DraftMessageEmpty",
+    0x3fccf7ef: "hydrogram.raw.types.DraftMessage",
+    0xc6dc0c66: "hydrogram.raw.types.messages.FeaturedStickersNotModified",
+    0xbe382906: "hydrogram.raw.types.messages.FeaturedStickers",
+    0xb17f890: "hydrogram.raw.types.messages.RecentStickersNotModified",
+    0x88d37c56: "hydrogram.raw.types.messages.RecentStickers",
+    0x4fcba9c8: "hydrogram.raw.types.messages.ArchivedStickers",
+    0x38641628: "hydrogram.raw.types.messages.StickerSetInstallResultSuccess",
+    0x35e410a8: "hydrogram.raw.types.messages.StickerSetInstallResultArchive",
+    0x6410a5d2: "hydrogram.raw.types.StickerSetCovered",
+    0x3407e51b: "hydrogram.raw.types.StickerSetMultiCovered",
+    0x40d13c0e: "hydrogram.raw.types.StickerSetFullCovered",
+    0x77b15d1c: "hydrogram.raw.types.StickerSetNoCovered",
+    0xaed6dbb2: "hydrogram.raw.types.MaskCoords",
+    0x4a992157: "hydrogram.raw.types.InputStickeredMediaPhoto",
+    0x438865b: "hydrogram.raw.types.InputStickeredMediaDocument",
+    0xbdf9653b: "hydrogram.raw.types.Game",
+    0x32c3e77: "hydrogram.raw.types.InputGameID",
+    0xc331e80a: "hydrogram.raw.types.InputGameShortName",
+    0x73a379eb: "hydrogram.raw.types.HighScore",
+    0x9a3bfd99: "hydrogram.raw.types.messages.HighScores",
+    0xdc3d824f: "hydrogram.raw.types.TextEmpty",
+    0x744694e0: "hydrogram.raw.types.TextPlain",
+    0x6724abc4: "hydrogram.raw.types.TextBold",
+    0xd912a59c: "hydrogram.raw.types.TextItalic",
+    0xc12622c4: "hydrogram.raw.types.TextUnderline",
+    0x9bf8bb95: "hydrogram.raw.types.TextStrike",
+    0x6c3f19b9: "hydrogram.raw.types.TextFixed",
+    0x3c2884c1: "hydrogram.raw.types.TextUrl",
+    0xde5a0dd6: "hydrogram.raw.types.TextEmail",
+    0x7e6260d7: "hydrogram.raw.types.TextConcat",
+    0xed6a8504: "hydrogram.raw.types.TextSubscript",
+    0xc7fb5e01: "hydrogram.raw.types.TextSuperscript",
+    0x34b8621: "hydrogram.raw.types.TextMarked",
+    0x1ccb966a: "hydrogram.raw.types.TextPhone",
+    0x81ccf4f: "hydrogram.raw.types.TextImage",
+    0x35553762: "hydrogram.raw.types.TextAnchor",
+    0x13567e8a: "hydrogram.raw.types.PageBlockUnsupported",
+    0x70abc3fd: "hydrogram.raw.types.PageBlockTitle",
+    0x8ffa9a1f: "hydrogram.raw.types.PageBlockSubtitle",
+    0xbaafe5e0: "hydrogram.raw.types.PageBlockAuthorDate",
+    0xbfd064ec: "hydrogram.raw.types.PageBlockHeader",
+    0xf12bb6e1: "hydrogram.raw.types.PageBlockSubheader",
+    0x467a0766: "hydrogram.raw.types.PageBlockParagraph",
+    0xc070d93e: "hydrogram.raw.types.PageBlockPreformatted",
+    0x48870999: "hydrogram.raw.types.PageBlockFooter",
+    0xdb20b188: "hydrogram.raw.types.PageBlockDivider",
+    0xce0d37b0: "hydrogram.raw.types.PageBlockAnchor",
+    0xe4e88011: "hydrogram.raw.types.PageBlockList",
+    0x263d7c26: "hydrogram.raw.types.PageBlockBlockquote",
+    0x4f4456d3: "hydrogram.raw.types.PageBlockPullquote",
+    0x1759c560: "hydrogram.raw.types.PageBlockPhoto",
+    0x7c8fe7b6: "hydrogram.raw.types.PageBlockVideo",
+    0x39f23300: "hydrogram.raw.types.PageBlockCover",
+    0xa8718dc5: "hydrogram.raw.types.PageBlockEmbed",
+    0xf259a80b: "hydrogram.raw.types.PageBlockEmbedPost",
+    0x65a0fa4d: "hydrogram.raw.types.PageBlockCollage",
+    0x31f9590: "hydrogram.raw.types.PageBlockSlideshow",
+    0xef1751b5: "hydrogram.raw.types.PageBlockChannel",
+    0x804361ea: "hydrogram.raw.types.PageBlockAudio",
+    0x1e148390: "hydrogram.raw.types.PageBlockKicker",
+    0xbf4dea82: "hydrogram.raw.types.PageBlockTable",
+    0x9a8ae1e1: "hydrogram.raw.types.PageBlockOrderedList",
+    0x76768bed: "hydrogram.raw.types.PageBlockDetails",
+    0x16115a96: "hydrogram.raw.types.PageBlockRelatedArticles",
+    0xa44f3ef6: "hydrogram.raw.types.PageBlockMap",
+    0x85e42301: "hydrogram.raw.types.PhoneCallDiscardReasonMissed",
+    0xe095c1a0: "hydrogram.raw.types.PhoneCallDiscardReasonDisconnect",
+    0x57adc690: "hydrogram.raw.types.PhoneCallDiscardReasonHangup",
+    0xfaf7e8c9: "hydrogram.raw.types.PhoneCallDiscardReasonBusy",
+    0x7d748d04: "hydrogram.raw.types.DataJSON",
+    0xcb296bf8: "hydrogram.raw.types.LabeledPrice",
+    0x5db95a15: "hydrogram.raw.types.Invoice",
+    0xea02c27e: "hydrogram.raw.types.PaymentCharge",
+    0x1e8caaeb: "hydrogram.raw.types.PostAddress",
+    0x909c3f94: "hydrogram.raw.types.PaymentRequestedInfo",
+    0xcdc27a1f: "hydrogram.raw.types.PaymentSavedCredentialsCard",
+    0x1c570ed1: "hydrogram.raw.types.WebDocument",
+    0xf9c8bcc6: "hydrogram.raw.types.WebDocumentNoProxy",
+    0x9bed434d: "hydrogram.raw.types.InputWebDocument",
+    0xc239d686: "hydrogram.raw.types.InputWebFileLocation",
+    0x9f2221c9: "hydrogram.raw.types.InputWebFileGeoPointLocation",
+    0xf46fe924: "hydrogram.raw.types.InputWebFileAudioAlbumThumbLocation",
+    0x21e753bc: "hydrogram.raw.types.upload.WebFile",
+    0xa0058751: "hydrogram.raw.types.payments.PaymentForm",
+    0xd1451883: "hydrogram.raw.types.payments.ValidatedRequestedInfo",
+    0x4e5f810d: "hydrogram.raw.types.payments.PaymentResult",
+    0xd8411139: "hydrogram.raw.types.payments.PaymentVerificationNeeded",
+    0x70c4fe03: "hydrogram.raw.types.payments.PaymentReceipt",
+    0xfb8fe43c: "hydrogram.raw.types.payments.SavedInfo",
+    0xc10eb2cf: "hydrogram.raw.types.InputPaymentCredentialsSaved",
+    0x3417d728: "hydrogram.raw.types.InputPaymentCredentials",
+    0xaa1c39f: "hydrogram.raw.types.InputPaymentCredentialsApplePay",
+    0x8ac32801: "hydrogram.raw.types.InputPaymentCredentialsGooglePay",
+    0xdb64fd34: "hydrogram.raw.types.account.TmpPassword",
+    0xb6213cdf: "hydrogram.raw.types.ShippingOption",
+    0x32da9e9c: "hydrogram.raw.types.InputStickerSetItem",
+    0x1e36fded: "hydrogram.raw.types.InputPhoneCall",
+    0x5366c915: "hydrogram.raw.types.PhoneCallEmpty",
+    0xc5226f17: "hydrogram.raw.types.PhoneCallWaiting",
+    0x14b0ed0c: "hydrogram.raw.types.PhoneCallRequested",
+    0x3660c311: "hydrogram.raw.types.PhoneCallAccepted",
+    0x967f7c67: "hydrogram.raw.types.PhoneCall",
+    0x50ca4de1: "hydrogram.raw.types.PhoneCallDiscarded",
+    0x9cc123c7: "hydrogram.raw.types.PhoneConnection",
+    0x635fe375: "hydrogram.raw.types.PhoneConnectionWebrtc",
+    0xfc878fc8: "hydrogram.raw.types.PhoneCallProtocol",
+    0xec82e140: "hydrogram.raw.types.phone.PhoneCall",
+    0xeea8e46e: "hydrogram.raw.types.upload.CdnFileReuploadNeeded",
+    0xa99fca4f: "hydrogram.raw.types.upload.CdnFile",
+    0xc982eaba: "hydrogram.raw.types.CdnPublicKey",
+    0x5725e40a: "hydrogram.raw.types.CdnConfig",
+    0xcad181f6: "hydrogram.raw.types.LangPackString",
+    0x6c47ac9f: "hydrogram.raw.types.LangPackStringPluralized",
+    0x2979eeb2: "hydrogram.raw.types.LangPackStringDeleted",
+    0xf385c1f6: "hydrogram.raw.types.LangPackDifference",
+    0xeeca5ce3: "hydrogram.raw.types.LangPackLanguage",
+    0xe6dfb825: "hydrogram.raw.types.ChannelAdminLogEventActionChangeTitle",
+    0x55188a2e: "hydrogram.raw.types.ChannelAdminLogEventActionChangeAbout",
+    0x6a4afc38: "hydrogram.raw.types.ChannelAdminLogEventActionChangeUsername",
+    0x434bd2af: "hydrogram.raw.types.ChannelAdminLogEventActionChangePhoto",
+    0x1b7907ae: "hydrogram.raw.types.ChannelAdminLogEventActionToggleInvites",
+    0x26ae0971: "hydrogram.raw.types.ChannelAdminLogEventActionToggleSignatures",
+    0xe9e82c18: "hydrogram.raw.types.ChannelAdminLogEventActionUpdatePinned",
+    0x709b2405: "hydrogram.raw.types.ChannelAdminLogEventActionEditMessage",
+    0x42e047bb: "hydrogram.raw.types.ChannelAdminLogEventActionDeleteMessage",
+    0x183040d3: "hydrogram.raw.types.ChannelAdminLogEventActionParticipantJoin",
+    0xf89777f2: "hydrogram.raw.types.ChannelAdminLogEventActionParticipantLeave",
+    0xe31c34d8: "hydrogram.raw.types.ChannelAdminLogEventActionParticipantInvite",
+    0xe6d83d7e: "hydrogram.raw.types.ChannelAdminLogEventActionParticipantToggleBan",
+    0xd5676710: "hydrogram.raw.types.ChannelAdminLogEventActionParticipantToggleAdmin",
+    0xb1c3caa7: "hydrogram.raw.types.ChannelAdminLogEventActionChangeStickerSet",
+    0x5f5c95f1: "hydrogram.raw.types.ChannelAdminLogEventActionTogglePreHistoryHidden",
+    0x2df5fc0a: "hydrogram.raw.types.ChannelAdminLogEventActionDefaultBannedRights",
+    0x8f079643: "hydrogram.raw.types.ChannelAdminLogEventActionStopPoll",
+    0x50c7ac8: "hydrogram.raw.types.ChannelAdminLogEventActionChangeLinkedChat",
+    0xe6b76ae: "hydrogram.raw.types.ChannelAdminLogEventActionChangeLocation",
+    0x53909779: "hydrogram.raw.types.ChannelAdminLogEventActionToggleSlowMode",
+    0x23209745: "hydrogram.raw.types.ChannelAdminLogEventActionStartGroupCall",
+    0xdb9f9140: "hydrogram.raw.types.ChannelAdminLogEventActionDiscardGroupCall",
+    0xf92424d2: "hydrogram.raw.types.ChannelAdminLogEventActionParticipantMute",
+    0xe64429c0: "hydrogram.raw.types.ChannelAdminLogEventActionParticipantUnmute",
+    0x56d6a247: "hydrogram.raw.types.ChannelAdminLogEventActionToggleGroupCallSetting",
+    0xfe9fc158: "hydrogram.raw.types.ChannelAdminLogEventActionParticipantJoinByInvite",
+    0x5a50fca4: "hydrogram.raw.types.ChannelAdminLogEventActionExportedInviteDelete",
+    0x410a134e: "hydrogram.raw.types.ChannelAdminLogEventActionExportedInviteRevoke",
+    0xe90ebb59: "hydrogram.raw.types.ChannelAdminLogEventActionExportedInviteEdit",
+    0x3e7f6847: "hydrogram.raw.types.ChannelAdminLogEventActionParticipantVolume",
+    0x6e941a38: "hydrogram.raw.types.ChannelAdminLogEventActionChangeHistoryTTL",
+    0xafb6144a: "hydrogram.raw.types.ChannelAdminLogEventActionParticipantJoinByRequest",
+    0xcb2ac766: "hydrogram.raw.types.ChannelAdminLogEventActionToggleNoForwards",
+    0x278f2868: "hydrogram.raw.types.ChannelAdminLogEventActionSendMessage",
+    0xbe4e0ef8: "hydrogram.raw.types.ChannelAdminLogEventActionChangeAvailableReactions",
+    0xf04fb3a9: "hydrogram.raw.types.ChannelAdminLogEventActionChangeUsernames",
+    0x2cc6383: "hydrogram.raw.types.ChannelAdminLogEventActionToggleForum",
+    0x58707d28: "hydrogram.raw.types.ChannelAdminLogEventActionCreateTopic",
+    0xf06fe208: "hydrogram.raw.types.ChannelAdminLogEventActionEditTopic",
+    0xae168909: "hydrogram.raw.types.ChannelAdminLogEventActionDeleteTopic",
+    0x5d8d353b: "hydrogram.raw.types.ChannelAdminLogEventActionPinTopic",
+    0x64f36dfc: "hydrogram.raw.types.ChannelAdminLogEventActionToggleAntiSpam",
+    0x5796e780: "hydrogram.raw.types.ChannelAdminLogEventActionChangePeerColor",
+    0x5e477b25: "hydrogram.raw.types.ChannelAdminLogEventActionChangeProfilePeerColor",
+    0x31bb5d52: "hydrogram.raw.types.ChannelAdminLogEventActionChangeWallpaper",
+    0x3ea9feb1: "hydrogram.raw.types.ChannelAdminLogEventActionChangeEmojiStatus",
+    0x1fad68cd: "hydrogram.raw.types.ChannelAdminLogEvent",
+    0xed8af74d: "hydrogram.raw.types.channels.AdminLogResults",
+    0xea107ae4: "hydrogram.raw.types.ChannelAdminLogEventsFilter",
+    0x5ce14175: "hydrogram.raw.types.PopularContact",
+    0x9e8fa6d3: "hydrogram.raw.types.messages.FavedStickersNotModified",
+    0x2cb51097: "hydrogram.raw.types.messages.FavedStickers",
+    0x46e1d13d: "hydrogram.raw.types.RecentMeUrlUnknown",
+    0xb92c09e2: "hydrogram.raw.types.RecentMeUrlUser",
+    0xb2da71d2: "hydrogram.raw.types.RecentMeUrlChat",
+    0xeb49081d: "hydrogram.raw.types.RecentMeUrlChatInvite",
+    0xbc0a57dc: "hydrogram.raw.types.RecentMeUrlStickerSet",
+    0xe0310d7: "hydrogram.raw.types.help.RecentMeUrls",
+    0x1cc6e91f: "hydrogram.raw.types.InputSingleMedia",
+    0xa6f8f452: "hydrogram.raw.types.WebAuthorization",
+    0xed56c9fc: "hydrogram.raw.types.account.WebAuthorizations",
+    0xa676a322: "hydrogram.raw.types.InputMessageID",
+    0xbad88395: "hydrogram.raw.types.InputMessageReplyTo",
+    0x86872538: "hydrogram.raw.types.InputMessagePinned",
+    0xacfa1a7e: "hydrogram.raw.types.InputMessageCallbackQuery",
+    0xfcaafeb7: "hydrogram.raw.types.InputDialogPeer",
+    0x64600527: "hydrogram.raw.types.InputDialogPeerFolder",
+    0xe56dbf05: "hydrogram.raw.types.DialogPeer",
+    0x514519e2: "hydrogram.raw.types.DialogPeerFolder",
+    0xd54b65d: "hydrogram.raw.types.messages.FoundStickerSetsNotModified",
+    0x8af09dd2: "hydrogram.raw.types.messages.FoundStickerSets",
+    0xf39b035c: "hydrogram.raw.types.FileHash",
+    0x75588b3f: "hydrogram.raw.types.InputClientProxy",
+    0xe3309f7f: "hydrogram.raw.types.help.TermsOfServiceUpdateEmpty",
+    0x28ecf961: "hydrogram.raw.types.help.TermsOfServiceUpdate",
+    0x3334b0f0: "hydrogram.raw.types.InputSecureFileUploaded",
+    0x5367e5be: "hydrogram.raw.types.InputSecureFile",
+    0x64199744: "hydrogram.raw.types.SecureFileEmpty",
+    0x7d09c27e: "hydrogram.raw.types.SecureFile",
+    0x8aeabec3: "hydrogram.raw.types.SecureData",
+    0x7d6099dd: "hydrogram.raw.types.SecurePlainPhone",
+    0x21ec5a5f: "hydrogram.raw.types.SecurePlainEmail",
+    0x9d2a81e3: "hydrogram.raw.types.SecureValueTypePersonalDetails",
+    0x3dac6a00: "hydrogram.raw.types.SecureValueTypePassport",
+    0x6e425c4: "hydrogram.raw.types.SecureValueTypeDriverLicense",
+    0xa0d0744b: "hydrogram.raw.types.SecureValueTypeIdentityCard",
+    0x99a48f23: "hydrogram.raw.types.SecureValueTypeInternalPassport",
+    0xcbe31e26: "hydrogram.raw.types.SecureValueTypeAddress",
+    0xfc36954e: "hydrogram.raw.types.SecureValueTypeUtilityBill",
+    0x89137c0d: "hydrogram.raw.types.SecureValueTypeBankStatement",
+    0x8b883488: "hydrogram.raw.types.SecureValueTypeRentalAgreement",
+    0x99e3806a: "hydrogram.raw.types.SecureValueTypePassportRegistration",
+    0xea02ec33: "hydrogram.raw.types.SecureValueTypeTemporaryRegistration",
+    0xb320aadb: "hydrogram.raw.types.SecureValueTypePhone",
+    0x8e3ca7ee: "hydrogram.raw.types.SecureValueTypeEmail",
+    0x187fa0ca: "hydrogram.raw.types.SecureValue",
+    0xdb21d0a7: "hydrogram.raw.types.InputSecureValue",
+    0xed1ecdb0: "hydrogram.raw.types.SecureValueHash",
+    0xe8a40bd9: "hydrogram.raw.types.SecureValueErrorData",
+    0xbe3dfa: "hydrogram.raw.types.SecureValueErrorFrontSide",
+    0x868a2aa5: "hydrogram.raw.types.SecureValueErrorReverseSide",
+    0xe537ced6: "hydrogram.raw.types.SecureValueErrorSelfie",
+    0x7a700873: "hydrogram.raw.types.SecureValueErrorFile",
+    0x666220e9: "hydrogram.raw.types.SecureValueErrorFiles",
+    0x869d758f: "hydrogram.raw.types.SecureValueError",
+    0xa1144770: "hydrogram.raw.types.SecureValueErrorTranslationFile",
+    0x34636dd8: "hydrogram.raw.types.SecureValueErrorTranslationFiles",
+    0x33f0ea47: "hydrogram.raw.types.SecureCredentialsEncrypted",
+    0xad2e1cd8: "hydrogram.raw.types.account.AuthorizationForm",
+    0x811f854f: "hydrogram.raw.types.account.SentEmailCode",
+    0x66afa166: "hydrogram.raw.types.help.DeepLinkInfoEmpty",
+    0x6a4ee832: "hydrogram.raw.types.help.DeepLinkInfo",
+    0x1142bd56: "hydrogram.raw.types.SavedPhoneContact",
+    0x4dba4501: "hydrogram.raw.types.account.Takeout",
+    0xd45ab096: "hydrogram.raw.types.PasswordKdfAlgoUnknown",
+    0x3a912d4a: "hydrogram.raw.types.PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow",
+    0x4a8537: "hydrogram.raw.types.SecurePasswordKdfAlgoUnknown",
+    0xbbf2dda0: "hydrogram.raw.types.SecurePasswordKdfAlgoPBKDF2HMACSHA512iter100000",
+    0x86471d92: "hydrogram.raw.types.SecurePasswordKdfAlgoSHA512",
+    0x1527bcac: "hydrogram.raw.types.SecureSecretSettings",
+    0x9880f658: "hydrogram.raw.types.InputCheckPasswordEmpty",
+    0xd27ff082: "hydrogram.raw.types.InputCheckPasswordSRP",
+    0x829d99da: "hydrogram.raw.types.SecureRequiredType",
+    0x27477b4: "hydrogram.raw.types.SecureRequiredTypeOneOf",
+    0xbfb9f457: "hydrogram.raw.types.help.PassportConfigNotModified",
+    0xa098d6af: "hydrogram.raw.types.help.PassportConfig",
+    0x1d1b1245: "hydrogram.raw.types.InputAppEvent",
+    0xc0de1bd9: "hydrogram.raw.types.JsonObjectValue",
+    0x3f6d7b68: "hydrogram.raw.types.JsonNull",
+    0xc7345e6a: "hydrogram.raw.types.JsonBool",
+    0x2be0dfa4: "hydrogram.raw.types.JsonNumber",
+    0xb71e767a: "hydrogram.raw.types.JsonString",
+    0xf7444763: "hydrogram.raw.types.JsonArray",
+    0x99c1d49d: "hydrogram.raw.types.JsonObject",
+    0x34566b6a: "hydrogram.raw.types.PageTableCell",
+    0xe0c0c5e5: "hydrogram.raw.types.PageTableRow",
+    0x6f747657: "hydrogram.raw.types.PageCaption",
+    0xb92fb6cd: "hydrogram.raw.types.PageListItemText",
+    0x25e073fc: "hydrogram.raw.types.PageListItemBlocks",
+    0x5e068047: "hydrogram.raw.types.PageListOrderedItemText",
+    0x98dd8936: "hydrogram.raw.types.PageListOrderedItemBlocks",
+    0xb390dc08: "hydrogram.raw.types.PageRelatedArticle",
+    0x98657f0d: "hydrogram.raw.types.Page",
+    0x8c05f1c9: "hydrogram.raw.types.help.SupportName",
+    0xf3ae2eed: "hydrogram.raw.types.help.UserInfoEmpty",
+    0x1eb3758: "hydrogram.raw.types.help.UserInfo",
+    0x6ca9c2e9: "hydrogram.raw.types.PollAnswer",
+    0x86e18161: "hydrogram.raw.types.Poll",
+    0x3b6ddad2: "hydrogram.raw.types.PollAnswerVoters",
+    0x7adf2420: "hydrogram.raw.types.PollResults",
+    0xf041e250: "hydrogram.raw.types.ChatOnlines",
+    0x47a971e0: "hydrogram.raw.types.StatsURL",
+    0x5fb224d5: "hydrogram.raw.types.ChatAdminRights",
+    0x9f120418: "hydrogram.raw.types.ChatBannedRights",
+    0xe630b979: "hydrogram.raw.types.InputWallPaper",
+    0x72091c80: "hydrogram.raw.types.InputWallPaperSlug",
+    0x967a462e: "hydrogram.raw.types.InputWallPaperNoFile",
+    0x1c199183: "hydrogram.raw.types.account.WallPapersNotModified",
+    0xcdc3858c: "hydrogram.raw.types.account.WallPapers",
+    0xad253d78: "hydrogram.raw.types.CodeSettings",
+    0x372efcd0: "hydrogram.raw.types.WallPaperSettings",
+    0xbaa57628: "hydrogram.raw.types.AutoDownloadSettings",
+    0x63cacf26: "hydrogram.raw.types.account.AutoDownloadSettings",
+    0xd5b3b9f9: "hydrogram.raw.types.EmojiKeyword",
+    0x236df622: "hydrogram.raw.types.EmojiKeywordDeleted",
+    0x5cc761bd: "hydrogram.raw.types.EmojiKeywordsDifference",
+    0xa575739d: "hydrogram.raw.types.EmojiURL",
+    0xb3fb5361: "hydrogram.raw.types.EmojiLanguage",
+    0xff544e65: "hydrogram.raw.types.Folder",
+    0xfbd2c296: "hydrogram.raw.types.InputFolderPeer",
+    0xe9baa668: "hydrogram.raw.types.FolderPeer",
+    0xe844ebff: "hydrogram.raw.types.messages.SearchCounter",
+    0x92d33a0e: "hydrogram.raw.types.UrlAuthResultRequest",
+    0x8f8c0e4e: "hydrogram.raw.types.UrlAuthResultAccepted",
+    0xa9d6db1f: "hydrogram.raw.types.UrlAuthResultDefault",
+    0xbfb5ad8b: "hydrogram.raw.types.ChannelLocationEmpty",
+    0x209b82db: "hydrogram.raw.types.ChannelLocation",
+    0xca461b5d: "hydrogram.raw.types.PeerLocated",
+    0xf8ec284b: "hydrogram.raw.types.PeerSelfLocated",
+    0xd072acb4: "hydrogram.raw.types.RestrictionReason",
+    0x3c5693e9: "hydrogram.raw.types.InputTheme",
+    0xf5890df1: "hydrogram.raw.types.InputThemeSlug",
+    0xa00e67d6: "hydrogram.raw.types.Theme",
+    0xf41eb622: "hydrogram.raw.types.account.ThemesNotModified",
+    0x9a3d8c6d: "hydrogram.raw.types.account.Themes",
+    0x629f1980: "hydrogram.raw.types.auth.LoginToken",
+    0x68e9916: "hydrogram.raw.types.auth.LoginTokenMigrateTo",
+    0x390d5c5e: "hydrogram.raw.types.auth.LoginTokenSuccess",
+    0x57e28221: "hydrogram.raw.types.account.ContentSettings",
+    0xa927fec5: "hydrogram.raw.types.messages.InactiveChats",
+    0xc3a12462: "hydrogram.raw.types.BaseThemeClassic",
+    0xfbd81688: "hydrogram.raw.types.BaseThemeDay",
+    0xb7b31ea8: "hydrogram.raw.types.BaseThemeNight",
+    0x6d5f77ee: "hydrogram.raw.types.BaseThemeTinted",
+    0x5b11125a: "hydrogram.raw.types.BaseThemeArctic",
+    0x8fde504f: "hydrogram.raw.types.InputThemeSettings",
+    0xfa58b6d4: "hydrogram.raw.types.ThemeSettings",
+    0x54b56617: "hydrogram.raw.types.WebPageAttributeTheme",
+    0x2e94c3e7: "hydrogram.raw.types.WebPageAttributeStory",
+    0x4899484e: "hydrogram.raw.types.messages.VotesList",
+    0xf568028a: "hydrogram.raw.types.BankCardOpenUrl",
+    0x3e24e573: "hydrogram.raw.types.payments.BankCardData",
+    0x7438f7e8: "hydrogram.raw.types.DialogFilter",
+    0x363293ae: "hydrogram.raw.types.DialogFilterDefault",
+    0xd64a04a8: "hydrogram.raw.types.DialogFilterChatlist",
+    0x77744d4a: "hydrogram.raw.types.DialogFilterSuggested",
+    0xb637edaf: "hydrogram.raw.types.StatsDateRangeDays",
+    0xcb43acde: "hydrogram.raw.types.StatsAbsValueAndPrev",
+    0xcbce2fe0: "hydrogram.raw.types.StatsPercentValue",
+    0x4a27eb2d: "hydrogram.raw.types.StatsGraphAsync",
+    0xbedc9822: "hydrogram.raw.types.StatsGraphError",
+    0x8ea464b6: "hydrogram.raw.types.StatsGraph",
+    0x396ca5fc: "hydrogram.raw.types.stats.BroadcastStats",
+    0x98f6ac75: "hydrogram.raw.types.help.PromoDataEmpty",
+    0x8c39793f: "hydrogram.raw.types.help.PromoData",
+    0xde33b094: "hydrogram.raw.types.VideoSize",
+    0xf85c413c: "hydrogram.raw.types.VideoSizeEmojiMarkup",
+    0xda082fe: "hydrogram.raw.types.VideoSizeStickerMarkup",
+    0x9d04af9b: "hydrogram.raw.types.StatsGroupTopPoster",
+    0xd7584c87: "hydrogram.raw.types.StatsGroupTopAdmin",
+    0x535f779d: "hydrogram.raw.types.StatsGroupTopInviter",
+    0xef7ff916: "hydrogram.raw.types.stats.MegagroupStats",
+    0x734c4ccb: "hydrogram.raw.types.GlobalPrivacySettings",
+    0x4203c5ef: "hydrogram.raw.types.help.CountryCode",
+    0xc3878e23: "hydrogram.raw.types.help.Country",
+    0x93cc1f32: "hydrogram.raw.types.help.CountriesListNotModified",
+    0x87d0759e: "hydrogram.raw.types.help.CountriesList",
+    0x455b853d: "hydrogram.raw.types.MessageViews",
+    0xb6c4f543: "hydrogram.raw.types.messages.MessageViews",
+    0xa6341782: "hydrogram.raw.types.messages.DiscussionMessage",
+    0xafbc09db: "hydrogram.raw.types.MessageReplyHeader",
+    0x9c98bfc1: "hydrogram.raw.types.MessageReplyStoryHeader",
+    0x83d60fc2: "hydrogram.raw.types.MessageReplies",
+    0xe8fd8014: "hydrogram.raw.types.PeerBlocked",
+    0x7fe91c14: "hydrogram.raw.types.stats.MessageStats",
+    0x7780bcb4: "hydrogram.raw.types.GroupCallDiscarded",
+    0xd597650c: "hydrogram.raw.types.GroupCall",
+    0xd8aa840f: "hydrogram.raw.types.InputGroupCall",
+    0xeba636fe: "hydrogram.raw.types.GroupCallParticipant",
+    0x9e727aad: "hydrogram.raw.types.phone.GroupCall",
+    0xf47751b6: "hydrogram.raw.types.phone.GroupParticipants",
+    0x3081ed9d: "hydrogram.raw.types.InlineQueryPeerTypeSameBotPM",
+    0x833c0fac: "hydrogram.raw.types.InlineQueryPeerTypePM",
+    0xd766c50a: "hydrogram.raw.types.InlineQueryPeerTypeChat",
+    0x5ec4be43: "hydrogram.raw.types.InlineQueryPeerTypeMegagroup",
+    0x6334ee9a: "hydrogram.raw.types.InlineQueryPeerTypeBroadcast",
+    0xe3b2d0c: "hydrogram.raw.types.InlineQueryPeerTypeBotPM",
+    0x1662af0b: "hydrogram.raw.types.messages.HistoryImport",
+    0x5e0fb7b9: "hydrogram.raw.types.messages.HistoryImportParsed",
+    0xef8d3e6c: "hydrogram.raw.types.messages.AffectedFoundMessages",
+    0x8c5adfd9: "hydrogram.raw.types.ChatInviteImporter",
+    0xbdc62dcc: "hydrogram.raw.types.messages.ExportedChatInvites",
+    0x1871be50: "hydrogram.raw.types.messages.ExportedChatInvite",
+    0x222600ef: "hydrogram.raw.types.messages.ExportedChatInviteReplaced",
+    0x81b6b00a: "hydrogram.raw.types.messages.ChatInviteImporters",
+    0xf2ecef23: "hydrogram.raw.types.ChatAdminWithInvites",
+    0xb69b72d7: "hydrogram.raw.types.messages.ChatAdminsWithInvites",
+    0xa24de717: "hydrogram.raw.types.messages.CheckedHistoryImportPeer",
+    0xafe5623f: "hydrogram.raw.types.phone.JoinAsPeers",
+    0x204bd158: "hydrogram.raw.types.phone.ExportedGroupCallInvite",
+    0xdcb118b7: "hydrogram.raw.types.GroupCallParticipantVideoSourceGroup",
+    0x67753ac8: "hydrogram.raw.types.GroupCallParticipantVideo",
+    0x85fea03f: "hydrogram.raw.types.stickers.SuggestedShortName",
+    0x2f6cb2ab: "hydrogram.raw.types.BotCommandScopeDefault",
+    0x3c4f04d8: "hydrogram.raw.types.BotCommandScopeUsers",
+    0x6fe1a881: "hydrogram.raw.types.BotCommandScopeChats",
+    0xb9aa606a: "hydrogram.raw.types.BotCommandScopeChatAdmins",
+    0xdb9d897d: "hydrogram.raw.types.BotCommandScopePeer",
+    0x3fd863d1: "hydrogram.raw.types.BotCommandScopePeerAdmins",
+    0xa1321f3: "hydrogram.raw.types.BotCommandScopePeerUser",
+    0xe3779861: "hydrogram.raw.types.account.ResetPasswordFailedWait",
+    0xe9effc7d: "hydrogram.raw.types.account.ResetPasswordRequestedWait",
+    0xe926d63e: "hydrogram.raw.types.account.ResetPasswordOk",
+    0xed5383f7: "hydrogram.raw.types.SponsoredMessage",
+    0xc9ee1d87: "hydrogram.raw.types.messages.SponsoredMessages",
+    0x1839490f: "hydrogram.raw.types.messages.SponsoredMessagesEmpty",
+    0xc9b0539f: "hydrogram.raw.types.SearchResultsCalendarPeriod",
+    0x147ee23c: "hydrogram.raw.types.messages.SearchResultsCalendar",
+    0x7f648b67: "hydrogram.raw.types.SearchResultPosition",
+    0x53b22baf: "hydrogram.raw.types.messages.SearchResultsPositions",
+    0xf496b0c6: "hydrogram.raw.types.channels.SendAsPeers",
+    0x3b6d152e: "hydrogram.raw.types.users.UserFull",
+    0x6880b94d: "hydrogram.raw.types.messages.PeerSettings",
+    0xc3a2835f: "hydrogram.raw.types.auth.LoggedOut",
+    0xa3d1cb80: "hydrogram.raw.types.ReactionCount",
+    0x4f2b9479: "hydrogram.raw.types.MessageReactions",
+    0x31bd492d: "hydrogram.raw.types.messages.MessageReactionsList",
+    0xc077ec01: "hydrogram.raw.types.AvailableReaction",
+    0x9f071957: "hydrogram.raw.types.messages.AvailableReactionsNotModified",
+    0x768e3aad: "hydrogram.raw.types.messages.AvailableReactions",
+    0x8c79b63c: "hydrogram.raw.types.MessagePeerReaction",
+    0x80eb48af: "hydrogram.raw.types.GroupCallStreamChannel",
+    0xd0e482b2: "hydrogram.raw.types.phone.GroupCallStreamChannels",
+    0x2dbf3432: "hydrogram.raw.types.phone.GroupCallStreamRtmpUrl",
+    0x4576f3f0: "hydrogram.raw.types.AttachMenuBotIconColor",
+    0xb2a7386b: "hydrogram.raw.types.AttachMenuBotIcon",
+    0xd90d8dfe: "hydrogram.raw.types.AttachMenuBot",
+    0xf1d88a5c: "hydrogram.raw.types.AttachMenuBotsNotModified",
+    0x3c4301c0: "hydrogram.raw.types.AttachMenuBots",
+    0x93bf667f: "hydrogram.raw.types.AttachMenuBotsBot",
+    0xc14557c: "hydrogram.raw.types.WebViewResultUrl",
+    0x882f76bb: "hydrogram.raw.types.SimpleWebViewResultUrl",
+    0xc94511c: "hydrogram.raw.types.WebViewMessageSent",
+    0x7533a588: "hydrogram.raw.types.BotMenuButtonDefault",
+    0x4258c205: "hydrogram.raw.types.BotMenuButtonCommands",
+    0xc7b57ce6: "hydrogram.raw.types.BotMenuButton",
+    0xfbf6e8b1: "hydrogram.raw.types.account.SavedRingtonesNotModified",
+    0xc1e92cc5: "hydrogram.raw.types.account.SavedRingtones",
+    0x97e8bebe: "hydrogram.raw.types.NotificationSoundDefault",
+    0x6f0c34df: "hydrogram.raw.types.NotificationSoundNone",
+    0x830b9ae4: "hydrogram.raw.types.NotificationSoundLocal",
+    0xff6c8049: "hydrogram.raw.types.NotificationSoundRingtone",
+    0xb7263f6d: "hydrogram.raw.types.account.SavedRingtone",
+    0x1f307eb7: "hydrogram.raw.types.account.SavedRingtoneConverted",
+    0x7d6be90e: "hydrogram.raw.types.AttachMenuPeerTypeSameBotPM",
+    0xc32bfa1a: "hydrogram.raw.types.AttachMenuPeerTypeBotPM",
+    0xf146d31f: "hydrogram.raw.types.AttachMenuPeerTypePM",
+    0x509113f: "hydrogram.raw.types.AttachMenuPeerTypeChat",
+    0x7bfbdefc: "hydrogram.raw.types.AttachMenuPeerTypeBroadcast",
+    0xc5b56859: "hydrogram.raw.types.InputInvoiceMessage",
+    0xc326caef: "hydrogram.raw.types.InputInvoiceSlug",
+    0x98986c0d: "hydrogram.raw.types.InputInvoicePremiumGiftCode",
+    0xaed0cbd9: "hydrogram.raw.types.payments.ExportedInvoice",
+    0xcfb9d957: "hydrogram.raw.types.messages.TranscribedAudio",
+    0x5334759c: "hydrogram.raw.types.help.PremiumPromo",
+    0xa6751e66: "hydrogram.raw.types.InputStorePaymentPremiumSubscription",
+    0x616f7fe8: "hydrogram.raw.types.InputStorePaymentGiftPremium",
+    0xa3805f3f: "hydrogram.raw.types.InputStorePaymentPremiumGiftCode",
+    0x160544ca: "hydrogram.raw.types.InputStorePaymentPremiumGiveaway",
+    0x74c34319: "hydrogram.raw.types.PremiumGiftOption",
+    0x88f8f21b: "hydrogram.raw.types.PaymentFormMethod",
+    0x2de11aae: "hydrogram.raw.types.EmojiStatusEmpty",
+    0x929b619d: "hydrogram.raw.types.EmojiStatus",
+    0xfa30a8c7: "hydrogram.raw.types.EmojiStatusUntil",
+    0xd08ce645: "hydrogram.raw.types.account.EmojiStatusesNotModified",
+    0x90c467d1: "hydrogram.raw.types.account.EmojiStatuses",
+    0x79f5d419: "hydrogram.raw.types.ReactionEmpty",
+    0x1b2286b8: "hydrogram.raw.types.ReactionEmoji",
+    0x8935fc73: "hydrogram.raw.types.ReactionCustomEmoji",
+    0xeafc32bc: "hydrogram.raw.types.ChatReactionsNone",
+    0x52928bca: "hydrogram.raw.types.ChatReactionsAll",
+    0x661d4037: "hydrogram.raw.types.ChatReactionsSome",
+    0xb06fdbdf: "hydrogram.raw.types.messages.ReactionsNotModified",
+    0xeafdf716: "hydrogram.raw.types.messages.Reactions",
+    0x4345be73: "hydrogram.raw.types.EmailVerifyPurposeLoginSetup",
+    0x527d22eb: "hydrogram.raw.types.EmailVerifyPurposeLoginChange",
+    0xbbf51685: "hydrogram.raw.types.EmailVerifyPurposePassport",
+    0x922e55a9: "hydrogram.raw.types.EmailVerificationCode",
+    0xdb909ec2: "hydrogram.raw.types.EmailVerificationGoogle",
+    0x96d074fd: "hydrogram.raw.types.EmailVerificationApple",
+    0x2b96cd1b: "hydrogram.raw.types.account.EmailVerified",
+    0xe1bb0d61: "hydrogram.raw.types.account.EmailVerifiedLogin",
+    0x5f2d1df2: "hydrogram.raw.types.PremiumSubscriptionOption",
+    0xb81c7034: "hydrogram.raw.types.SendAsPeer",
+    0xad628cc8: "hydrogram.raw.types.MessageExtendedMediaPreview",
+    0xee479c64: "hydrogram.raw.types.MessageExtendedMedia",
+    0xfcfeb29c: "hydrogram.raw.types.StickerKeyword",
+    0xb4073647: "hydrogram.raw.types.Username",
+    0x23f109b: "hydrogram.raw.types.ForumTopicDeleted",
+    0x71701da9: "hydrogram.raw.types.ForumTopic",
+    0x367617d3: "hydrogram.raw.types.messages.ForumTopics",
+    0x43b46b20: "hydrogram.raw.types.DefaultHistoryTTL",
+    0x41bf109b: "hydrogram.raw.types.ExportedContactToken",
+    0x5f3b8a00: "hydrogram.raw.types.RequestPeerTypeUser",
+    0xc9f06e1b: "hydrogram.raw.types.RequestPeerTypeChat",
+    0x339bef6c: "hydrogram.raw.types.RequestPeerTypeBroadcast",
+    0x481eadfa: "hydrogram.raw.types.EmojiListNotModified",
+    0x7a1e11d1: "hydrogram.raw.types.EmojiList",
+    0x7a9abda9: "hydrogram.raw.types.EmojiGroup",
+    0x6fb4ad87: "hydrogram.raw.types.messages.EmojiGroupsNotModified",
+    0x881fb94b: "hydrogram.raw.types.messages.EmojiGroups",
+    0x751f3146: "hydrogram.raw.types.TextWithEntities",
+    0x33db32f8: "hydrogram.raw.types.messages.TranslateResult",
+    0xc84834ce: "hydrogram.raw.types.AutoSaveSettings",
+    0x81602d47: "hydrogram.raw.types.AutoSaveException",
+    0x4c3e069d: "hydrogram.raw.types.account.AutoSaveSettings",
+    0x7cde641d: "hydrogram.raw.types.help.AppConfigNotModified",
+    0xdd18782e: "hydrogram.raw.types.help.AppConfig",
+    0xa920bd7a: "hydrogram.raw.types.InputBotAppID",
+    0x908c0407: "hydrogram.raw.types.InputBotAppShortName",
+    0x5da674b7: "hydrogram.raw.types.BotAppNotModified",
+    0x95fcd1d6: "hydrogram.raw.types.BotApp",
+    0xeb50adf5: "hydrogram.raw.types.messages.BotApp",
+    0x3c1b4f0d: "hydrogram.raw.types.AppWebViewResultUrl",
+    0xb57295d5: "hydrogram.raw.types.InlineBotWebView",
+    0x4a4ff172: "hydrogram.raw.types.ReadParticipantDate",
+    0xf3e0da33: "hydrogram.raw.types.InputChatlistDialogFilter",
+    0xc5181ac: "hydrogram.raw.types.ExportedChatlistInvite",
+    0x10e6e3a6: "hydrogram.raw.types.chatlists.ExportedChatlistInvite",
+    0x10ab6dc7: "hydrogram.raw.types.chatlists.ExportedInvites",
+    0xfa87f659: "hydrogram.raw.types.chatlists.ChatlistInviteAlready",
+    0x1dcd839d: "hydrogram.raw.types.chatlists.ChatlistInvite",
+    0x93bd878d: "hydrogram.raw.types.chatlists.ChatlistUpdates",
+    0xe8a775b0: "hydrogram.raw.types.bots.BotInfo",
+    0xb6cc2d5c: "hydrogram.raw.types.MessagePeerVote",
+    0x74cda504: "hydrogram.raw.types.MessagePeerVoteInputOption",
+    0x4628f6e6: "hydrogram.raw.types.MessagePeerVoteMultiple",
+    0x3db8ec63: "hydrogram.raw.types.SponsoredWebPage",
+    0x8d595cd6: "hydrogram.raw.types.StoryViews",
+    0x51e6ee4f: "hydrogram.raw.types.StoryItemDeleted",
+    0xffadc913: "hydrogram.raw.types.StoryItemSkipped",
+    0xaf6365a1: "hydrogram.raw.types.StoryItem",
+    0x1158fe3e: "hydrogram.raw.types.stories.AllStoriesNotModified",
+    0x6efc5e81: "hydrogram.raw.types.stories.AllStories",
+    0x5dd8c3c8: "hydrogram.raw.types.stories.Stories",
+    0xb0bdeac5: "hydrogram.raw.types.StoryView",
+    0x9083670b: "hydrogram.raw.types.StoryViewPublicForward",
+    0xbd74cf49: "hydrogram.raw.types.StoryViewPublicRepost",
+    0x59d78fc5: "hydrogram.raw.types.stories.StoryViewsList",
+    0xde9eed1d: "hydrogram.raw.types.stories.StoryViews",
+    0x22c0f6d5: "hydrogram.raw.types.InputReplyToMessage",
+    0x15b0f283: "hydrogram.raw.types.InputReplyToStory",
+    0x3fc9053b: "hydrogram.raw.types.ExportedStoryLink",
+    0x712e27fd: "hydrogram.raw.types.StoriesStealthMode",
+    0x3d1ea4e: "hydrogram.raw.types.MediaAreaCoordinates",
+    0xbe82db9c: "hydrogram.raw.types.MediaAreaVenue",
+    0xb282217f: "hydrogram.raw.types.InputMediaAreaVenue",
+    0xdf8b3b22: "hydrogram.raw.types.MediaAreaGeoPoint",
+    0x14455871: "hydrogram.raw.types.MediaAreaSuggestedReaction",
+    0x770416af: "hydrogram.raw.types.MediaAreaChannelPost",
+    0x2271f2bf: "hydrogram.raw.types.InputMediaAreaChannelPost",
+    0x9a35e999: "hydrogram.raw.types.PeerStories",
+    0xcae68768: "hydrogram.raw.types.stories.PeerStories",
+    0xfd5e12bd: "hydrogram.raw.types.messages.WebPage",
+    0x257e962b: "hydrogram.raw.types.PremiumGiftCodeOption",
+    0x284a1096: "hydrogram.raw.types.payments.CheckedGiftCode",
+    0x4367daa0: "hydrogram.raw.types.payments.GiveawayInfo",
+    0xcd5570: "hydrogram.raw.types.payments.GiveawayInfoResults",
+    0xb2539d54: "hydrogram.raw.types.PrepaidGiveaway",
+    0x2a1c8c71: "hydrogram.raw.types.Boost",
+    0x86f8613c: "hydrogram.raw.types.premium.BoostsList",
+    0xc448415c: "hydrogram.raw.types.MyBoost",
+    0x9ae228e2: "hydrogram.raw.types.premium.MyBoosts",
+    0x4959427a: "hydrogram.raw.types.premium.BoostsStatus",
+    0xb826e150: "hydrogram.raw.types.StoryFwdHeader",
+    0xe7058e7f: "hydrogram.raw.types.PostInteractionCountersMessage",
+    0x8a480e27: "hydrogram.raw.types.PostInteractionCountersStory",
+    0x50cd067c: "hydrogram.raw.types.stats.StoryStats",
+    0x1f2bf4a: "hydrogram.raw.types.PublicForwardMessage",
+    0xedf3add0: "hydrogram.raw.types.PublicForwardStory",
+    0x93037e20: "hydrogram.raw.types.stats.PublicForwards",
+    0xb54b5acf: "hydrogram.raw.types.PeerColor",
+    0x26219a58: "hydrogram.raw.types.help.PeerColorSet",
+    0x767d61eb: "hydrogram.raw.types.help.PeerColorProfileSet",
+    0xef8430ab: "hydrogram.raw.types.help.PeerColorOption",
+    0x2ba1f5ce: "hydrogram.raw.types.help.PeerColorsNotModified",
+    0xf8ed08: "hydrogram.raw.types.help.PeerColors",
+    0x6090d6d5: "hydrogram.raw.types.StoryReaction",
+    0xbbab2643: "hydrogram.raw.types.StoryReactionPublicForward",
+    0xcfcd0f13: "hydrogram.raw.types.StoryReactionPublicRepost",
+    0xaa5f789c: "hydrogram.raw.types.stories.StoryReactionsList",
+    0xbd87cb6c: "hydrogram.raw.types.SavedDialog",
+    0xf83ae221: "hydrogram.raw.types.messages.SavedDialogs",
+    0x44ba9dd9: "hydrogram.raw.types.messages.SavedDialogsSlice",
+    0xc01f6fe8: "hydrogram.raw.types.messages.SavedDialogsNotModified",
+    0xcb9f372d: "hydrogram.raw.functions.InvokeAfterMsg",
+    0x3dc4b4f0: "hydrogram.raw.functions.InvokeAfterMsgs",
+    0xc1cd5ea9: "hydrogram.raw.functions.InitConnection",
+    0xda9b0d0d: "hydrogram.raw.functions.InvokeWithLayer",
+    0xbf9459b7: "hydrogram.raw.functions.InvokeWithoutUpdates",
+    0x365275f2: "hydrogram.raw.functions.InvokeWithMessagesRange",
+    0xaca9fd2e: "hydrogram.raw.functions.InvokeWithTakeout",
+    0xa677244f: "hydrogram.raw.functions.auth.SendCode",
+    0x80eee427: "hydrogram.raw.functions.auth.SignUp",
+    0x8d52a951: "hydrogram.raw.functions.auth.SignIn",
+    0x3e72ba19: "hydrogram.raw.functions.auth.LogOut",
+    0x9fab0d1a: "hydrogram.raw.functions.auth.ResetAuthorizations",
+    0xe5bfffcd: "hydrogram.raw.functions.auth.ExportAuthorization",
+    0xa57a7dad: "hydrogram.raw.functions.auth.ImportAuthorization",
+    0xcdd42a05: "hydrogram.raw.functions.auth.BindTempAuthKey",
+    0x67a3ff2c: "hydrogram.raw.functions.auth.ImportBotAuthorization",
+    0xd18b4d16: "hydrogram.raw.functions.auth.CheckPassword",
+    0xd897bc66: "hydrogram.raw.functions.auth.RequestPasswordRecovery",
+    0x37096c70: "hydrogram.raw.functions.auth.RecoverPassword",
+    0x3ef1a9bf: "hydrogram.raw.functions.auth.ResendCode",
+    0x1f040578: "hydrogram.raw.functions.auth.CancelCode",
+    0x8e48a188: "hydrogram.raw.functions.auth.DropTempAuthKeys",
+    0xb7e085fe: "hydrogram.raw.functions.auth.ExportLoginToken",
+    0x95ac5ce4: "hydrogram.raw.functions.auth.ImportLoginToken",
+    0xe894ad4d: "hydrogram.raw.functions.auth.AcceptLoginToken",
+    0xd36bf79: "hydrogram.raw.functions.auth.CheckRecoveryPassword",
+    0x2db873a9: "hydrogram.raw.functions.auth.ImportWebTokenAuthorization",
+    0x89464b50: "hydrogram.raw.functions.auth.RequestFirebaseSms",
+    0x7e960193: "hydrogram.raw.functions.auth.ResetLoginEmail",
+    0xec86017a: "hydrogram.raw.functions.account.RegisterDevice",
+    0x6a0d3206: "hydrogram.raw.functions.account.UnregisterDevice",
+    0x84be5b93: "hydrogram.raw.functions.account.UpdateNotifySettings",
+    0x12b3ad31: "hydrogram.raw.functions.account.GetNotifySettings",
+    0xdb7e1747: "hydrogram.raw.functions.account.ResetNotifySettings",
+    0x78515775: "hydrogram.raw.functions.account.UpdateProfile",
+    0x6628562c: "hydrogram.raw.functions.account.UpdateStatus",
+    0x7967d36: "hydrogram.raw.functions.account.GetWallPapers",
+    0xc5ba3d86: "hydrogram.raw.functions.account.ReportPeer",
+    0x2714d86c: "hydrogram.raw.functions.account.CheckUsername",
+    0x3e0bdd7c: "hydrogram.raw.functions.account.UpdateUsername",
+    0xdadbc950: "hydrogram.raw.functions.account.GetPrivacy",
+    0xc9f81ce8: "hydrogram.raw.functions.account.SetPrivacy",
+    0xa2c0cf74: "hydrogram.raw.functions.account.DeleteAccount",
+    0x8fc711d: "hydrogram.raw.functions.account.GetAccountTTL",
+    0x2442485e: "hydrogram.raw.functions.account.SetAccountTTL",
+    0x82574ae5: "hydrogram.raw.functions.account.SendChangePhoneCode",
+    0x70c32edb: "hydrogram.raw.functions.account.ChangePhone",
+    0x38df3532: "hydrogram.raw.functions.account.UpdateDeviceLocked",
+    0xe320c158: "hydrogram.raw.functions.account.GetAuthorizations",
+    0xdf77f3bc: "hydrogram.raw.functions.account.ResetAuthorization",
+    0x548a30f5: "hydrogram.raw.functions.account.GetPassword",
+    0x9cd4eaf9: "hydrogram.raw.functions.account.GetPasswordSettings",
+    0xa59b102f: "hydrogram.raw.functions.account.UpdatePasswordSettings",
+    0x1b3faa88: "hydrogram.raw.functions.account.SendConfirmPhoneCode",
+    0x5f2178c3: "hydrogram.raw.functions.account.ConfirmPhone",
+    0x449e0b51: "hydrogram.raw.functions.account.GetTmpPassword",
+    0x182e6d6f: "hydrogram.raw.functions.account.GetWebAuthorizations",
+    0x2d01b9ef: "hydrogram.raw.functions.account.ResetWebAuthorization",
+    0x682d2594: "hydrogram.raw.functions.account.ResetWebAuthorizations",
+    0xb288bc7d: "hydrogram.raw.functions.account.GetAllSecureValues",
+    0x73665bc2: "hydrogram.raw.functions.account.GetSecureValue",
+    0x899fe31d: "hydrogram.raw.functions.account.SaveSecureValue",
+    0xb880bc4b: "hydrogram.raw.functions.account.DeleteSecureValue",
+    0xa929597a: "hydrogram.raw.functions.account.GetAuthorizationForm",
+    0xf3ed4c73: "hydrogram.raw.functions.account.AcceptAuthorization",
+    0xa5a356f9: "hydrogram.raw.functions.account.SendVerifyPhoneCode",
+    0x4dd3a7f6: "hydrogram.raw.functions.account.VerifyPhone",
+    0x98e037bb: "hydrogram.raw.functions.account.SendVerifyEmailCode",
+    0x32da4cf: "hydrogram.raw.functions.account.VerifyEmail",
+    0x8ef3eab0: "hydrogram.raw.functions.account.InitTakeoutSession",
+    0x1d2652ee: "hydrogram.raw.functions.account.FinishTakeoutSession",
+    0x8fdf1920: "hydrogram.raw.functions.account.ConfirmPasswordEmail",
+    0x7a7f2a15: "hydrogram.raw.functions.account.ResendPasswordEmail",
+    0xc1cbd5b6: "hydrogram.raw.functions.account.CancelPasswordEmail",
+    0x9f07c728: "hydrogram.raw.functions.account.GetContactSignUpNotification",
+    0xcff43f61: "hydrogram.raw.functions.account.SetContactSignUpNotification",
+    0x53577479: "hydrogram.raw.functions.account.GetNotifyExceptions",
+    0xfc8ddbea: "hydrogram.raw.functions.account.GetWallPaper",
+    0xe39a8f03: "hydrogram.raw.functions.account.UploadWallPaper",
+    0x6c5a5b37: "hydrogram.raw.functions.account.SaveWallPaper",
+    0xfeed5769: "hydrogram.raw.functions.account.InstallWallPaper",
+    0xbb3b9804: "hydrogram.raw.functions.account.ResetWallPapers",
+    0x56da0b3f: "hydrogram.raw.functions.account.GetAutoDownloadSettings",
+    0x76f36233: "hydrogram.raw.functions.account.SaveAutoDownloadSettings",
+    0x1c3db333: "hydrogram.raw.functions.account.UploadTheme",
+    0x652e4400: "hydrogram.raw.functions.account.CreateTheme",
+    0x2bf40ccc: "hydrogram.raw.functions.account.UpdateTheme",
+    0xf257106c: "hydrogram.raw.functions.account.SaveTheme",
+    0xc727bb3b: "hydrogram.raw.functions.account.InstallTheme",
+    0x3a5869ec: "hydrogram.raw.functions.account.GetTheme",
+    0x7206e458: "hydrogram.raw.functions.account.GetThemes",
+    0xb574b16b: "hydrogram.raw.functions.account.SetContentSettings",
+    0x8b9b4dae: "hydrogram.raw.functions.account.GetContentSettings",
+    0x65ad71dc: "hydrogram.raw.functions.account.GetMultiWallPapers",
+    0xeb2b4cf6: "hydrogram.raw.functions.account.GetGlobalPrivacySettings",
+    0x1edaaac2: "hydrogram.raw.functions.account.SetGlobalPrivacySettings",
+    0xfa8cc6f5: "hydrogram.raw.functions.account.ReportProfilePhoto",
+    0x9308ce1b: "hydrogram.raw.functions.account.ResetPassword",
+    0x4c9409f6: "hydrogram.raw.functions.account.DeclinePasswordReset",
+    0xd638de89: "hydrogram.raw.functions.account.GetChatThemes",
+    0xbf899aa0: "hydrogram.raw.functions.account.SetAuthorizationTTL",
+    0x40f48462: "hydrogram.raw.functions.account.ChangeAuthorizationSettings",
+    0xe1902288: "hydrogram.raw.functions.account.GetSavedRingtones",
+    0x3dea5b03: "hydrogram.raw.functions.account.SaveRingtone",
+    0x831a83a2: "hydrogram.raw.functions.account.UploadRingtone",
+    0xfbd3de6b: "hydrogram.raw.functions.account.UpdateEmojiStatus",
+    0xd6753386: "hydrogram.raw.functions.account.GetDefaultEmojiStatuses",
+    0xf578105: "hydrogram.raw.functions.account.GetRecentEmojiStatuses",
+    0x18201aae: "hydrogram.raw.functions.account.ClearRecentEmojiStatuses",
+    0xef500eab: "hydrogram.raw.functions.account.ReorderUsernames",
+    0x58d6b376: "hydrogram.raw.functions.account.ToggleUsername",
+    0xe2750328: "hydrogram.raw.functions.account.GetDefaultProfilePhotoEmojis",
+    0x915860ae: "hydrogram.raw.functions.account.GetDefaultGroupPhotoEmojis",
+    0xadcbbcda: "hydrogram.raw.functions.account.GetAutoSaveSettings",
+    0xd69b8361: "hydrogram.raw.functions.account.SaveAutoSaveSettings",
+    0x53bc0020: "hydrogram.raw.functions.account.DeleteAutoSaveExceptions",
+    0xca8ae8ba: "hydrogram.raw.functions.account.InvalidateSignInCodes",
+    0x7cefa15d: "hydrogram.raw.functions.account.UpdateColor",
+    0xa60ab9ce: "hydrogram.raw.functions.account.GetDefaultBackgroundEmojis",
+    0x7727a7d5: "hydrogram.raw.functions.account.GetChannelDefaultEmojiStatuses",
+    0x35a9e0d5: "hydrogram.raw.functions.account.GetChannelRestrictedStatusEmojis",
+    0xd91a548: "hydrogram.raw.functions.users.GetUsers",
+    0xb60f5918: "hydrogram.raw.functions.users.GetFullUser",
+    0x90c894b5: "hydrogram.raw.functions.users.SetSecureValueErrors",
+    0x7adc669d: "hydrogram.raw.functions.contacts.GetContactIDs",
+    0xc4a353ee: "hydrogram.raw.functions.contacts.GetStatuses",
+    0x5dd69e12: "hydrogram.raw.functions.contacts.GetContacts",
+    0x2c800be5: "hydrogram.raw.functions.contacts.ImportContacts",
+    0x96a0e00: "hydrogram.raw.functions.contacts.DeleteContacts",
+    0x1013fd9e: "hydrogram.raw.functions.contacts.DeleteByPhones",
+    0x2e2e8734: "hydrogram.raw.functions.contacts.Block",
+    0xb550d328: "hydrogram.raw.functions.contacts.Unblock",
+    0x9a868f80: "hydrogram.raw.functions.contacts.GetBlocked",
+    0x11f812d8: "hydrogram.raw.functions.contacts.Search",
+    0xf93ccba3: "hydrogram.raw.functions.contacts.ResolveUsername",
+    0x973478b6: "hydrogram.raw.functions.contacts.GetTopPeers",
+    0x1ae373ac: "hydrogram.raw.functions.contacts.ResetTopPeerRating",
+    0x879537f1: "hydrogram.raw.functions.contacts.ResetSaved",
+    0x82f1e39f: "hydrogram.raw.functions.contacts.GetSaved",
+    0x8514bdda: "hydrogram.raw.functions.contacts.ToggleTopPeers",
+    0xe8f463d0: "hydrogram.raw.functions.contacts.AddContact",
+    0xf831a20f: "hydrogram.raw.functions.contacts.AcceptContact",
+    0xd348bc44: "hydrogram.raw.functions.contacts.GetLocated",
+    0x29a8962c: "hydrogram.raw.functions.contacts.BlockFromReplies",
+    0x8af94344: "hydrogram.raw.functions.contacts.ResolvePhone",
+    0xf8654027: "hydrogram.raw.functions.contacts.ExportContactToken",
+    0x13005788: "hydrogram.raw.functions.contacts.ImportContactToken",
+    0xba6705f0: "hydrogram.raw.functions.contacts.EditCloseFriends",
+    0x94c65c76: "hydrogram.raw.functions.contacts.SetBlocked",
+    0x63c66506: "hydrogram.raw.functions.messages.GetMessages",
+    0xa0f4cb4f: "hydrogram.raw.functions.messages.GetDialogs",
+    0x4423e6c5: "hydrogram.raw.functions.messages.GetHistory",
+    0xa7b4e929: "hydrogram.raw.functions.messages.Search",
+    0xe306d3a: "hydrogram.raw.functions.messages.ReadHistory",
+    0xb08f922a: "hydrogram.raw.functions.messages.DeleteHistory",
+    0xe58e95d2: "hydrogram.raw.functions.messages.DeleteMessages",
+    0x5a954c0: "hydrogram.raw.functions.messages.ReceivedMessages",
+    0x58943ee2: "hydrogram.raw.functions.messages.SetTyping",
+    0x280d096f: "hydrogram.raw.functions.messages.SendMessage",
+    0x72ccc23d: "hydrogram.raw.functions.messages.SendMedia",
+    0xc661bbc4: "hydrogram.raw.functions.messages.ForwardMessages",
+    0xcf1592db: "hydrogram.raw.functions.messages.ReportSpam",
+    0xefd9a6a2: "hydrogram.raw.functions.messages.GetPeerSettings",
+    0x8953ab4e: "hydrogram.raw.functions.messages.Report",
+    0x49e9528f: "hydrogram.raw.functions.messages.GetChats",
+    0xaeb00b34: "hydrogram.raw.functions.messages.GetFullChat",
+    0x73783ffd: "hydrogram.raw.functions.messages.EditChatTitle",
+    0x35ddd674: "hydrogram.raw.functions.messages.EditChatPhoto",
+    0xf24753e3: "hydrogram.raw.functions.messages.AddChatUser",
+    0xa2185cab: "hydrogram.raw.functions.messages.DeleteChatUser",
+    0x34a818: "hydrogram.raw.functions.messages.CreateChat",
+    0x26cf8950: "hydrogram.raw.functions.messages.GetDhConfig",
+    0xf64daf43: "hydrogram.raw.functions.messages.RequestEncryption",
+    0x3dbc0415: "hydrogram.raw.functions.messages.AcceptEncryption",
+    0xf393aea0: "hydrogram.raw.functions.messages.DiscardEncryption",
+    0x791451ed: "hydrogram.raw.functions.messages.SetEncryptedTyping",
+    0x7f4b690a: "hydrogram.raw.functions.messages.ReadEncryptedHistory",
+    0x44fa7a15: "hydrogram.raw.functions.messages.SendEncrypted",
+    0x5559481d: "hydrogram.raw.functions.messages.SendEncryptedFile",
+    0x32d439a4: "hydrogram.raw.functions.messages.SendEncryptedService",
+    0x55a5bb66: "hydrogram.raw.functions.messages.ReceivedQueue",
+    0x4b0c8c0f: "hydrogram.raw.functions.messages.ReportEncryptedSpam",
+    0x36a73f77: "hydrogram.raw.functions.messages.ReadMessageContents",
+    0xd5a5d3a1: "hydrogram.raw.functions.messages.GetStickers",
+    0xb8a0a1a8: "hydrogram.raw.functions.messages.GetAllStickers",
+    0x8b68b0cc: "hydrogram.raw.functions.messages.GetWebPagePreview",
+    0xa02ce5d5: "hydrogram.raw.functions.messages.ExportChatInvite",
+    0x3eadb1bb: "hydrogram.raw.functions.messages.CheckChatInvite",
+    0x6c50051c: "hydrogram.raw.functions.messages.ImportChatInvite",
+    0xc8a0ec74: "hydrogram.raw.functions.messages.GetStickerSet",
+    0xc78fe460: "hydrogram.raw.functions.messages.InstallStickerSet",
+    0xf96e55de: "hydrogram.raw.functions.messages.UninstallStickerSet",
+    0xe6df7378: "hydrogram.raw.functions.messages.StartBot",
+    0x5784d3e1: "hydrogram.raw.functions.messages.GetMessagesViews",
+    0xa85bd1c2: "hydrogram.raw.functions.messages.EditChatAdmin",
+    0xa2875319: "hydrogram.raw.functions.messages.MigrateChat",
+    0x4bc6589a: "hydrogram.raw.functions.messages.SearchGlobal",
+    0x78337739: "hydrogram.raw.functions.messages.ReorderStickerSets",
+    0xb1f2061f: "hydrogram.raw.functions.messages.GetDocumentByHash",
+    0x5cf09635: "hydrogram.raw.functions.messages.GetSavedGifs",
+    0x327a30cb: "hydrogram.raw.functions.messages.SaveGif",
+    0x514e999d: "hydrogram.raw.functions.messages.GetInlineBotResults",
+    0xbb12a419: "hydrogram.raw.functions.messages.SetInlineBotResults",
+    0xf7bc68ba: "hydrogram.raw.functions.messages.SendInlineBotResult",
+    0xfda68d36: "hydrogram.raw.functions.messages.GetMessageEditData",
+    0x48f71778: "hydrogram.raw.functions.messages.EditMessage",
+    0x83557dba: "hydrogram.raw.functions.messages.EditInlineBotMessage",
+    0x9342ca07: "hydrogram.raw.functions.messages.GetBotCallbackAnswer",
+    0xd58f130a: "hydrogram.raw.functions.messages.SetBotCallbackAnswer",
+    0xe470bcfd: "hydrogram.raw.functions.messages.GetPeerDialogs",
+    0x7ff3b806: "hydrogram.raw.functions.messages.SaveDraft",
+    0x6a3f8d65: "hydrogram.raw.functions.messages.GetAllDrafts",
+    0x64780b14: "hydrogram.raw.functions.messages.GetFeaturedStickers",
+    0x5b118126: "hydrogram.raw.functions.messages.ReadFeaturedStickers",
+    0x9da9403b: "hydrogram.raw.functions.messages.GetRecentStickers",
+    0x392718f8: "hydrogram.raw.functions.messages.SaveRecentSticker",
+    0x8999602d: "hydrogram.raw.functions.messages.ClearRecentStickers",
+    0x57f17692: "hydrogram.raw.functions.messages.GetArchivedStickers",
+    0x640f82b8: "hydrogram.raw.functions.messages.GetMaskStickers",
+    0xcc5b67cc: "hydrogram.raw.functions.messages.GetAttachedStickers",
+    0x8ef8ecc0: "hydrogram.raw.functions.messages.SetGameScore",
+    0x15ad9f64: "hydrogram.raw.functions.messages.SetInlineGameScore",
+    0xe822649d: "hydrogram.raw.functions.messages.GetGameHighScores",
+    0xf635e1b: "hydrogram.raw.functions.messages.GetInlineGameHighScores",
+    0xe40ca104: "hydrogram.raw.functions.messages.GetCommonChats",
+    0x8d9692a3: "hydrogram.raw.functions.messages.GetWebPage",
+    0xa731e257: "hydrogram.raw.functions.messages.ToggleDialogPin",
+    0x3b1adf37: "hydrogram.raw.functions.messages.ReorderPinnedDialogs",
+    0xd6b94df2: "hydrogram.raw.functions.messages.GetPinnedDialogs",
+    0xe5f672fa: "hydrogram.raw.functions.messages.SetBotShippingResults",
+    0x9c2dd95: "hydrogram.raw.functions.messages.SetBotPrecheckoutResults",
+    0x519bc2b1: "hydrogram.raw.functions.messages.UploadMedia",
+    0xa1405817: "hydrogram.raw.functions.messages.SendScreenshotNotification",
+    0x4f1aaa9: "hydrogram.raw.functions.messages.GetFavedStickers",
+    0xb9ffc55b: "hydrogram.raw.functions.messages.FaveSticker",
+    0xf107e790: "hydrogram.raw.functions.messages.GetUnreadMentions",
+    0x36e5bf4d: "hydrogram.raw.functions.messages.ReadMentions",
+    0x702a40e0: "hydrogram.raw.functions.messages.GetRecentLocations",
+    0x456e8987: "hydrogram.raw.functions.messages.SendMultiMedia",
+    0x5057c497: "hydrogram.raw.functions.messages.UploadEncryptedFile",
+    0x35705b8a: "hydrogram.raw.functions.messages.SearchStickerSets",
+    0x1cff7e08: "hydrogram.raw.functions.messages.GetSplitRanges",
+    0xc286d98f: "hydrogram.raw.functions.messages.MarkDialogUnread",
+    0x22e24e22: "hydrogram.raw.functions.messages.GetDialogUnreadMarks",
+    0x7e58ee9c: "hydrogram.raw.functions.messages.ClearAllDrafts",
+    0xd2aaf7ec: "hydrogram.raw.functions.messages.UpdatePinnedMessage",
+    0x10ea6184: "hydrogram.raw.functions.messages.SendVote",
+    0x73bb643b: "hydrogram.raw.functions.messages.GetPollResults",
+    0x6e2be050: "hydrogram.raw.functions.messages.GetOnlines",
+    0xdef60797: "hydrogram.raw.functions.messages.EditChatAbout",
+    0xa5866b41: "hydrogram.raw.functions.messages.EditChatDefaultBannedRights",
+    0x35a0e062: "hydrogram.raw.functions.messages.GetEmojiKeywords",
+    0x1508b6af: "hydrogram.raw.functions.messages.GetEmojiKeywordsDifference",
+    0x4e9963b2: "hydrogram.raw.functions.messages.GetEmojiKeywordsLanguages",
+    0xd5b10c26: "hydrogram.raw.functions.messages.GetEmojiURL",
+    0x1bbcf300: "hydrogram.raw.functions.messages.GetSearchCounters",
+    0x198fb446: "hydrogram.raw.functions.messages.RequestUrlAuth",
+    0xb12c7125: "hydrogram.raw.functions.messages.AcceptUrlAuth",
+    0x4facb138: "hydrogram.raw.functions.messages.HidePeerSettingsBar",
+    0xf516760b: "hydrogram.raw.functions.messages.GetScheduledHistory",
+    0xbdbb0464: "hydrogram.raw.functions.messages.GetScheduledMessages",
+    0xbd38850a: "hydrogram.raw.functions.messages.SendScheduledMessages",
+    0x59ae2b16: "hydrogram.raw.functions.messages.DeleteScheduledMessages",
+    0xb86e380e: "hydrogram.raw.functions.messages.GetPollVotes",
+    0xb5052fea: "hydrogram.raw.functions.messages.ToggleStickerSets",
+    0xf19ed96d: "hydrogram.raw.functions.messages.GetDialogFilters",
+    0xa29cd42c: "hydrogram.raw.functions.messages.GetSuggestedDialogFilters",
+    0x1ad4a04a: "hydrogram.raw.functions.messages.UpdateDialogFilter",
+    0xc563c1e4: "hydrogram.raw.functions.messages.UpdateDialogFiltersOrder",
+    0x7ed094a1: "hydrogram.raw.functions.messages.GetOldFeaturedStickers",
+    0x22ddd30c: "hydrogram.raw.functions.messages.GetReplies",
+    0x446972fd: "hydrogram.raw.functions.messages.GetDiscussionMessage",
+    0xf731a9f4: "hydrogram.raw.functions.messages.ReadDiscussion",
+    0xee22b9a8: "hydrogram.raw.functions.messages.UnpinAllMessages",
+    0x5bd0ee50: "hydrogram.raw.functions.messages.DeleteChat",
+    0xf9cbe409: "hydrogram.raw.functions.messages.DeletePhoneCallHistory",
+    0x43fe19f3: "hydrogram.raw.functions.messages.CheckHistoryImport",
+    0x34090c3b: "hydrogram.raw.functions.messages.InitHistoryImport",
+    0x2a862092: "hydrogram.raw.functions.messages.UploadImportedMedia",
+    0xb43df344: "hydrogram.raw.functions.messages.StartHistoryImport",
+    0xa2b5a3f6: "hydrogram.raw.functions.messages.GetExportedChatInvites",
+    0x73746f5c: "hydrogram.raw.functions.messages.GetExportedChatInvite",
+    0xbdca2f75: "hydrogram.raw.functions.messages.EditExportedChatInvite",
+    0x56987bd5: "hydrogram.raw.functions.messages.DeleteRevokedExportedChatInvites",
+    0xd464a42b: "hydrogram.raw.functions.messages.DeleteExportedChatInvite",
+    0x3920e6ef: "hydrogram.raw.functions.messages.GetAdminsWithInvites",
+    0xdf04dd4e: "hydrogram.raw.functions.messages.GetChatInviteImporters",
+    0xb80e5fe4: "hydrogram.raw.functions.messages.SetHistoryTTL",
+    0x5dc60f03: "hydrogram.raw.functions.messages.CheckHistoryImportPeer",
+    0xe63be13f: "hydrogram.raw.functions.messages.SetChatTheme",
+    0x31c1c44f: "hydrogram.raw.functions.messages.GetMessageReadParticipants",
+    0x6aa3f6bd: "hydrogram.raw.functions.messages.GetSearchResultsCalendar",
+    0x9c7f2f10: "hydrogram.raw.functions.messages.GetSearchResultsPositions",
+    0x7fe7e815: "hydrogram.raw.functions.messages.HideChatJoinRequest",
+    0xe085f4ea: "hydrogram.raw.functions.messages.HideAllChatJoinRequests",
+    0xb11eafa2: "hydrogram.raw.functions.messages.ToggleNoForwards",
+    0xccfddf96: "hydrogram.raw.functions.messages.SaveDefaultSendAs",
+    0xd30d78d4: "hydrogram.raw.functions.messages.SendReaction",
+    0x8bba90e6: "hydrogram.raw.functions.messages.GetMessagesReactions",
+    0x461b3f48: "hydrogram.raw.functions.messages.GetMessageReactionsList",
+    0xfeb16771: "hydrogram.raw.functions.messages.SetChatAvailableReactions",
+    0x18dea0ac: "hydrogram.raw.functions.messages.GetAvailableReactions",
+    0x4f47a016: "hydrogram.raw.functions.messages.SetDefaultReaction",
+    0x63183030: "hydrogram.raw.functions.messages.TranslateText",
+    0x3223495b: "hydrogram.raw.functions.messages.GetUnreadReactions",
+    0x54aa7f8e: "hydrogram.raw.functions.messages.ReadReactions",
+    0x107e31a0: "hydrogram.raw.functions.messages.SearchSentMedia",
+    0x16fcc2cb: "hydrogram.raw.functions.messages.GetAttachMenuBots",
+    0x77216192: "hydrogram.raw.functions.messages.GetAttachMenuBot",
+    0x69f59d69: "hydrogram.raw.functions.messages.ToggleBotInAttachMenu",
+    0x269dc2c1: "hydrogram.raw.functions.messages.RequestWebView",
+    0xb0d81a83: "hydrogram.raw.functions.messages.ProlongWebView",
+    0x1a46500a: "hydrogram.raw.functions.messages.RequestSimpleWebView",
+    0xa4314f5: "hydrogram.raw.functions.messages.SendWebViewResultMessage",
+    0xdc0242c8: "hydrogram.raw.functions.messages.SendWebViewData",
+    0x269e9a49: "hydrogram.raw.functions.messages.TranscribeAudio",
+    0x7f1d072f: "hydrogram.raw.functions.messages.RateTranscribedAudio",
+    0xd9ab0f54: "hydrogram.raw.functions.messages.GetCustomEmojiDocuments",
+    0xfbfca18f: "hydrogram.raw.functions.messages.GetEmojiStickers",
+    0xecf6736: "hydrogram.raw.functions.messages.GetFeaturedEmojiStickers",
+    0x3f64c076: "hydrogram.raw.functions.messages.ReportReaction",
+    0xbb8125ba: "hydrogram.raw.functions.messages.GetTopReactions",
+    0x39461db2: "hydrogram.raw.functions.messages.GetRecentReactions",
+    0x9dfeefb4: "hydrogram.raw.functions.messages.ClearRecentReactions",
+    0x84f80814: "hydrogram.raw.functions.messages.GetExtendedMedia",
+    0x9eb51445: "hydrogram.raw.functions.messages.SetDefaultHistoryTTL",
+    0x658b7188: "hydrogram.raw.functions.messages.GetDefaultHistoryTTL",
+    0x91b2d060: "hydrogram.raw.functions.messages.SendBotRequestedPeer",
+    0x7488ce5b: "hydrogram.raw.functions.messages.GetEmojiGroups",
+    0x2ecd56cd: "hydrogram.raw.functions.messages.GetEmojiStatusGroups",
+    0x21a548f3: "hydrogram.raw.functions.messages.GetEmojiProfilePhotoGroups",
+    0x2c11c0d7: "hydrogram.raw.functions.messages.SearchCustomEmoji",
+    0xe47cb579: "hydrogram.raw.functions.messages.TogglePeerTranslations",
+    0x34fdc5c3: "hydrogram.raw.functions.messages.GetBotApp",
+    0x8c5a3b3c: "hydrogram.raw.functions.messages.RequestAppWebView",
+    0x8ffacae1: "hydrogram.raw.functions.messages.SetChatWallPaper",
+    0x92b4494c: "hydrogram.raw.functions.messages.SearchEmojiStickerSets",
+    0x5381d21a: "hydrogram.raw.functions.messages.GetSavedDialogs",
+    0x3d9a414d: "hydrogram.raw.functions.messages.GetSavedHistory",
+    0x6e98102b: "hydrogram.raw.functions.messages.DeleteSavedHistory",
+    0xd63d94e0: "hydrogram.raw.functions.messages.GetPinnedSavedDialogs",
+    0xac81bbde: "hydrogram.raw.functions.messages.ToggleSavedDialogPin",
+    0x8b716587: "hydrogram.raw.functions.messages.ReorderPinnedSavedDialogs",
+    0xedd4882a: "hydrogram.raw.functions.updates.GetState",
+    0x19c2f763: "hydrogram.raw.functions.updates.GetDifference",
+    0x3173d78: "hydrogram.raw.functions.updates.GetChannelDifference",
+    0x9e82039: "hydrogram.raw.functions.photos.UpdateProfilePhoto",
+    0x388a3b5: "hydrogram.raw.functions.photos.UploadProfilePhoto",
+    0x87cf7f2f: "hydrogram.raw.functions.photos.DeletePhotos",
+    0x91cd32a8: "hydrogram.raw.functions.photos.GetUserPhotos",
+    0xe14c4a71: "hydrogram.raw.functions.photos.UploadContactProfilePhoto",
+    0xb304a621: "hydrogram.raw.functions.upload.SaveFilePart",
+    0xbe5335be: "hydrogram.raw.functions.upload.GetFile",
+    0xde7b673d: "hydrogram.raw.functions.upload.SaveBigFilePart",
+    0x24e6818d: "hydrogram.raw.functions.upload.GetWebFile",
+    0x395f69da: "hydrogram.raw.functions.upload.GetCdnFile",
+    0x9b2754a8: "hydrogram.raw.functions.upload.ReuploadCdnFile",
+    0x91dc3f31: "hydrogram.raw.functions.upload.GetCdnFileHashes",
+    0x9156982a: "hydrogram.raw.functions.upload.GetFileHashes",
+    0xc4f9186b: "hydrogram.raw.functions.help.GetConfig",
+    0x1fb33026: "hydrogram.raw.functions.help.GetNearestDc",
+    0x522d5a7d: "hydrogram.raw.functions.help.GetAppUpdate",
+    0x4d392343: "hydrogram.raw.functions.help.GetInviteText",
+    0x9cdf08cd: "hydrogram.raw.functions.help.GetSupport",
+    0xec22cfcd: "hydrogram.raw.functions.help.SetBotUpdatesStatus",
+    0x52029342: "hydrogram.raw.functions.help.GetCdnConfig",
+    0x3dc0f114: "hydrogram.raw.functions.help.GetRecentMeUrls",
+    0x2ca51fd1: "hydrogram.raw.functions.help.GetTermsOfServiceUpdate",
+    0xee72f79a: "hydrogram.raw.functions.help.AcceptTermsOfService",
+    0x3fedc75f: "hydrogram.raw.functions.help.GetDeepLinkInfo",
+    0x61e3f854: "hydrogram.raw.functions.help.GetAppConfig",
+    0x6f02f748: "hydrogram.raw.functions.help.SaveAppLog",
+    0xc661ad08: "hydrogram.raw.functions.help.GetPassportConfig",
+    0xd360e72c: "hydrogram.raw.functions.help.GetSupportName",
+    0x38a08d3: "hydrogram.raw.functions.help.GetUserInfo",
+    0x66b91b70: "hydrogram.raw.functions.help.EditUserInfo",
+    0xc0977421: "hydrogram.raw.functions.help.GetPromoData",
+    0x1e251c95: "hydrogram.raw.functions.help.HidePromoData",
+    0xf50dbaa1: "hydrogram.raw.functions.help.DismissSuggestion",
+    0x735787a8: "hydrogram.raw.functions.help.GetCountriesList",
+    0xb81b93d4: "hydrogram.raw.functions.help.GetPremiumPromo",
+    0xda80f42f: "hydrogram.raw.functions.help.GetPeerColors",
+    0xabcfa9fd: "hydrogram.raw.functions.help.GetPeerProfileColors",
+    0xcc104937: "hydrogram.raw.functions.channels.ReadHistory",
+    0x84c1fd4e: "hydrogram.raw.functions.channels.DeleteMessages",
+    0xf44a8315: "hydrogram.raw.functions.channels.ReportSpam",
+    0xad8c9a23: "hydrogram.raw.functions.channels.GetMessages",
+    0x77ced9d0: "hydrogram.raw.functions.channels.GetParticipants",
+    0xa0ab6cc6: "hydrogram.raw.functions.channels.GetParticipant",
+    0xa7f6bbb: "hydrogram.raw.functions.channels.GetChannels",
+    0x8736a09: "hydrogram.raw.functions.channels.GetFullChannel",
+    0x91006707: "hydrogram.raw.functions.channels.CreateChannel",
+    0xd33c8902: "hydrogram.raw.functions.channels.EditAdmin",
+    0x566decd0: "hydrogram.raw.functions.channels.EditTitle",
+    0xf12e57c9: "hydrogram.raw.functions.channels.EditPhoto",
+    0x10e6bd2c: "hydrogram.raw.functions.channels.CheckUsername",
+    0x3514b3de: "hydrogram.raw.functions.channels.UpdateUsername",
+    0x24b524c5: "hydrogram.raw.functions.channels.JoinChannel",
+    0xf836aa95: "hydrogram.raw.functions.channels.LeaveChannel",
+    0x199f3a6c: "hydrogram.raw.functions.channels.InviteToChannel",
+    0xc0111fe3: "hydrogram.raw.functions.channels.DeleteChannel",
+    0xe63fadeb: "hydrogram.raw.functions.channels.ExportMessageLink",
+    0x1f69b606: "hydrogram.raw.functions.channels.ToggleSignatures",
+    0xf8b036af: "hydrogram.raw.functions.channels.GetAdminedPublicChannels",
+    0x96e6cd81: "hydrogram.raw.functions.channels.EditBanned",
+    0x33ddf480: "hydrogram.raw.functions.channels.GetAdminLog",
+    0xea8ca4f9: "hydrogram.raw.functions.channels.SetStickers",
+    0xeab5dc38: "hydrogram.raw.functions.channels.ReadMessageContents",
+    0x9baa9647: "hydrogram.raw.functions.channels.DeleteHistory",
+    0xeabbb94c: "hydrogram.raw.functions.channels.TogglePreHistoryHidden",
+    0x8341ecc0: "hydrogram.raw.functions.channels.GetLeftChannels",
+    0xf5dad378: "hydrogram.raw.functions.channels.GetGroupsForDiscussion",
+    0x40582bb2: "hydrogram.raw.functions.channels.SetDiscussionGroup",
+    0x8f38cd1f: "hydrogram.raw.functions.channels.EditCreator",
+    0x58e63f6d: "hydrogram.raw.functions.channels.EditLocation",
+    0xedd49ef0: "hydrogram.raw.functions.channels.ToggleSlowMode",
+    0x11e831ee: "hydrogram.raw.functions.channels.GetInactiveChannels",
+    0xb290c69: "hydrogram.raw.functions.channels.ConvertToGigagroup",
+    0xbeaedb94: "hydrogram.raw.functions.channels.ViewSponsoredMessage",
+    0xec210fbf: "hydrogram.raw.functions.channels.GetSponsoredMessages",
+    0xdc770ee: "hydrogram.raw.functions.channels.GetSendAs",
+    0x367544db: "hydrogram.raw.functions.channels.DeleteParticipantHistory",
+    0xe4cb9580: "hydrogram.raw.functions.channels.ToggleJoinToSend",
+    0x4c2985b6: "hydrogram.raw.functions.channels.ToggleJoinRequest",
+    0xb45ced1d: "hydrogram.raw.functions.channels.ReorderUsernames",
+    0x50f24105: "hydrogram.raw.functions.channels.ToggleUsername",
+    0xa245dd3: "hydrogram.raw.functions.channels.DeactivateAllUsernames",
+    0xa4298b29: "hydrogram.raw.functions.channels.ToggleForum",
+    0xf40c0224: "hydrogram.raw.functions.channels.CreateForumTopic",
+    0xde560d1: "hydrogram.raw.functions.channels.GetForumTopics",
+    0xb0831eb9: "hydrogram.raw.functions.channels.GetForumTopicsByID",
+    0xf4dfa185: "hydrogram.raw.functions.channels.EditForumTopic",
+    0x6c2d9026: "hydrogram.raw.functions.channels.UpdatePinnedForumTopic",
+    0x34435f2d: "hydrogram.raw.functions.channels.DeleteTopicHistory",
+    0x2950a18f: "hydrogram.raw.functions.channels.ReorderPinnedForumTopics",
+    0x68f3e4eb: "hydrogram.raw.functions.channels.ToggleAntiSpam",
+    0xa850a693: "hydrogram.raw.functions.channels.ReportAntiSpamFalsePositive",
+    0x6a6e7854: "hydrogram.raw.functions.channels.ToggleParticipantsHidden",
+    0x18afbc93: "hydrogram.raw.functions.channels.ClickSponsoredMessage",
+    0xd8aa3671: "hydrogram.raw.functions.channels.UpdateColor",
+    0x9738bb15: "hydrogram.raw.functions.channels.ToggleViewForumAsMessages",
+    0x83b70d97: "hydrogram.raw.functions.channels.GetChannelRecommendations",
+    0xf0d3e6a8: "hydrogram.raw.functions.channels.UpdateEmojiStatus",
+    0xaa2769ed: "hydrogram.raw.functions.bots.SendCustomRequest",
+    0xe6213f4d: "hydrogram.raw.functions.bots.AnswerWebhookJSONQuery",
+    0x517165a: "hydrogram.raw.functions.bots.SetBotCommands",
+    0x3d8de0f9: "hydrogram.raw.functions.bots.ResetBotCommands",
+    0xe34c0dd6: "hydrogram.raw.functions.bots.GetBotCommands",
+    0x4504d54f: "hydrogram.raw.functions.bots.SetBotMenuButton",
+    0x9c60eb28: "hydrogram.raw.functions.bots.GetBotMenuButton",
+    0x788464e1: "hydrogram.raw.functions.bots.SetBotBroadcastDefaultAdminRights",
+    0x925ec9ea: "hydrogram.raw.functions.bots.SetBotGroupDefaultAdminRights",
+    0x10cf3123: "hydrogram.raw.functions.bots.SetBotInfo",
+    0xdcd914fd: "hydrogram.raw.functions.bots.GetBotInfo",
+    0x9709b1c2: "hydrogram.raw.functions.bots.ReorderUsernames",
+    0x53ca973: "hydrogram.raw.functions.bots.ToggleUsername",
+    0x1359f4e6: "hydrogram.raw.functions.bots.CanSendMessage",
+    0xf132e3ef: "hydrogram.raw.functions.bots.AllowSendMessage",
+    0x87fc5e7: "hydrogram.raw.functions.bots.InvokeWebViewCustomMethod",
+    0x37148dbb: "hydrogram.raw.functions.payments.GetPaymentForm",
+    0x2478d1cc: "hydrogram.raw.functions.payments.GetPaymentReceipt",
+    0xb6c8f12b: "hydrogram.raw.functions.payments.ValidateRequestedInfo",
+    0x2d03522f: "hydrogram.raw.functions.payments.SendPaymentForm",
+    0x227d824b: "hydrogram.raw.functions.payments.GetSavedInfo",
+    0xd83d70c1: "hydrogram.raw.functions.payments.ClearSavedInfo",
+    0x2e79d779: "hydrogram.raw.functions.payments.GetBankCardData",
+    0xf91b065: "hydrogram.raw.functions.payments.ExportInvoice",
+    0x80ed747d: "hydrogram.raw.functions.payments.AssignAppStoreTransaction",
+    0xdffd50d3: "hydrogram.raw.functions.payments.AssignPlayMarketTransaction",
+    0x9fc19eb6: "hydrogram.raw.functions.payments.CanPurchasePremium",
+    0x2757ba54: "hydrogram.raw.functions.payments.GetPremiumGiftCodeOptions",
+    0x8e51b4c1: "hydrogram.raw.functions.payments.CheckGiftCode",
+    0xf6e26854: "hydrogram.raw.functions.payments.ApplyGiftCode",
+    0xf4239425: "hydrogram.raw.functions.payments.GetGiveawayInfo",
+    0x5ff58f20: "hydrogram.raw.functions.payments.LaunchPrepaidGiveaway",
+    0x9021ab67: "hydrogram.raw.functions.stickers.CreateStickerSet",
+    0xf7760f51: "hydrogram.raw.functions.stickers.RemoveStickerFromSet",
+    0xffb6d4ca: "hydrogram.raw.functions.stickers.ChangeStickerPosition",
+    0x8653febe: "hydrogram.raw.functions.stickers.AddStickerToSet",
+    0xa76a5392: "hydrogram.raw.functions.stickers.SetStickerSetThumb",
+    0x284b3639: "hydrogram.raw.functions.stickers.CheckShortName",
+    0x4dafc503: "hydrogram.raw.functions.stickers.SuggestShortName",
+    0xf5537ebc: "hydrogram.raw.functions.stickers.ChangeSticker",
+    0x124b1c00: "hydrogram.raw.functions.stickers.RenameStickerSet",
+    0x87704394: "hydrogram.raw.functions.stickers.DeleteStickerSet",
+    0x55451fa9: "hydrogram.raw.functions.phone.GetCallConfig",
+    0x42ff96ed: "hydrogram.raw.functions.phone.RequestCall",
+    0x3bd2b4a0: "hydrogram.raw.functions.phone.AcceptCall",
+    0x2efe1722: "hydrogram.raw.functions.phone.ConfirmCall",
+    0x17d54f61: "hydrogram.raw.functions.phone.ReceivedCall",
+    0xb2cbc1c0: "hydrogram.raw.functions.phone.DiscardCall",
+    0x59ead627: "hydrogram.raw.functions.phone.SetCallRating",
+    0x277add7e: "hydrogram.raw.functions.phone.SaveCallDebug",
+    0xff7a9383: "hydrogram.raw.functions.phone.SendSignalingData",
+    0x48cdc6d8: "hydrogram.raw.functions.phone.CreateGroupCall",
+    0xb132ff7b: "hydrogram.raw.functions.phone.JoinGroupCall",
+    0x500377f9: "hydrogram.raw.functions.phone.LeaveGroupCall",
+    0x7b393160: "hydrogram.raw.functions.phone.InviteToGroupCall",
+    0x7a777135: "hydrogram.raw.functions.phone.DiscardGroupCall",
+    0x74bbb43d: "hydrogram.raw.functions.phone.ToggleGroupCallSettings",
+    0x41845db: "hydrogram.raw.functions.phone.GetGroupCall",
+    0xc558d8ab: "hydrogram.raw.functions.phone.GetGroupParticipants",
+    0xb59cf977: "hydrogram.raw.functions.phone.CheckGroupCall",
+    0xf128c708: "hydrogram.raw.functions.phone.ToggleGroupCallRecord",
+    0xa5273abf: "hydrogram.raw.functions.phone.EditGroupCallParticipant",
+    0x1ca6ac0a: "hydrogram.raw.functions.phone.EditGroupCallTitle",
+    0xef7c213a: "hydrogram.raw.functions.phone.GetGroupCallJoinAs",
+    0xe6aa647f: "hydrogram.raw.functions.phone.ExportGroupCallInvite",
+    0x219c34e6: "hydrogram.raw.functions.phone.ToggleGroupCallStartSubscription",
+    0x5680e342: "hydrogram.raw.functions.phone.StartScheduledGroupCall",
+    0x575e1f8c: "hydrogram.raw.functions.phone.SaveDefaultGroupCallJoinAs",
+    0xcbea6bc4: "hydrogram.raw.functions.phone.JoinGroupCallPresentation",
+    0x1c50d144: "hydrogram.raw.functions.phone.LeaveGroupCallPresentation",
+    0x1ab21940: "hydrogram.raw.functions.phone.GetGroupCallStreamChannels",
+    0xdeb3abbf: "hydrogram.raw.functions.phone.GetGroupCallStreamRtmpUrl",
+    0x41248786: "hydrogram.raw.functions.phone.SaveCallLog",
+    0xf2f2330a: "hydrogram.raw.functions.langpack.GetLangPack",
+    0xefea3803: "hydrogram.raw.functions.langpack.GetStrings",
+    0xcd984aa5: "hydrogram.raw.functions.langpack.GetDifference",
+    0x42c6978f: "hydrogram.raw.functions.langpack.GetLanguages",
+    0x6a596502: "hydrogram.raw.functions.langpack.GetLanguage",
+    0x6847d0ab: "hydrogram.raw.functions.folders.EditPeerFolders",
+    0xab42441a: "hydrogram.raw.functions.stats.GetBroadcastStats",
+    0x621d5fa0: "hydrogram.raw.functions.stats.LoadAsyncGraph",
+    0xdcdf8607: "hydrogram.raw.functions.stats.GetMegagroupStats",
+    0x5f150144: "hydrogram.raw.functions.stats.GetMessagePublicForwards",
+    0xb6e0a3f5: "hydrogram.raw.functions.stats.GetMessageStats",
+    0x374fef40: "hydrogram.raw.functions.stats.GetStoryStats",
+    0xa6437ef6: "hydrogram.raw.functions.stats.GetStoryPublicForwards",
+    0x8472478e: "hydrogram.raw.functions.chatlists.ExportChatlistInvite",
+    0x719c5c5e: "hydrogram.raw.functions.chatlists.DeleteExportedInvite",
+    0x653db63d: "hydrogram.raw.functions.chatlists.EditExportedInvite",
+    0xce03da83: "hydrogram.raw.functions.chatlists.GetExportedInvites",
+    0x41c10fff: "hydrogram.raw.functions.chatlists.CheckChatlistInvite",
+    0xa6b1e39a: "hydrogram.raw.functions.chatlists.JoinChatlistInvite",
+    0x89419521: "hydrogram.raw.functions.chatlists.GetChatlistUpdates",
+    0xe089f8f5: "hydrogram.raw.functions.chatlists.JoinChatlistUpdates",
+    0x66e486fb: "hydrogram.raw.functions.chatlists.HideChatlistUpdates",
+    0xfdbcd714: "hydrogram.raw.functions.chatlists.GetLeaveChatlistSuggestions",
+    0x74fae13a: "hydrogram.raw.functions.chatlists.LeaveChatlist",
+    0xc7dfdfdd: "hydrogram.raw.functions.stories.CanSendStory",
+    0xe4e6694b: "hydrogram.raw.functions.stories.SendStory",
+    0xb583ba46: "hydrogram.raw.functions.stories.EditStory",
+    0xae59db5f: "hydrogram.raw.functions.stories.DeleteStories",
+    0x9a75a1ef: "hydrogram.raw.functions.stories.TogglePinned",
+    0xeeb0d625: "hydrogram.raw.functions.stories.GetAllStories",
+    0x5821a5dc: "hydrogram.raw.functions.stories.GetPinnedStories",
+    0xb4352016: "hydrogram.raw.functions.stories.GetStoriesArchive",
+    0x5774ca74: "hydrogram.raw.functions.stories.GetStoriesByID",
+    0x7c2557c4: "hydrogram.raw.functions.stories.ToggleAllStoriesHidden",
+    0xa556dac8: "hydrogram.raw.functions.stories.ReadStories",
+    0xb2028afb: "hydrogram.raw.functions.stories.IncrementStoryViews",
+    0x7ed23c57: "hydrogram.raw.functions.stories.GetStoryViewsList",
+    0x28e16cc8: "hydrogram.raw.functions.stories.GetStoriesViews",
+    0x7b8def20: "hydrogram.raw.functions.stories.ExportStoryLink",
+    0x1923fa8c: "hydrogram.raw.functions.stories.Report",
+    0x57bbd166: "hydrogram.raw.functions.stories.ActivateStealthMode",
+    0x7fd736b2: "hydrogram.raw.functions.stories.SendReaction",
+    0x2c4ada50: "hydrogram.raw.functions.stories.GetPeerStories",
+    0x9b5ae7f9: "hydrogram.raw.functions.stories.GetAllReadPeerStories",
+    0x535983c3: "hydrogram.raw.functions.stories.GetPeerMaxIDs",
+    0xa56a8b60: "hydrogram.raw.functions.stories.GetChatsToSend",
+    0xbd0415c4: "hydrogram.raw.functions.stories.TogglePeerStoriesHidden",
+    0xb9b2881f: "hydrogram.raw.functions.stories.GetStoryReactionsList",
+    0x60f67660: "hydrogram.raw.functions.premium.GetBoostsList",
+    0xbe77b4a: "hydrogram.raw.functions.premium.GetMyBoosts",
+    0x6b7da746: "hydrogram.raw.functions.premium.ApplyBoost",
+    0x42f1f61: "hydrogram.raw.functions.premium.GetBoostsStatus",
+    0x39854d1f: "hydrogram.raw.functions.premium.GetUserBoosts",
+    0xbc799737: "hydrogram.raw.core.BoolFalse",
+    0x997275b5: "hydrogram.raw.core.BoolTrue",
+    0x1cb5c415: "hydrogram.raw.core.Vector",
+    0x73f1f8dc: "hydrogram.raw.core.MsgContainer",
+    0xae500895: "hydrogram.raw.core.FutureSalts",
+    0x0949d9dc: "hydrogram.raw.core.FutureSalt",
+    0x3072cfa1: "hydrogram.raw.core.GzipPacked",
+    0x5bb8e511: "hydrogram.raw.core.Message",
+}
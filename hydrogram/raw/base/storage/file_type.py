@@ -0,0 +1,61 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from typing import Union
+from hydrogram import raw
+from hydrogram.raw.core import TLObject
+
+FileType = Union["raw.types.storage.FileGif", "raw.types.storage.FileJpeg", "raw.types.storage.FileMov", "raw.types.storage.FileMp3", "raw.types.storage.FileMp4", "raw.types.storage.FilePartial", "raw.types.storage.FilePdf", "raw.types.storage.FilePng", "raw.types.storage.FileUnknown", "raw.types.storage.FileWebp"]
+
+
+class FileType:  # type: ignore
+    """Telegram API base type.
+
+    Constructors:
+        This base type has 10 constructors available.
+
+        .. currentmodule:: hydrogram.raw.types
+
+        .. autosummary::
+            :nosignatures:
+
+            storage.FileGif
+            storage.FileJpeg
+            storage.FileMov
+            storage.FileMp3
+            storage.FileMp4
+            storage.FilePartial
+            storage.FilePdf
+            storage.FilePng
+            storage.FileUnknown
+            storage.FileWebp
+    """
+
+    QUALNAME = "hydrogram.raw.base.storage.FileType"
+
+    def __init__(self):
+        raise TypeError("Base types can only be used for type checking purposes: "
+                        "you tried to use a base type instance as argument, "
+                        "but you need to instantiate one of its constructors instead. "
+                        "More info: https://docs.hydrogram.org/en/latest/telegram/base/file-type.html")
@@ -0,0 +1,72 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetNotifySettings(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``12B3AD31``
+
+    Parameters:
+        peer (:obj:`InputNotifyPeer <hydrogram.raw.base.InputNotifyPeer>`):
+            N/A
+
+    Returns:
+        :obj:`PeerNotifySettings <hydrogram.raw.base.PeerNotifySettings>`
+    """
+
+    __slots__: List[str] = ["peer"]
+
+    ID = 0x12b3ad31
+    QUALNAME = "functions.account.GetNotifySettings"
+
+    def __init__(self, *, peer: "raw.base.InputNotifyPeer") -> None:
+        self.peer = peer  # InputNotifyPeer
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetNotifySettings":
+        # No flags
+        
+        peer = TLObject.read(b)
+        
+        return GetNotifySettings(peer=peer)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.peer.write())
+        
+        return b.getvalue()
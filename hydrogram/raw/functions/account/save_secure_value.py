@@ -0,0 +1,80 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SaveSecureValue(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``899FE31D``
+
+    Parameters:
+        value (:obj:`InputSecureValue <hydrogram.raw.base.InputSecureValue>`):
+            N/A
+
+        secure_secret_id (``int`` ``64-bit``):
+            N/A
+
+    Returns:
+        :obj:`SecureValue <hydrogram.raw.base.SecureValue>`
+    """
+
+    __slots__: List[str] = ["value", "secure_secret_id"]
+
+    ID = 0x899fe31d
+    QUALNAME = "functions.account.SaveSecureValue"
+
+    def __init__(self, *, value: "raw.base.InputSecureValue", secure_secret_id: int) -> None:
+        self.value = value  # InputSecureValue
+        self.secure_secret_id = secure_secret_id  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SaveSecureValue":
+        # No flags
+        
+        value = TLObject.read(b)
+        
+        secure_secret_id = Long.read(b)
+        
+        return SaveSecureValue(value=value, secure_secret_id=secure_secret_id)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.value.write())
+        
+        b.write(Long(self.secure_secret_id))
+        
+        return b.getvalue()
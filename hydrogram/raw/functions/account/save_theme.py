@@ -0,0 +1,80 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SaveTheme(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``F257106C``
+
+    Parameters:
+        theme (:obj:`InputTheme <hydrogram.raw.base.InputTheme>`):
+            N/A
+
+        unsave (``bool``):
+            N/A
+
+    Returns:
+        ``bool``
+    """
+
+    __slots__: List[str] = ["theme", "unsave"]
+
+    ID = 0xf257106c
+    QUALNAME = "functions.account.SaveTheme"
+
+    def __init__(self, *, theme: "raw.base.InputTheme", unsave: bool) -> None:
+        self.theme = theme  # InputTheme
+        self.unsave = unsave  # Bool
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SaveTheme":
+        # No flags
+        
+        theme = TLObject.read(b)
+        
+        unsave = Bool.read(b)
+        
+        return SaveTheme(theme=theme, unsave=unsave)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.theme.write())
+        
+        b.write(Bool(self.unsave))
+        
+        return b.getvalue()
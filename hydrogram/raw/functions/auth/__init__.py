@@ -0,0 +1,46 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from .send_code import SendCode
+from .sign_up import SignUp
+from .sign_in import SignIn
+from .log_out import LogOut
+from .reset_authorizations import ResetAuthorizations
+from .export_authorization import ExportAuthorization
+from .import_authorization import ImportAuthorization
+from .bind_temp_auth_key import BindTempAuthKey
+from .import_bot_authorization import ImportBotAuthorization
+from .check_password import CheckPassword
+from .request_password_recovery import RequestPasswordRecovery
+from .recover_password import RecoverPassword
+from .resend_code import ResendCode
+from .cancel_code import CancelCode
+from .drop_temp_auth_keys import DropTempAuthKeys
+from .export_login_token import ExportLoginToken
+from .import_login_token import ImportLoginToken
+from .accept_login_token import AcceptLoginToken
+from .check_recovery_password import CheckRecoveryPassword
+from .import_web_token_authorization import ImportWebTokenAuthorization
+from .request_firebase_sms import RequestFirebaseSms
+from .reset_login_email import ResetLoginEmail
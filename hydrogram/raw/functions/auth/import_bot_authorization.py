@@ -0,0 +1,96 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ImportBotAuthorization(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``67A3FF2C``
+
+    Parameters:
+        flags (``int`` ``32-bit``):
+            N/A
+
+        api_id (``int`` ``32-bit``):
+            N/A
+
+        api_hash (``str``):
+            N/A
+
+        bot_auth_token (``str``):
+            N/A
+
+    Returns:
+        :obj:`auth.Authorization <hydrogram.raw.base.auth.Authorization>`
+    """
+
+    __slots__: List[str] = ["flags", "api_id", "api_hash", "bot_auth_token"]
+
+    ID = 0x67a3ff2c
+    QUALNAME = "functions.auth.ImportBotAuthorization"
+
+    def __init__(self, *, flags: int, api_id: int, api_hash: str, bot_auth_token: str) -> None:
+        self.flags = flags  # int
+        self.api_id = api_id  # int
+        self.api_hash = api_hash  # string
+        self.bot_auth_token = bot_auth_token  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ImportBotAuthorization":
+        # No flags
+        
+        flags = Int.read(b)
+        
+        api_id = Int.read(b)
+        
+        api_hash = String.read(b)
+        
+        bot_auth_token = String.read(b)
+        
+        return ImportBotAuthorization(flags=flags, api_id=api_id, api_hash=api_hash, bot_auth_token=bot_auth_token)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.flags))
+        
+        b.write(Int(self.api_id))
+        
+        b.write(String(self.api_hash))
+        
+        b.write(String(self.bot_auth_token))
+        
+        return b.getvalue()
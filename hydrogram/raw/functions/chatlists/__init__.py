@@ -0,0 +1,35 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from .export_chatlist_invite import ExportChatlistInvite
+from .delete_exported_invite import DeleteExportedInvite
+from .edit_exported_invite import EditExportedInvite
+from .get_exported_invites import GetExportedInvites
+from .check_chatlist_invite import CheckChatlistInvite
+from .join_chatlist_invite import JoinChatlistInvite
+from .get_chatlist_updates import GetChatlistUpdates
+from .join_chatlist_updates import JoinChatlistUpdates
+from .hide_chatlist_updates import HideChatlistUpdates
+from .get_leave_chatlist_suggestions import GetLeaveChatlistSuggestions
+from .leave_chatlist import LeaveChatlist
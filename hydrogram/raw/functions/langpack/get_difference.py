@@ -0,0 +1,88 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetDifference(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``CD984AA5``
+
+    Parameters:
+        lang_pack (``str``):
+            N/A
+
+        lang_code (``str``):
+            N/A
+
+        from_version (``int`` ``32-bit``):
+            N/A
+
+    Returns:
+        :obj:`LangPackDifference <hydrogram.raw.base.LangPackDifference>`
+    """
+
+    __slots__: List[str] = ["lang_pack", "lang_code", "from_version"]
+
+    ID = 0xcd984aa5
+    QUALNAME = "functions.langpack.GetDifference"
+
+    def __init__(self, *, lang_pack: str, lang_code: str, from_version: int) -> None:
+        self.lang_pack = lang_pack  # string
+        self.lang_code = lang_code  # string
+        self.from_version = from_version  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetDifference":
+        # No flags
+        
+        lang_pack = String.read(b)
+        
+        lang_code = String.read(b)
+        
+        from_version = Int.read(b)
+        
+        return GetDifference(lang_pack=lang_pack, lang_code=lang_code, from_version=from_version)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.lang_pack))
+        
+        b.write(String(self.lang_code))
+        
+        b.write(Int(self.from_version))
+        
+        return b.getvalue()
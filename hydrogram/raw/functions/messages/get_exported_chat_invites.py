@@ -0,0 +1,114 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GetExportedChatInvites(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``A2B5A3F6``
+
+    Parameters:
+        peer (:obj:`InputPeer <hydrogram.raw.base.InputPeer>`):
+            N/A
+
+        admin_id (:obj:`InputUser <hydrogram.raw.base.InputUser>`):
+            N/A
+
+        limit (``int`` ``32-bit``):
+            N/A
+
+        revoked (``bool``, *optional*):
+            N/A
+
+        offset_date (``int`` ``32-bit``, *optional*):
+            N/A
+
+        offset_link (``str``, *optional*):
+            N/A
+
+    Returns:
+        :obj:`messages.ExportedChatInvites <hydrogram.raw.base.messages.ExportedChatInvites>`
+    """
+
+    __slots__: List[str] = ["peer", "admin_id", "limit", "revoked", "offset_date", "offset_link"]
+
+    ID = 0xa2b5a3f6
+    QUALNAME = "functions.messages.GetExportedChatInvites"
+
+    def __init__(self, *, peer: "raw.base.InputPeer", admin_id: "raw.base.InputUser", limit: int, revoked: Optional[bool] = None, offset_date: Optional[int] = None, offset_link: Optional[str] = None) -> None:
+        self.peer = peer  # InputPeer
+        self.admin_id = admin_id  # InputUser
+        self.limit = limit  # int
+        self.revoked = revoked  # flags.3?true
+        self.offset_date = offset_date  # flags.2?int
+        self.offset_link = offset_link  # flags.2?string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GetExportedChatInvites":
+        
+        flags = Int.read(b)
+        
+        revoked = True if flags & (1 << 3) else False
+        peer = TLObject.read(b)
+        
+        admin_id = TLObject.read(b)
+        
+        offset_date = Int.read(b) if flags & (1 << 2) else None
+        offset_link = String.read(b) if flags & (1 << 2) else None
+        limit = Int.read(b)
+        
+        return GetExportedChatInvites(peer=peer, admin_id=admin_id, limit=limit, revoked=revoked, offset_date=offset_date, offset_link=offset_link)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 3) if self.revoked else 0
+        flags |= (1 << 2) if self.offset_date is not None else 0
+        flags |= (1 << 2) if self.offset_link is not None else 0
+        b.write(Int(flags))
+        
+        b.write(self.peer.write())
+        
+        b.write(self.admin_id.write())
+        
+        if self.offset_date is not None:
+            b.write(Int(self.offset_date))
+        
+        if self.offset_link is not None:
+            b.write(String(self.offset_link))
+        
+        b.write(Int(self.limit))
+        
+        return b.getvalue()
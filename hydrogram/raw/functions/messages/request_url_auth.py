@@ -0,0 +1,103 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class RequestUrlAuth(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``198FB446``
+
+    Parameters:
+        peer (:obj:`InputPeer <hydrogram.raw.base.InputPeer>`, *optional*):
+            N/A
+
+        msg_id (``int`` ``32-bit``, *optional*):
+            N/A
+
+        button_id (``int`` ``32-bit``, *optional*):
+            N/A
+
+        url (``str``, *optional*):
+            N/A
+
+    Returns:
+        :obj:`UrlAuthResult <hydrogram.raw.base.UrlAuthResult>`
+    """
+
+    __slots__: List[str] = ["peer", "msg_id", "button_id", "url"]
+
+    ID = 0x198fb446
+    QUALNAME = "functions.messages.RequestUrlAuth"
+
+    def __init__(self, *, peer: "raw.base.InputPeer" = None, msg_id: Optional[int] = None, button_id: Optional[int] = None, url: Optional[str] = None) -> None:
+        self.peer = peer  # flags.1?InputPeer
+        self.msg_id = msg_id  # flags.1?int
+        self.button_id = button_id  # flags.1?int
+        self.url = url  # flags.2?string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "RequestUrlAuth":
+        
+        flags = Int.read(b)
+        
+        peer = TLObject.read(b) if flags & (1 << 1) else None
+        
+        msg_id = Int.read(b) if flags & (1 << 1) else None
+        button_id = Int.read(b) if flags & (1 << 1) else None
+        url = String.read(b) if flags & (1 << 2) else None
+        return RequestUrlAuth(peer=peer, msg_id=msg_id, button_id=button_id, url=url)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 1) if self.peer is not None else 0
+        flags |= (1 << 1) if self.msg_id is not None else 0
+        flags |= (1 << 1) if self.button_id is not None else 0
+        flags |= (1 << 2) if self.url is not None else 0
+        b.write(Int(flags))
+        
+        if self.peer is not None:
+            b.write(self.peer.write())
+        
+        if self.msg_id is not None:
+            b.write(Int(self.msg_id))
+        
+        if self.button_id is not None:
+            b.write(Int(self.button_id))
+        
+        if self.url is not None:
+            b.write(String(self.url))
+        
+        return b.getvalue()
@@ -0,0 +1,84 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UpdateDialogFilter(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``1AD4A04A``
+
+    Parameters:
+        id (``int`` ``32-bit``):
+            N/A
+
+        filter (:obj:`DialogFilter <hydrogram.raw.base.DialogFilter>`, *optional*):
+            N/A
+
+    Returns:
+        ``bool``
+    """
+
+    __slots__: List[str] = ["id", "filter"]
+
+    ID = 0x1ad4a04a
+    QUALNAME = "functions.messages.UpdateDialogFilter"
+
+    def __init__(self, *, id: int, filter: "raw.base.DialogFilter" = None) -> None:
+        self.id = id  # int
+        self.filter = filter  # flags.0?DialogFilter
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UpdateDialogFilter":
+        
+        flags = Int.read(b)
+        
+        id = Int.read(b)
+        
+        filter = TLObject.read(b) if flags & (1 << 0) else None
+        
+        return UpdateDialogFilter(id=id, filter=filter)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.filter is not None else 0
+        b.write(Int(flags))
+        
+        b.write(Int(self.id))
+        
+        if self.filter is not None:
+            b.write(self.filter.write())
+        
+        return b.getvalue()
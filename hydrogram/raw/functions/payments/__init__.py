@@ -0,0 +1,40 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from .get_payment_form import GetPaymentForm
+from .get_payment_receipt import GetPaymentReceipt
+from .validate_requested_info import ValidateRequestedInfo
+from .send_payment_form import SendPaymentForm
+from .get_saved_info import GetSavedInfo
+from .clear_saved_info import ClearSavedInfo
+from .get_bank_card_data import GetBankCardData
+from .export_invoice import ExportInvoice
+from .assign_app_store_transaction import AssignAppStoreTransaction
+from .assign_play_market_transaction import AssignPlayMarketTransaction
+from .can_purchase_premium import CanPurchasePremium
+from .get_premium_gift_code_options import GetPremiumGiftCodeOptions
+from .check_gift_code import CheckGiftCode
+from .apply_gift_code import ApplyGiftCode
+from .get_giveaway_info import GetGiveawayInfo
+from .launch_prepaid_giveaway import LaunchPrepaidGiveaway
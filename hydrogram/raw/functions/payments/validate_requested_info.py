@@ -0,0 +1,88 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ValidateRequestedInfo(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``B6C8F12B``
+
+    Parameters:
+        invoice (:obj:`InputInvoice <hydrogram.raw.base.InputInvoice>`):
+            N/A
+
+        info (:obj:`PaymentRequestedInfo <hydrogram.raw.base.PaymentRequestedInfo>`):
+            N/A
+
+        save (``bool``, *optional*):
+            N/A
+
+    Returns:
+        :obj:`payments.ValidatedRequestedInfo <hydrogram.raw.base.payments.ValidatedRequestedInfo>`
+    """
+
+    __slots__: List[str] = ["invoice", "info", "save"]
+
+    ID = 0xb6c8f12b
+    QUALNAME = "functions.payments.ValidateRequestedInfo"
+
+    def __init__(self, *, invoice: "raw.base.InputInvoice", info: "raw.base.PaymentRequestedInfo", save: Optional[bool] = None) -> None:
+        self.invoice = invoice  # InputInvoice
+        self.info = info  # PaymentRequestedInfo
+        self.save = save  # flags.0?true
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ValidateRequestedInfo":
+        
+        flags = Int.read(b)
+        
+        save = True if flags & (1 << 0) else False
+        invoice = TLObject.read(b)
+        
+        info = TLObject.read(b)
+        
+        return ValidateRequestedInfo(invoice=invoice, info=info, save=save)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.save else 0
+        b.write(Int(flags))
+        
+        b.write(self.invoice.write())
+        
+        b.write(self.info.write())
+        
+        return b.getvalue()
@@ -0,0 +1,104 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class RequestCall(TLObject):  # type: ignore
+    """Telegram API function.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``42FF96ED``
+
+    Parameters:
+        user_id (:obj:`InputUser <hydrogram.raw.base.InputUser>`):
+            N/A
+
+        random_id (``int`` ``32-bit``):
+            N/A
+
+        g_a_hash (``bytes``):
+            N/A
+
+        protocol (:obj:`PhoneCallProtocol <hydrogram.raw.base.PhoneCallProtocol>`):
+            N/A
+
+        video (``bool``, *optional*):
+            N/A
+
+    Returns:
+        :obj:`phone.PhoneCall <hydrogram.raw.base.phone.PhoneCall>`
+    """
+
+    __slots__: List[str] = ["user_id", "random_id", "g_a_hash", "protocol", "video"]
+
+    ID = 0x42ff96ed
+    QUALNAME = "functions.phone.RequestCall"
+
+    def __init__(self, *, user_id: "raw.base.InputUser", random_id: int, g_a_hash: bytes, protocol: "raw.base.PhoneCallProtocol", video: Optional[bool] = None) -> None:
+        self.user_id = user_id  # InputUser
+        self.random_id = random_id  # int
+        self.g_a_hash = g_a_hash  # bytes
+        self.protocol = protocol  # PhoneCallProtocol
+        self.video = video  # flags.0?true
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "RequestCall":
+        
+        flags = Int.read(b)
+        
+        video = True if flags & (1 << 0) else False
+        user_id = TLObject.read(b)
+        
+        random_id = Int.read(b)
+        
+        g_a_hash = Bytes.read(b)
+        
+        protocol = TLObject.read(b)
+        
+        return RequestCall(user_id=user_id, random_id=random_id, g_a_hash=g_a_hash, protocol=protocol, video=video)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.video else 0
+        b.write(Int(flags))
+        
+        b.write(self.user_id.write())
+        
+        b.write(Int(self.random_id))
+        
+        b.write(Bytes(self.g_a_hash))
+        
+        b.write(self.protocol.write())
+        
+        return b.getvalue()
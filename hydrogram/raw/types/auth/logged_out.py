@@ -0,0 +1,84 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class LoggedOut(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.auth.LoggedOut`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``C3A2835F``
+
+    Parameters:
+        future_auth_token (``bytes``, *optional*):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            auth.LogOut
+    """
+
+    __slots__: List[str] = ["future_auth_token"]
+
+    ID = 0xc3a2835f
+    QUALNAME = "types.auth.LoggedOut"
+
+    def __init__(self, *, future_auth_token: Optional[bytes] = None) -> None:
+        self.future_auth_token = future_auth_token  # flags.0?bytes
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "LoggedOut":
+        
+        flags = Int.read(b)
+        
+        future_auth_token = Bytes.read(b) if flags & (1 << 0) else None
+        return LoggedOut(future_auth_token=future_auth_token)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.future_auth_token is not None else 0
+        b.write(Int(flags))
+        
+        if self.future_auth_token is not None:
+            b.write(Bytes(self.future_auth_token))
+        
+        return b.getvalue()
@@ -0,0 +1,96 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class BadServerSalt(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.BadMsgNotification`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``EDAB447B``
+
+    Parameters:
+        bad_msg_id (``int`` ``64-bit``):
+            N/A
+
+        bad_msg_seqno (``int`` ``32-bit``):
+            N/A
+
+        error_code (``int`` ``32-bit``):
+            N/A
+
+        new_server_salt (``int`` ``64-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["bad_msg_id", "bad_msg_seqno", "error_code", "new_server_salt"]
+
+    ID = 0xedab447b
+    QUALNAME = "types.BadServerSalt"
+
+    def __init__(self, *, bad_msg_id: int, bad_msg_seqno: int, error_code: int, new_server_salt: int) -> None:
+        self.bad_msg_id = bad_msg_id  # long
+        self.bad_msg_seqno = bad_msg_seqno  # int
+        self.error_code = error_code  # int
+        self.new_server_salt = new_server_salt  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "BadServerSalt":
+        # No flags
+        
+        bad_msg_id = Long.read(b)
+        
+        bad_msg_seqno = Int.read(b)
+        
+        error_code = Int.read(b)
+        
+        new_server_salt = Long.read(b)
+        
+        return BadServerSalt(bad_msg_id=bad_msg_id, bad_msg_seqno=bad_msg_seqno, error_code=error_code, new_server_salt=new_server_salt)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.bad_msg_id))
+        
+        b.write(Int(self.bad_msg_seqno))
+        
+        b.write(Int(self.error_code))
+        
+        b.write(Long(self.new_server_salt))
+        
+        return b.getvalue()
@@ -0,0 +1,80 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ChannelAdminLogEventActionParticipantJoinByRequest(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.ChannelAdminLogEventAction`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``AFB6144A``
+
+    Parameters:
+        invite (:obj:`ExportedChatInvite <hydrogram.raw.base.ExportedChatInvite>`):
+            N/A
+
+        approved_by (``int`` ``64-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["invite", "approved_by"]
+
+    ID = 0xafb6144a
+    QUALNAME = "types.ChannelAdminLogEventActionParticipantJoinByRequest"
+
+    def __init__(self, *, invite: "raw.base.ExportedChatInvite", approved_by: int) -> None:
+        self.invite = invite  # ExportedChatInvite
+        self.approved_by = approved_by  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ChannelAdminLogEventActionParticipantJoinByRequest":
+        # No flags
+        
+        invite = TLObject.read(b)
+        
+        approved_by = Long.read(b)
+        
+        return ChannelAdminLogEventActionParticipantJoinByRequest(invite=invite, approved_by=approved_by)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(self.invite.write())
+        
+        b.write(Long(self.approved_by))
+        
+        return b.getvalue()
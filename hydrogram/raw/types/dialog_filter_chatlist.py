@@ -0,0 +1,122 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class DialogFilterChatlist(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.DialogFilter`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``D64A04A8``
+
+    Parameters:
+        id (``int`` ``32-bit``):
+            N/A
+
+        title (``str``):
+            N/A
+
+        pinned_peers (List of :obj:`InputPeer <hydrogram.raw.base.InputPeer>`):
+            N/A
+
+        include_peers (List of :obj:`InputPeer <hydrogram.raw.base.InputPeer>`):
+            N/A
+
+        has_my_invites (``bool``, *optional*):
+            N/A
+
+        emoticon (``str``, *optional*):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            messages.GetDialogFilters
+    """
+
+    __slots__: List[str] = ["id", "title", "pinned_peers", "include_peers", "has_my_invites", "emoticon"]
+
+    ID = 0xd64a04a8
+    QUALNAME = "types.DialogFilterChatlist"
+
+    def __init__(self, *, id: int, title: str, pinned_peers: List["raw.base.InputPeer"], include_peers: List["raw.base.InputPeer"], has_my_invites: Optional[bool] = None, emoticon: Optional[str] = None) -> None:
+        self.id = id  # int
+        self.title = title  # string
+        self.pinned_peers = pinned_peers  # Vector<InputPeer>
+        self.include_peers = include_peers  # Vector<InputPeer>
+        self.has_my_invites = has_my_invites  # flags.26?true
+        self.emoticon = emoticon  # flags.25?string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "DialogFilterChatlist":
+        
+        flags = Int.read(b)
+        
+        has_my_invites = True if flags & (1 << 26) else False
+        id = Int.read(b)
+        
+        title = String.read(b)
+        
+        emoticon = String.read(b) if flags & (1 << 25) else None
+        pinned_peers = TLObject.read(b)
+        
+        include_peers = TLObject.read(b)
+        
+        return DialogFilterChatlist(id=id, title=title, pinned_peers=pinned_peers, include_peers=include_peers, has_my_invites=has_my_invites, emoticon=emoticon)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 26) if self.has_my_invites else 0
+        flags |= (1 << 25) if self.emoticon is not None else 0
+        b.write(Int(flags))
+        
+        b.write(Int(self.id))
+        
+        b.write(String(self.title))
+        
+        if self.emoticon is not None:
+            b.write(String(self.emoticon))
+        
+        b.write(Vector(self.pinned_peers))
+        
+        b.write(Vector(self.include_peers))
+        
+        return b.getvalue()
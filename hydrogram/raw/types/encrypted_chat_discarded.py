@@ -0,0 +1,90 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class EncryptedChatDiscarded(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.EncryptedChat`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``1E1C7C45``
+
+    Parameters:
+        id (``int`` ``32-bit``):
+            N/A
+
+        history_deleted (``bool``, *optional*):
+            N/A
+
+    Functions:
+        This object can be returned by 2 functions.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            messages.RequestEncryption
+            messages.AcceptEncryption
+    """
+
+    __slots__: List[str] = ["id", "history_deleted"]
+
+    ID = 0x1e1c7c45
+    QUALNAME = "types.EncryptedChatDiscarded"
+
+    def __init__(self, *, id: int, history_deleted: Optional[bool] = None) -> None:
+        self.id = id  # int
+        self.history_deleted = history_deleted  # flags.0?true
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "EncryptedChatDiscarded":
+        
+        flags = Int.read(b)
+        
+        history_deleted = True if flags & (1 << 0) else False
+        id = Int.read(b)
+        
+        return EncryptedChatDiscarded(id=id, history_deleted=history_deleted)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.history_deleted else 0
+        b.write(Int(flags))
+        
+        b.write(Int(self.id))
+        
+        return b.getvalue()
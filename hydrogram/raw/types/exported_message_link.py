@@ -0,0 +1,89 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ExportedMessageLink(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.ExportedMessageLink`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``5DAB1AF4``
+
+    Parameters:
+        link (``str``):
+            N/A
+
+        html (``str``):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            channels.ExportMessageLink
+    """
+
+    __slots__: List[str] = ["link", "html"]
+
+    ID = 0x5dab1af4
+    QUALNAME = "types.ExportedMessageLink"
+
+    def __init__(self, *, link: str, html: str) -> None:
+        self.link = link  # string
+        self.html = html  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ExportedMessageLink":
+        # No flags
+        
+        link = String.read(b)
+        
+        html = String.read(b)
+        
+        return ExportedMessageLink(link=link, html=html)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.link))
+        
+        b.write(String(self.html))
+        
+        return b.getvalue()
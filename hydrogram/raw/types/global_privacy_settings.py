@@ -0,0 +1,94 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class GlobalPrivacySettings(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.GlobalPrivacySettings`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``734C4CCB``
+
+    Parameters:
+        archive_and_mute_new_noncontact_peers (``bool``, *optional*):
+            N/A
+
+        keep_archived_unmuted (``bool``, *optional*):
+            N/A
+
+        keep_archived_folders (``bool``, *optional*):
+            N/A
+
+    Functions:
+        This object can be returned by 2 functions.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            account.GetGlobalPrivacySettings
+            account.SetGlobalPrivacySettings
+    """
+
+    __slots__: List[str] = ["archive_and_mute_new_noncontact_peers", "keep_archived_unmuted", "keep_archived_folders"]
+
+    ID = 0x734c4ccb
+    QUALNAME = "types.GlobalPrivacySettings"
+
+    def __init__(self, *, archive_and_mute_new_noncontact_peers: Optional[bool] = None, keep_archived_unmuted: Optional[bool] = None, keep_archived_folders: Optional[bool] = None) -> None:
+        self.archive_and_mute_new_noncontact_peers = archive_and_mute_new_noncontact_peers  # flags.0?true
+        self.keep_archived_unmuted = keep_archived_unmuted  # flags.1?true
+        self.keep_archived_folders = keep_archived_folders  # flags.2?true
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "GlobalPrivacySettings":
+        
+        flags = Int.read(b)
+        
+        archive_and_mute_new_noncontact_peers = True if flags & (1 << 0) else False
+        keep_archived_unmuted = True if flags & (1 << 1) else False
+        keep_archived_folders = True if flags & (1 << 2) else False
+        return GlobalPrivacySettings(archive_and_mute_new_noncontact_peers=archive_and_mute_new_noncontact_peers, keep_archived_unmuted=keep_archived_unmuted, keep_archived_folders=keep_archived_folders)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.archive_and_mute_new_noncontact_peers else 0
+        flags |= (1 << 1) if self.keep_archived_unmuted else 0
+        flags |= (1 << 2) if self.keep_archived_folders else 0
+        b.write(Int(flags))
+        
+        return b.getvalue()
@@ -0,0 +1,88 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputBotInlineResultGame(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.InputBotInlineResult`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``4FA417F2``
+
+    Parameters:
+        id (``str``):
+            N/A
+
+        short_name (``str``):
+            N/A
+
+        send_message (:obj:`InputBotInlineMessage <hydrogram.raw.base.InputBotInlineMessage>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["id", "short_name", "send_message"]
+
+    ID = 0x4fa417f2
+    QUALNAME = "types.InputBotInlineResultGame"
+
+    def __init__(self, *, id: str, short_name: str, send_message: "raw.base.InputBotInlineMessage") -> None:
+        self.id = id  # string
+        self.short_name = short_name  # string
+        self.send_message = send_message  # InputBotInlineMessage
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputBotInlineResultGame":
+        # No flags
+        
+        id = String.read(b)
+        
+        short_name = String.read(b)
+        
+        send_message = TLObject.read(b)
+        
+        return InputBotInlineResultGame(id=id, short_name=short_name, send_message=send_message)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.id))
+        
+        b.write(String(self.short_name))
+        
+        b.write(self.send_message.write())
+        
+        return b.getvalue()
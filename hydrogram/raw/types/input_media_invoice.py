@@ -0,0 +1,143 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class InputMediaInvoice(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.InputMedia`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``8EB5A6D5``
+
+    Parameters:
+        title (``str``):
+            N/A
+
+        description (``str``):
+            N/A
+
+        invoice (:obj:`Invoice <hydrogram.raw.base.Invoice>`):
+            N/A
+
+        payload (``bytes``):
+            N/A
+
+        provider (``str``):
+            N/A
+
+        provider_data (:obj:`DataJSON <hydrogram.raw.base.DataJSON>`):
+            N/A
+
+        photo (:obj:`InputWebDocument <hydrogram.raw.base.InputWebDocument>`, *optional*):
+            N/A
+
+        start_param (``str``, *optional*):
+            N/A
+
+        extended_media (:obj:`InputMedia <hydrogram.raw.base.InputMedia>`, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["title", "description", "invoice", "payload", "provider", "provider_data", "photo", "start_param", "extended_media"]
+
+    ID = 0x8eb5a6d5
+    QUALNAME = "types.InputMediaInvoice"
+
+    def __init__(self, *, title: str, description: str, invoice: "raw.base.Invoice", payload: bytes, provider: str, provider_data: "raw.base.DataJSON", photo: "raw.base.InputWebDocument" = None, start_param: Optional[str] = None, extended_media: "raw.base.InputMedia" = None) -> None:
+        self.title = title  # string
+        self.description = description  # string
+        self.invoice = invoice  # Invoice
+        self.payload = payload  # bytes
+        self.provider = provider  # string
+        self.provider_data = provider_data  # DataJSON
+        self.photo = photo  # flags.0?InputWebDocument
+        self.start_param = start_param  # flags.1?string
+        self.extended_media = extended_media  # flags.2?InputMedia
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "InputMediaInvoice":
+        
+        flags = Int.read(b)
+        
+        title = String.read(b)
+        
+        description = String.read(b)
+        
+        photo = TLObject.read(b) if flags & (1 << 0) else None
+        
+        invoice = TLObject.read(b)
+        
+        payload = Bytes.read(b)
+        
+        provider = String.read(b)
+        
+        provider_data = TLObject.read(b)
+        
+        start_param = String.read(b) if flags & (1 << 1) else None
+        extended_media = TLObject.read(b) if flags & (1 << 2) else None
+        
+        return InputMediaInvoice(title=title, description=description, invoice=invoice, payload=payload, provider=provider, provider_data=provider_data, photo=photo, start_param=start_param, extended_media=extended_media)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.photo is not None else 0
+        flags |= (1 << 1) if self.start_param is not None else 0
+        flags |= (1 << 2) if self.extended_media is not None else 0
+        b.write(Int(flags))
+        
+        b.write(String(self.title))
+        
+        b.write(String(self.description))
+        
+        if self.photo is not None:
+            b.write(self.photo.write())
+        
+        b.write(self.invoice.write())
+        
+        b.write(Bytes(self.payload))
+        
+        b.write(String(self.provider))
+        
+        b.write(self.provider_data.write())
+        
+        if self.start_param is not None:
+            b.write(String(self.start_param))
+        
+        if self.extended_media is not None:
+            b.write(self.extended_media.write())
+        
+        return b.getvalue()
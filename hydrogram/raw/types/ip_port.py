@@ -0,0 +1,80 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class IpPort(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.IpPort`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``D433AD73``
+
+    Parameters:
+        ipv4 (``int`` ``32-bit``):
+            N/A
+
+        port (``int`` ``32-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["ipv4", "port"]
+
+    ID = 0xd433ad73
+    QUALNAME = "types.IpPort"
+
+    def __init__(self, *, ipv4: int, port: int) -> None:
+        self.ipv4 = ipv4  # int
+        self.port = port  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "IpPort":
+        # No flags
+        
+        ipv4 = Int.read(b)
+        
+        port = Int.read(b)
+        
+        return IpPort(ipv4=ipv4, port=port)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.ipv4))
+        
+        b.write(Int(self.port))
+        
+        return b.getvalue()
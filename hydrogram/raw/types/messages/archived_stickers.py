@@ -0,0 +1,89 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ArchivedStickers(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.messages.ArchivedStickers`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``4FCBA9C8``
+
+    Parameters:
+        count (``int`` ``32-bit``):
+            N/A
+
+        sets (List of :obj:`StickerSetCovered <hydrogram.raw.base.StickerSetCovered>`):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            messages.GetArchivedStickers
+    """
+
+    __slots__: List[str] = ["count", "sets"]
+
+    ID = 0x4fcba9c8
+    QUALNAME = "types.messages.ArchivedStickers"
+
+    def __init__(self, *, count: int, sets: List["raw.base.StickerSetCovered"]) -> None:
+        self.count = count  # int
+        self.sets = sets  # Vector<StickerSetCovered>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ArchivedStickers":
+        # No flags
+        
+        count = Int.read(b)
+        
+        sets = TLObject.read(b)
+        
+        return ArchivedStickers(count=count, sets=sets)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.count))
+        
+        b.write(Vector(self.sets))
+        
+        return b.getvalue()
@@ -0,0 +1,88 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class Chats(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.messages.Chats`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``64FF9FD5``
+
+    Parameters:
+        chats (List of :obj:`Chat <hydrogram.raw.base.Chat>`):
+            N/A
+
+    Functions:
+        This object can be returned by 8 functions.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            messages.GetChats
+            messages.GetCommonChats
+            channels.GetChannels
+            channels.GetAdminedPublicChannels
+            channels.GetLeftChannels
+            channels.GetGroupsForDiscussion
+            channels.GetChannelRecommendations
+            stories.GetChatsToSend
+    """
+
+    __slots__: List[str] = ["chats"]
+
+    ID = 0x64ff9fd5
+    QUALNAME = "types.messages.Chats"
+
+    def __init__(self, *, chats: List["raw.base.Chat"]) -> None:
+        self.chats = chats  # Vector<Chat>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "Chats":
+        # No flags
+        
+        chats = TLObject.read(b)
+        
+        return Chats(chats=chats)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Vector(self.chats))
+        
+        return b.getvalue()
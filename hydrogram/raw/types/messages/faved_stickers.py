@@ -0,0 +1,97 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class FavedStickers(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.messages.FavedStickers`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``2CB51097``
+
+    Parameters:
+        hash (``int`` ``64-bit``):
+            N/A
+
+        packs (List of :obj:`StickerPack <hydrogram.raw.base.StickerPack>`):
+            N/A
+
+        stickers (List of :obj:`Document <hydrogram.raw.base.Document>`):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            messages.GetFavedStickers
+    """
+
+    __slots__: List[str] = ["hash", "packs", "stickers"]
+
+    ID = 0x2cb51097
+    QUALNAME = "types.messages.FavedStickers"
+
+    def __init__(self, *, hash: int, packs: List["raw.base.StickerPack"], stickers: List["raw.base.Document"]) -> None:
+        self.hash = hash  # long
+        self.packs = packs  # Vector<StickerPack>
+        self.stickers = stickers  # Vector<Document>
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "FavedStickers":
+        # No flags
+        
+        hash = Long.read(b)
+        
+        packs = TLObject.read(b)
+        
+        stickers = TLObject.read(b)
+        
+        return FavedStickers(hash=hash, packs=packs, stickers=stickers)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.hash))
+        
+        b.write(Vector(self.packs))
+        
+        b.write(Vector(self.stickers))
+        
+        return b.getvalue()
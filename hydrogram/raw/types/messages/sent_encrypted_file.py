@@ -0,0 +1,91 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class SentEncryptedFile(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.messages.SentEncryptedMessage`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``9493FF32``
+
+    Parameters:
+        date (``int`` ``32-bit``):
+            N/A
+
+        file (:obj:`EncryptedFile <hydrogram.raw.base.EncryptedFile>`):
+            N/A
+
+    Functions:
+        This object can be returned by 3 functions.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            messages.SendEncrypted
+            messages.SendEncryptedFile
+            messages.SendEncryptedService
+    """
+
+    __slots__: List[str] = ["date", "file"]
+
+    ID = 0x9493ff32
+    QUALNAME = "types.messages.SentEncryptedFile"
+
+    def __init__(self, *, date: int, file: "raw.base.EncryptedFile") -> None:
+        self.date = date  # int
+        self.file = file  # EncryptedFile
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "SentEncryptedFile":
+        # No flags
+        
+        date = Int.read(b)
+        
+        file = TLObject.read(b)
+        
+        return SentEncryptedFile(date=date, file=file)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Int(self.date))
+        
+        b.write(self.file.write())
+        
+        return b.getvalue()
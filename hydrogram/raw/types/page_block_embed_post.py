@@ -0,0 +1,120 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class PageBlockEmbedPost(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.PageBlock`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``F259A80B``
+
+    Parameters:
+        url (``str``):
+            N/A
+
+        webpage_id (``int`` ``64-bit``):
+            N/A
+
+        author_photo_id (``int`` ``64-bit``):
+            N/A
+
+        author (``str``):
+            N/A
+
+        date (``int`` ``32-bit``):
+            N/A
+
+        blocks (List of :obj:`PageBlock <hydrogram.raw.base.PageBlock>`):
+            N/A
+
+        caption (:obj:`PageCaption <hydrogram.raw.base.PageCaption>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["url", "webpage_id", "author_photo_id", "author", "date", "blocks", "caption"]
+
+    ID = 0xf259a80b
+    QUALNAME = "types.PageBlockEmbedPost"
+
+    def __init__(self, *, url: str, webpage_id: int, author_photo_id: int, author: str, date: int, blocks: List["raw.base.PageBlock"], caption: "raw.base.PageCaption") -> None:
+        self.url = url  # string
+        self.webpage_id = webpage_id  # long
+        self.author_photo_id = author_photo_id  # long
+        self.author = author  # string
+        self.date = date  # int
+        self.blocks = blocks  # Vector<PageBlock>
+        self.caption = caption  # PageCaption
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "PageBlockEmbedPost":
+        # No flags
+        
+        url = String.read(b)
+        
+        webpage_id = Long.read(b)
+        
+        author_photo_id = Long.read(b)
+        
+        author = String.read(b)
+        
+        date = Int.read(b)
+        
+        blocks = TLObject.read(b)
+        
+        caption = TLObject.read(b)
+        
+        return PageBlockEmbedPost(url=url, webpage_id=webpage_id, author_photo_id=author_photo_id, author=author, date=date, blocks=blocks, caption=caption)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.url))
+        
+        b.write(Long(self.webpage_id))
+        
+        b.write(Long(self.author_photo_id))
+        
+        b.write(String(self.author))
+        
+        b.write(Int(self.date))
+        
+        b.write(Vector(self.blocks))
+        
+        b.write(self.caption.write())
+        
+        return b.getvalue()
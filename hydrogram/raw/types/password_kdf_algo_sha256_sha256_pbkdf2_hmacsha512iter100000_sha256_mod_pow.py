@@ -0,0 +1,96 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.PasswordKdfAlgo`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``3A912D4A``
+
+    Parameters:
+        salt1 (``bytes``):
+            N/A
+
+        salt2 (``bytes``):
+            N/A
+
+        g (``int`` ``32-bit``):
+            N/A
+
+        p (``bytes``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["salt1", "salt2", "g", "p"]
+
+    ID = 0x3a912d4a
+    QUALNAME = "types.PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow"
+
+    def __init__(self, *, salt1: bytes, salt2: bytes, g: int, p: bytes) -> None:
+        self.salt1 = salt1  # bytes
+        self.salt2 = salt2  # bytes
+        self.g = g  # int
+        self.p = p  # bytes
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow":
+        # No flags
+        
+        salt1 = Bytes.read(b)
+        
+        salt2 = Bytes.read(b)
+        
+        g = Int.read(b)
+        
+        p = Bytes.read(b)
+        
+        return PasswordKdfAlgoSHA256SHA256PBKDF2HMACSHA512iter100000SHA256ModPow(salt1=salt1, salt2=salt2, g=g, p=p)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Bytes(self.salt1))
+        
+        b.write(Bytes(self.salt2))
+        
+        b.write(Int(self.g))
+        
+        b.write(Bytes(self.p))
+        
+        return b.getvalue()
@@ -0,0 +1,80 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class PaymentCharge(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.PaymentCharge`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``EA02C27E``
+
+    Parameters:
+        id (``str``):
+            N/A
+
+        provider_charge_id (``str``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["id", "provider_charge_id"]
+
+    ID = 0xea02c27e
+    QUALNAME = "types.PaymentCharge"
+
+    def __init__(self, *, id: str, provider_charge_id: str) -> None:
+        self.id = id  # string
+        self.provider_charge_id = provider_charge_id  # string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "PaymentCharge":
+        # No flags
+        
+        id = String.read(b)
+        
+        provider_charge_id = String.read(b)
+        
+        return PaymentCharge(id=id, provider_charge_id=provider_charge_id)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.id))
+        
+        b.write(String(self.provider_charge_id))
+        
+        return b.getvalue()
@@ -0,0 +1,35 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+from .payment_form import PaymentForm
+from .validated_requested_info import ValidatedRequestedInfo
+from .payment_result import PaymentResult
+from .payment_verification_needed import PaymentVerificationNeeded
+from .payment_receipt import PaymentReceipt
+from .saved_info import SavedInfo
+from .bank_card_data import BankCardData
+from .exported_invoice import ExportedInvoice
+from .checked_gift_code import CheckedGiftCode
+from .giveaway_info import GiveawayInfo
+from .giveaway_info_results import GiveawayInfoResults
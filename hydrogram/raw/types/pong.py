@@ -0,0 +1,90 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class Pong(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.Pong`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``347773C5``
+
+    Parameters:
+        msg_id (``int`` ``64-bit``):
+            N/A
+
+        ping_id (``int`` ``64-bit``):
+            N/A
+
+    Functions:
+        This object can be returned by 2 functions.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            Ping
+            PingDelayDisconnect
+    """
+
+    __slots__: List[str] = ["msg_id", "ping_id"]
+
+    ID = 0x347773c5
+    QUALNAME = "types.Pong"
+
+    def __init__(self, *, msg_id: int, ping_id: int) -> None:
+        self.msg_id = msg_id  # long
+        self.ping_id = ping_id  # long
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "Pong":
+        # No flags
+        
+        msg_id = Long.read(b)
+        
+        ping_id = Long.read(b)
+        
+        return Pong(msg_id=msg_id, ping_id=ping_id)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.msg_id))
+        
+        b.write(Long(self.ping_id))
+        
+        return b.getvalue()
@@ -0,0 +1,80 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class RecentMeUrlStickerSet(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.RecentMeUrl`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``BC0A57DC``
+
+    Parameters:
+        url (``str``):
+            N/A
+
+        set (:obj:`StickerSetCovered <hydrogram.raw.base.StickerSetCovered>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["url", "set"]
+
+    ID = 0xbc0a57dc
+    QUALNAME = "types.RecentMeUrlStickerSet"
+
+    def __init__(self, *, url: str, set: "raw.base.StickerSetCovered") -> None:
+        self.url = url  # string
+        self.set = set  # StickerSetCovered
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "RecentMeUrlStickerSet":
+        # No flags
+        
+        url = String.read(b)
+        
+        set = TLObject.read(b)
+        
+        return RecentMeUrlStickerSet(url=url, set=set)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(String(self.url))
+        
+        b.write(self.set.write())
+        
+        return b.getvalue()
@@ -0,0 +1,87 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ReplyKeyboardForceReply(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.ReplyMarkup`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``86B40B08``
+
+    Parameters:
+        single_use (``bool``, *optional*):
+            N/A
+
+        selective (``bool``, *optional*):
+            N/A
+
+        placeholder (``str``, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["single_use", "selective", "placeholder"]
+
+    ID = 0x86b40b08
+    QUALNAME = "types.ReplyKeyboardForceReply"
+
+    def __init__(self, *, single_use: Optional[bool] = None, selective: Optional[bool] = None, placeholder: Optional[str] = None) -> None:
+        self.single_use = single_use  # flags.1?true
+        self.selective = selective  # flags.2?true
+        self.placeholder = placeholder  # flags.3?string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ReplyKeyboardForceReply":
+        
+        flags = Int.read(b)
+        
+        single_use = True if flags & (1 << 1) else False
+        selective = True if flags & (1 << 2) else False
+        placeholder = String.read(b) if flags & (1 << 3) else None
+        return ReplyKeyboardForceReply(single_use=single_use, selective=selective, placeholder=placeholder)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 1) if self.single_use else 0
+        flags |= (1 << 2) if self.selective else 0
+        flags |= (1 << 3) if self.placeholder is not None else 0
+        b.write(Int(flags))
+        
+        if self.placeholder is not None:
+            b.write(String(self.placeholder))
+        
+        return b.getvalue()
@@ -0,0 +1,96 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class StoryItemSkipped(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.StoryItem`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``FFADC913``
+
+    Parameters:
+        id (``int`` ``32-bit``):
+            N/A
+
+        date (``int`` ``32-bit``):
+            N/A
+
+        expire_date (``int`` ``32-bit``):
+            N/A
+
+        close_friends (``bool``, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["id", "date", "expire_date", "close_friends"]
+
+    ID = 0xffadc913
+    QUALNAME = "types.StoryItemSkipped"
+
+    def __init__(self, *, id: int, date: int, expire_date: int, close_friends: Optional[bool] = None) -> None:
+        self.id = id  # int
+        self.date = date  # int
+        self.expire_date = expire_date  # int
+        self.close_friends = close_friends  # flags.8?true
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "StoryItemSkipped":
+        
+        flags = Int.read(b)
+        
+        close_friends = True if flags & (1 << 8) else False
+        id = Int.read(b)
+        
+        date = Int.read(b)
+        
+        expire_date = Int.read(b)
+        
+        return StoryItemSkipped(id=id, date=date, expire_date=expire_date, close_friends=close_friends)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 8) if self.close_friends else 0
+        b.write(Int(flags))
+        
+        b.write(Int(self.id))
+        
+        b.write(Int(self.date))
+        
+        b.write(Int(self.expire_date))
+        
+        return b.getvalue()
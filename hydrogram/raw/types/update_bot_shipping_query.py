@@ -0,0 +1,96 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UpdateBotShippingQuery(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.Update`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``B5AEFD7D``
+
+    Parameters:
+        query_id (``int`` ``64-bit``):
+            N/A
+
+        user_id (``int`` ``64-bit``):
+            N/A
+
+        payload (``bytes``):
+            N/A
+
+        shipping_address (:obj:`PostAddress <hydrogram.raw.base.PostAddress>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["query_id", "user_id", "payload", "shipping_address"]
+
+    ID = 0xb5aefd7d
+    QUALNAME = "types.UpdateBotShippingQuery"
+
+    def __init__(self, *, query_id: int, user_id: int, payload: bytes, shipping_address: "raw.base.PostAddress") -> None:
+        self.query_id = query_id  # long
+        self.user_id = user_id  # long
+        self.payload = payload  # bytes
+        self.shipping_address = shipping_address  # PostAddress
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UpdateBotShippingQuery":
+        # No flags
+        
+        query_id = Long.read(b)
+        
+        user_id = Long.read(b)
+        
+        payload = Bytes.read(b)
+        
+        shipping_address = TLObject.read(b)
+        
+        return UpdateBotShippingQuery(query_id=query_id, user_id=user_id, payload=payload, shipping_address=shipping_address)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.query_id))
+        
+        b.write(Long(self.user_id))
+        
+        b.write(Bytes(self.payload))
+        
+        b.write(self.shipping_address.write())
+        
+        return b.getvalue()
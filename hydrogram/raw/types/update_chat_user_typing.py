@@ -0,0 +1,88 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UpdateChatUserTyping(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.Update`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``83487AF0``
+
+    Parameters:
+        chat_id (``int`` ``64-bit``):
+            N/A
+
+        from_id (:obj:`Peer <hydrogram.raw.base.Peer>`):
+            N/A
+
+        action (:obj:`SendMessageAction <hydrogram.raw.base.SendMessageAction>`):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["chat_id", "from_id", "action"]
+
+    ID = 0x83487af0
+    QUALNAME = "types.UpdateChatUserTyping"
+
+    def __init__(self, *, chat_id: int, from_id: "raw.base.Peer", action: "raw.base.SendMessageAction") -> None:
+        self.chat_id = chat_id  # long
+        self.from_id = from_id  # Peer
+        self.action = action  # SendMessageAction
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UpdateChatUserTyping":
+        # No flags
+        
+        chat_id = Long.read(b)
+        
+        from_id = TLObject.read(b)
+        
+        action = TLObject.read(b)
+        
+        return UpdateChatUserTyping(chat_id=chat_id, from_id=from_id, action=action)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.chat_id))
+        
+        b.write(self.from_id.write())
+        
+        b.write(self.action.write())
+        
+        return b.getvalue()
@@ -0,0 +1,96 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UpdateMessagePollVote(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.Update`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``24F40E77``
+
+    Parameters:
+        poll_id (``int`` ``64-bit``):
+            N/A
+
+        peer (:obj:`Peer <hydrogram.raw.base.Peer>`):
+            N/A
+
+        options (List of ``bytes``):
+            N/A
+
+        qts (``int`` ``32-bit``):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["poll_id", "peer", "options", "qts"]
+
+    ID = 0x24f40e77
+    QUALNAME = "types.UpdateMessagePollVote"
+
+    def __init__(self, *, poll_id: int, peer: "raw.base.Peer", options: List[bytes], qts: int) -> None:
+        self.poll_id = poll_id  # long
+        self.peer = peer  # Peer
+        self.options = options  # Vector<bytes>
+        self.qts = qts  # int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UpdateMessagePollVote":
+        # No flags
+        
+        poll_id = Long.read(b)
+        
+        peer = TLObject.read(b)
+        
+        options = TLObject.read(b, Bytes)
+        
+        qts = Int.read(b)
+        
+        return UpdateMessagePollVote(poll_id=poll_id, peer=peer, options=options, qts=qts)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        # No flags
+        
+        b.write(Long(self.poll_id))
+        
+        b.write(self.peer.write())
+        
+        b.write(Vector(self.options, Bytes))
+        
+        b.write(Int(self.qts))
+        
+        return b.getvalue()
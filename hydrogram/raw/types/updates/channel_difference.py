@@ -0,0 +1,130 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class ChannelDifference(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.updates.ChannelDifference`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``2064674E``
+
+    Parameters:
+        pts (``int`` ``32-bit``):
+            N/A
+
+        new_messages (List of :obj:`Message <hydrogram.raw.base.Message>`):
+            N/A
+
+        other_updates (List of :obj:`Update <hydrogram.raw.base.Update>`):
+            N/A
+
+        chats (List of :obj:`Chat <hydrogram.raw.base.Chat>`):
+            N/A
+
+        users (List of :obj:`User <hydrogram.raw.base.User>`):
+            N/A
+
+        final (``bool``, *optional*):
+            N/A
+
+        timeout (``int`` ``32-bit``, *optional*):
+            N/A
+
+    Functions:
+        This object can be returned by 1 function.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            updates.GetChannelDifference
+    """
+
+    __slots__: List[str] = ["pts", "new_messages", "other_updates", "chats", "users", "final", "timeout"]
+
+    ID = 0x2064674e
+    QUALNAME = "types.updates.ChannelDifference"
+
+    def __init__(self, *, pts: int, new_messages: List["raw.base.Message"], other_updates: List["raw.base.Update"], chats: List["raw.base.Chat"], users: List["raw.base.User"], final: Optional[bool] = None, timeout: Optional[int] = None) -> None:
+        self.pts = pts  # int
+        self.new_messages = new_messages  # Vector<Message>
+        self.other_updates = other_updates  # Vector<Update>
+        self.chats = chats  # Vector<Chat>
+        self.users = users  # Vector<User>
+        self.final = final  # flags.0?true
+        self.timeout = timeout  # flags.1?int
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "ChannelDifference":
+        
+        flags = Int.read(b)
+        
+        final = True if flags & (1 << 0) else False
+        pts = Int.read(b)
+        
+        timeout = Int.read(b) if flags & (1 << 1) else None
+        new_messages = TLObject.read(b)
+        
+        other_updates = TLObject.read(b)
+        
+        chats = TLObject.read(b)
+        
+        users = TLObject.read(b)
+        
+        return ChannelDifference(pts=pts, new_messages=new_messages, other_updates=other_updates, chats=chats, users=users, final=final, timeout=timeout)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.final else 0
+        flags |= (1 << 1) if self.timeout is not None else 0
+        b.write(Int(flags))
+        
+        b.write(Int(self.pts))
+        
+        if self.timeout is not None:
+            b.write(Int(self.timeout))
+        
+        b.write(Vector(self.new_messages))
+        
+        b.write(Vector(self.other_updates))
+        
+        b.write(Vector(self.chats))
+        
+        b.write(Vector(self.users))
+        
+        return b.getvalue()
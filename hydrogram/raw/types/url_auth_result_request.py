@@ -0,0 +1,98 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class UrlAuthResultRequest(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.UrlAuthResult`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``92D33A0E``
+
+    Parameters:
+        bot (:obj:`User <hydrogram.raw.base.User>`):
+            N/A
+
+        domain (``str``):
+            N/A
+
+        request_write_access (``bool``, *optional*):
+            N/A
+
+    Functions:
+        This object can be returned by 2 functions.
+
+        .. currentmodule:: hydrogram.raw.functions
+
+        .. autosummary::
+            :nosignatures:
+
+            messages.RequestUrlAuth
+            messages.AcceptUrlAuth
+    """
+
+    __slots__: List[str] = ["bot", "domain", "request_write_access"]
+
+    ID = 0x92d33a0e
+    QUALNAME = "types.UrlAuthResultRequest"
+
+    def __init__(self, *, bot: "raw.base.User", domain: str, request_write_access: Optional[bool] = None) -> None:
+        self.bot = bot  # User
+        self.domain = domain  # string
+        self.request_write_access = request_write_access  # flags.0?true
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "UrlAuthResultRequest":
+        
+        flags = Int.read(b)
+        
+        request_write_access = True if flags & (1 << 0) else False
+        bot = TLObject.read(b)
+        
+        domain = String.read(b)
+        
+        return UrlAuthResultRequest(bot=bot, domain=domain, request_write_access=request_write_access)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.request_write_access else 0
+        b.write(Int(flags))
+        
+        b.write(self.bot.write())
+        
+        b.write(String(self.domain))
+        
+        return b.getvalue()
@@ -0,0 +1,83 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+from io import BytesIO
+
+from hydrogram.raw.core.primitives import Int, Long, Int128, Int256, Bool, Bytes, String, Double, Vector
+from hydrogram.raw.core import TLObject
+from hydrogram import raw
+from typing import List, Optional, Any
+
+# # # # # # # # # # # # # # # # # # # # # # # #
+#               !!! WARNING !!!               #
+#          This is a generated file!          #
+# All changes made in this file will be lost! #
+# # # # # # # # # # # # # # # # # # # # # # # #
+
+
+class WebPageEmpty(TLObject):  # type: ignore
+    """Telegram API type.
+
+    Constructor of :obj:`~hydrogram.raw.base.WebPage`.
+
+    Details:
+        - Layer: ``170``
+        - ID: ``211A1788``
+
+    Parameters:
+        id (``int`` ``64-bit``):
+            N/A
+
+        url (``str``, *optional*):
+            N/A
+
+    """
+
+    __slots__: List[str] = ["id", "url"]
+
+    ID = 0x211a1788
+    QUALNAME = "types.WebPageEmpty"
+
+    def __init__(self, *, id: int, url: Optional[str] = None) -> None:
+        self.id = id  # long
+        self.url = url  # flags.0?string
+
+    @staticmethod
+    def read(b: BytesIO, *args: Any) -> "WebPageEmpty":
+        
+        flags = Int.read(b)
+        
+        id = Long.read(b)
+        
+        url = String.read(b) if flags & (1 << 0) else None
+        return WebPageEmpty(id=id, url=url)
+
+    def write(self, *args) -> bytes:
+        b = BytesIO()
+        b.write(Int(self.ID, False))
+
+        flags = 0
+        flags |= (1 << 0) if self.url is not None else 0
+        b.write(Int(flags))
+        
+        b.write(Long(self.id))
+        
+        if self.url is not None:
+            b.write(String(self.url))
+        
+        return b.getvalue()
@@ -17,6 +17,10 @@
 #  You should have received a copy of the GNU Lesser General Public License
 #  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
 
+from datetime import datetime
+from enum import Enum
+from json import dumps
+
 from .object import Object
 
 
@@ -28,3 +32,48 @@ class List(list):
 
     def __repr__(self):
         return f"hydrogram.types.List([{','.join(Object.__repr__(i) for i in self)}])"
+
+    def to_json(self) -> bytes:
+        """Serialize this list to JSON bytes.
+
+        Uses `msgspec <https://jcristharif.com/msgspec/>`_ when installed,
+        which encodes in C instead of recursing through Python code, and falls
+        back to the standard :mod:`json` module otherwise. Both paths produce
+        the same JSON.
+        """
+        try:
+            import msgspec
+        except ImportError:
+            return dumps(self, default=Object.default, ensure_ascii=False).encode()
+
+        return msgspec.json.encode(self, enc_hook=_msgspec_enc_hook)
+
+
+def _normalize(value):
+    # msgspec encodes enums by value, datetimes as RFC 3339 and bytes as
+    # base64 on its own, without consulting the enc_hook — and Hydrogram
+    # enums may hold raw type classes as values, which would serialize as
+    # garbage. Convert all three the way Object.default does, so the output
+    # matches the stdlib fallback.
+    if isinstance(value, (Enum, datetime)):
+        return str(value)
+
+    if isinstance(value, bytes):
+        return repr(value)
+
+    if isinstance(value, list):
+        return [_normalize(i) for i in value]
+
+    if isinstance(value, dict):
+        return {k: _normalize(v) for k, v in value.items()}
+
+    return value
+
+
+def _msgspec_enc_hook(obj):
+    converted = Object.default(obj)
+
+    if isinstance(converted, dict):
+        return {attr: _normalize(value) for attr, value in converted.items()}
+
+    return converted
@@ -101,7 +101,7 @@ class MessageEntity(Object):
         args = self.__dict__.copy()
 
         for arg in ("_client", "type", "user"):
-            args.pop(arg)
+            args.pop(arg, None)
 
         if self.user:
             args["user_id"] = await self._client.resolve_peer(self.user.id)
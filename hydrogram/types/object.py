@@ -26,9 +26,29 @@ import hydrogram
 
 
 class Object:
+    __slots__ = ("_client",)
+
     def __init__(self, client: "hydrogram.Client" = None):
         self._client = client
 
+    @staticmethod
+    def _members(obj: "Object") -> dict:
+        """Get a name -> value mapping of an object's instance attributes.
+
+        Works with both ``__dict__``-based and ``__slots__``-based subclasses.
+        """
+        d = getattr(obj, "__dict__", None)
+
+        if d is not None:
+            return d
+
+        return {
+            attr: getattr(obj, attr)
+            for cls in type(obj).__mro__
+            for attr in getattr(cls, "__slots__", ())
+            if hasattr(obj, attr)
+        }
+
     def bind(self, client: "hydrogram.Client"):
         """Bind a Client instance to this and to all nested Hydrogram objects.
 
@@ -39,7 +59,7 @@ class Object:
         """
         self._client = client
 
-        for i in self.__dict__:
+        for i in Object._members(self):
             o = getattr(self, i)
 
             if isinstance(o, Object):
@@ -65,7 +85,7 @@ class Object:
             "_": obj.__class__.__name__,
             **{
                 attr: ("*" * 9 if attr == "phone_number" else getattr(obj, attr))
-                for attr in filter(lambda x: not x.startswith("_"), obj.__dict__)
+                for attr in filter(lambda x: not x.startswith("_"), Object._members(obj))
                 if getattr(obj, attr) is not None
             },
         }
@@ -78,13 +98,13 @@ class Object:
             self.__class__.__name__,
             ", ".join(
                 f"{attr}={getattr(self, attr)!r}"
-                for attr in filter(lambda x: not x.startswith("_"), self.__dict__)
+                for attr in filter(lambda x: not x.startswith("_"), Object._members(self))
                 if getattr(self, attr) is not None
             ),
         )
 
     def __eq__(self, other: "Object") -> bool:
-        for attr in self.__dict__:
+        for attr in Object._members(self):
             try:
                 if attr.startswith("_"):
                     continue
@@ -97,17 +117,19 @@ class Object:
         return True
 
     def __setstate__(self, state):
+        self._client = None
+
         for attr in state:
             obj = state[attr]
 
             # Maybe a better alternative would be https://docs.python.org/3/library/inspect.html#inspect.signature
             if isinstance(obj, tuple) and len(obj) == 2 and obj[0] == "dt":
-                state[attr] = datetime.fromtimestamp(obj[1])
+                obj = datetime.fromtimestamp(obj[1])
 
-        self.__dict__ = state
+            setattr(self, attr, obj)
 
     def __getstate__(self):
-        state = self.__dict__.copy()
+        state = dict(Object._members(self))
         state.pop("_client", None)
 
         for attr in state:
@@ -24,6 +24,11 @@ import hydrogram
 from hydrogram import enums, raw, types, utils
 from hydrogram.types.object import Object
 
+# Hot helpers bound once at import time; the per-member parsers below run in
+# tight loops where the repeated attribute chains add up.
+_timestamp_to_datetime = utils.timestamp_to_datetime
+_PeerUser = raw.types.PeerUser
+
 
 class ChatMember(Object):
     """Contains information about one member of a chat.
@@ -73,6 +78,22 @@ class ChatMember(Object):
             Administrators only. Privileged actions that an administrator is able to take.
     """
 
+    __slots__ = (
+        "can_be_edited",
+        "chat",
+        "custom_title",
+        "invited_by",
+        "is_member",
+        "joined_date",
+        "permissions",
+        "privileges",
+        "promoted_by",
+        "restricted_by",
+        "status",
+        "until_date",
+        "user",
+    )
+
     def __init__(
         self,
         *,
@@ -111,121 +132,165 @@ class ChatMember(Object):
     def _parse(
         client: "hydrogram.Client",
         member: Union["raw.base.ChatParticipant", "raw.base.ChannelParticipant"],
-        users: dict[int, "raw.base.User"],
+        users: dict[int, Union["raw.base.User", "types.User"]],
         chats: dict[int, "raw.base.Chat"],
-    ) -> "ChatMember":
-        # Chat participants
-        if isinstance(member, raw.types.ChatParticipant):
-            return ChatMember(
-                status=enums.ChatMemberStatus.MEMBER,
-                user=types.User._parse(client, users[member.user_id]),
-                joined_date=utils.timestamp_to_datetime(member.date),
-                invited_by=types.User._parse(client, users[member.inviter_id]),
-                client=client,
-            )
-        if isinstance(member, raw.types.ChatParticipantAdmin):
-            return ChatMember(
-                status=enums.ChatMemberStatus.ADMINISTRATOR,
-                user=types.User._parse(client, users[member.user_id]),
-                joined_date=utils.timestamp_to_datetime(member.date),
-                invited_by=types.User._parse(client, users[member.inviter_id]),
-                client=client,
-            )
-        if isinstance(member, raw.types.ChatParticipantCreator):
-            return ChatMember(
-                status=enums.ChatMemberStatus.OWNER,
-                user=types.User._parse(client, users[member.user_id]),
-                client=client,
-            )
-
-        # Channel participants
-        if isinstance(member, raw.types.ChannelParticipant):
-            return ChatMember(
-                status=enums.ChatMemberStatus.MEMBER,
-                user=types.User._parse(client, users[member.user_id]),
-                joined_date=utils.timestamp_to_datetime(member.date),
-                client=client,
-            )
-        if isinstance(member, raw.types.ChannelParticipantAdmin):
-            return ChatMember(
-                status=enums.ChatMemberStatus.ADMINISTRATOR,
-                user=types.User._parse(client, users[member.user_id]),
-                joined_date=utils.timestamp_to_datetime(member.date),
-                promoted_by=types.User._parse(client, users[member.promoted_by]),
-                invited_by=(
-                    types.User._parse(client, users[member.inviter_id])
-                    if member.inviter_id
-                    else None
-                ),
-                custom_title=member.rank,
-                can_be_edited=member.can_edit,
-                privileges=types.ChatPrivileges._parse(member.admin_rights),
-                client=client,
-            )
-        if isinstance(member, raw.types.ChannelParticipantBanned):
-            peer = member.peer
-            peer_id = utils.get_raw_peer_id(peer)
-
-            user = (
-                types.User._parse(client, users[peer_id])
-                if isinstance(peer, raw.types.PeerUser)
-                else None
-            )
-
-            chat = (
-                None
-                if isinstance(peer, raw.types.PeerUser)
-                else types.Chat._parse_chat(client, chats[peer_id])
-            )
-
-            return ChatMember(
-                status=(
-                    enums.ChatMemberStatus.BANNED
-                    if member.banned_rights.view_messages
-                    else enums.ChatMemberStatus.RESTRICTED
-                ),
-                user=user,
-                chat=chat,
-                until_date=utils.timestamp_to_datetime(member.banned_rights.until_date),
-                joined_date=utils.timestamp_to_datetime(member.date),
-                is_member=not member.left,
-                restricted_by=types.User._parse(client, users[member.kicked_by]),
-                permissions=types.ChatPermissions._parse(member.banned_rights),
-                client=client,
-            )
-        if isinstance(member, raw.types.ChannelParticipantCreator):
-            return ChatMember(
-                status=enums.ChatMemberStatus.OWNER,
-                user=types.User._parse(client, users[member.user_id]),
-                custom_title=member.rank,
-                privileges=types.ChatPrivileges._parse(member.admin_rights),
-                client=client,
-            )
-        if isinstance(member, raw.types.ChannelParticipantLeft):
-            peer = member.peer
-            peer_id = utils.get_raw_peer_id(peer)
-
-            user = (
-                types.User._parse(client, users[peer_id])
-                if isinstance(peer, raw.types.PeerUser)
+        user_cache: Optional[dict[int, "types.User"]] = None,
+    ) -> Optional["ChatMember"]:
+        parser = _get_parser(type(member))
+
+        if parser is None:
+            return None
+
+        if user_cache is None:
+            user_cache = {}
+
+        return parser(client, member, users, chats, user_cache)
+
+    @staticmethod
+    def _parse_user(client, users, user_id, user_cache) -> "types.User":
+        # Members of the same chat often reference the same users (e.g. the
+        # inviter); parse each referenced user only once per top-level call.
+        user = user_cache.get(user_id)
+
+        if user is None:
+            user = users[user_id]
+
+            # Callers may pass users already parsed at the response boundary
+            # (see get_chat_members); don't re-parse those.
+            if type(user) is not types.User:
+                user = types.User._parse(client, user)
+
+            user_cache[user_id] = user
+
+        return user
+
+    @staticmethod
+    def _parse_chat_member(client, member, users, chats, user_cache) -> "ChatMember":
+        return ChatMember(
+            status=enums.ChatMemberStatus.MEMBER,
+            user=ChatMember._parse_user(client, users, member.user_id, user_cache),
+            joined_date=_timestamp_to_datetime(member.date),
+            invited_by=ChatMember._parse_user(client, users, member.inviter_id, user_cache),
+            client=client,
+        )
+
+    @staticmethod
+    def _parse_chat_admin(client, member, users, chats, user_cache) -> "ChatMember":
+        return ChatMember(
+            status=enums.ChatMemberStatus.ADMINISTRATOR,
+            user=ChatMember._parse_user(client, users, member.user_id, user_cache),
+            joined_date=_timestamp_to_datetime(member.date),
+            invited_by=ChatMember._parse_user(client, users, member.inviter_id, user_cache),
+            client=client,
+        )
+
+    @staticmethod
+    def _parse_chat_creator(client, member, users, chats, user_cache) -> "ChatMember":
+        return ChatMember(
+            status=enums.ChatMemberStatus.OWNER,
+            user=ChatMember._parse_user(client, users, member.user_id, user_cache),
+            client=client,
+        )
+
+    @staticmethod
+    def _parse_channel_member(client, member, users, chats, user_cache) -> "ChatMember":
+        return ChatMember(
+            status=enums.ChatMemberStatus.MEMBER,
+            user=ChatMember._parse_user(client, users, member.user_id, user_cache),
+            joined_date=_timestamp_to_datetime(member.date),
+            client=client,
+        )
+
+    @staticmethod
+    def _parse_channel_admin(client, member, users, chats, user_cache) -> "ChatMember":
+        return ChatMember(
+            status=enums.ChatMemberStatus.ADMINISTRATOR,
+            user=ChatMember._parse_user(client, users, member.user_id, user_cache),
+            joined_date=_timestamp_to_datetime(member.date),
+            promoted_by=ChatMember._parse_user(client, users, member.promoted_by, user_cache),
+            invited_by=(
+                ChatMember._parse_user(client, users, member.inviter_id, user_cache)
+                if member.inviter_id
                 else None
-            )
-
-            chat = (
-                None
-                if isinstance(peer, raw.types.PeerUser)
-                else types.Chat._parse_chat(client, chats[peer_id])
-            )
-
-            return ChatMember(
-                status=enums.ChatMemberStatus.LEFT, user=user, chat=chat, client=client
-            )
-        if isinstance(member, raw.types.ChannelParticipantSelf):
-            return ChatMember(
-                status=enums.ChatMemberStatus.MEMBER,
-                user=types.User._parse(client, users[member.user_id]),
-                joined_date=utils.timestamp_to_datetime(member.date),
-                invited_by=types.User._parse(client, users[member.inviter_id]),
-                client=client,
-            )
-        return None
+            ),
+            custom_title=member.rank,
+            can_be_edited=member.can_edit,
+            privileges=types.ChatPrivileges._parse(member.admin_rights),
+            client=client,
+        )
+
+    @staticmethod
+    def _parse_channel_banned(client, member, users, chats, user_cache) -> "ChatMember":
+        peer = member.peer
+        peer_id = utils.get_raw_peer_id(peer)
+        is_user = type(peer) is _PeerUser
+        banned_rights = member.banned_rights
+
+        user = ChatMember._parse_user(client, users, peer_id, user_cache) if is_user else None
+        chat = None if is_user else types.Chat._parse_chat(client, chats[peer_id])
+
+        return ChatMember(
+            status=(
+                enums.ChatMemberStatus.BANNED
+                if banned_rights.view_messages
+                else enums.ChatMemberStatus.RESTRICTED
+            ),
+            user=user,
+            chat=chat,
+            until_date=_timestamp_to_datetime(banned_rights.until_date),
+            joined_date=_timestamp_to_datetime(member.date),
+            is_member=not member.left,
+            restricted_by=ChatMember._parse_user(client, users, member.kicked_by, user_cache),
+            permissions=types.ChatPermissions._parse(banned_rights),
+            client=client,
+        )
+
+    @staticmethod
+    def _parse_channel_creator(client, member, users, chats, user_cache) -> "ChatMember":
+        return ChatMember(
+            status=enums.ChatMemberStatus.OWNER,
+            user=ChatMember._parse_user(client, users, member.user_id, user_cache),
+            custom_title=member.rank,
+            privileges=types.ChatPrivileges._parse(member.admin_rights),
+            client=client,
+        )
+
+    @staticmethod
+    def _parse_channel_left(client, member, users, chats, user_cache) -> "ChatMember":
+        peer = member.peer
+        peer_id = utils.get_raw_peer_id(peer)
+        is_user = type(peer) is _PeerUser
+
+        user = ChatMember._parse_user(client, users, peer_id, user_cache) if is_user else None
+        chat = None if is_user else types.Chat._parse_chat(client, chats[peer_id])
+
+        return ChatMember(status=enums.ChatMemberStatus.LEFT, user=user, chat=chat, client=client)
+
+    @staticmethod
+    def _parse_channel_self(client, member, users, chats, user_cache) -> "ChatMember":
+        return ChatMember(
+            status=enums.ChatMemberStatus.MEMBER,
+            user=ChatMember._parse_user(client, users, member.user_id, user_cache),
+            joined_date=_timestamp_to_datetime(member.date),
+            invited_by=ChatMember._parse_user(client, users, member.inviter_id, user_cache),
+            client=client,
+        )
+
+
+# O(1) dispatch on the exact raw participant type, instead of walking an
+# isinstance chain for every member.
+_PARSERS = {
+    raw.types.ChatParticipant: ChatMember._parse_chat_member,
+    raw.types.ChatParticipantAdmin: ChatMember._parse_chat_admin,
+    raw.types.ChatParticipantCreator: ChatMember._parse_chat_creator,
+    raw.types.ChannelParticipant: ChatMember._parse_channel_member,
+    raw.types.ChannelParticipantAdmin: ChatMember._parse_channel_admin,
+    raw.types.ChannelParticipantBanned: ChatMember._parse_channel_banned,
+    raw.types.ChannelParticipantCreator: ChatMember._parse_channel_creator,
+    raw.types.ChannelParticipantLeft: ChatMember._parse_channel_left,
+    raw.types.ChannelParticipantSelf: ChatMember._parse_channel_self,
+}
+
+# Pre-bound lookup for the hot path: skips the _PARSERS LOAD_ATTR on every
+# dispatched member.
+_get_parser = _PARSERS.get
@@ -0,0 +1,68 @@
+#  Hydrogram - Telegram MTProto API Client Library for Python
+#  Copyright (C) 2017-2023 Dan <https://github.com/delivrance>
+#  Copyright (C) 2023-present Hydrogram <https://hydrogram.org>
+#
+#  This file is part of Hydrogram.
+#
+#  Hydrogram is free software: you can redistribute it and/or modify
+#  it under the terms of the GNU Lesser General Public License as published
+#  by the Free Software Foundation, either version 3 of the License, or
+#  (at your option) any later version.
+#
+#  Hydrogram is distributed in the hope that it will be useful,
+#  but WITHOUT ANY WARRANTY; without even the implied warranty of
+#  MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+#  GNU Lesser General Public License for more details.
+#
+#  You should have received a copy of the GNU Lesser General Public License
+#  along with Hydrogram.  If not, see <http://www.gnu.org/licenses/>.
+
+import json
+import sys
+from datetime import datetime
+
+import pytest
+
+from hydrogram import enums, types
+
+CALLBACK_DATA = b"\x80\x81data"
+
+
+def make_list() -> types.List:
+    # Covers the values the two encoders could disagree on: enums (including
+    # raw-type-valued ones), datetimes and non-UTF-8 bytes (callback_data).
+    entity = types.MessageEntity(type=enums.MessageEntityType.BOLD, offset=0, length=4)
+    button = types.InlineKeyboardButton(text="x", callback_data=CALLBACK_DATA)
+    markup = types.InlineKeyboardMarkup([[button]])
+    message = types.Message(
+        id=1,
+        date=datetime(2020, 1, 2, 3, 4, 5),
+        text="test",
+        entities=types.List([entity]),
+        reply_markup=markup,
+    )
+
+    return types.List([message])
+
+
+def test_to_json_stdlib_fallback(monkeypatch):
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+
+    message = json.loads(make_list().to_json())[0]
+
+    assert message["_"] == "Message"
+    assert message["date"] == "2020-01-02 03:04:05"
+    assert message["entities"][0]["type"] == "MessageEntityType.BOLD"
+    assert message["reply_markup"]["inline_keyboard"][0][0]["callback_data"] == repr(CALLBACK_DATA)
+
+
+def test_to_json_msgspec_parity(monkeypatch):
+    pytest.importorskip("msgspec")
+
+    lst = make_list()
+    with_msgspec = json.loads(lst.to_json())
+
+    monkeypatch.setitem(sys.modules, "msgspec", None)
+    fallback = json.loads(lst.to_json())
+
+    assert with_msgspec == fallback